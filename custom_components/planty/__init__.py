@@ -1,25 +1,52 @@
 """The Planty integration."""
 from __future__ import annotations
 
-import json
 import logging
 import os
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import config_validation as cv
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import (
+    HomeAssistantError,
+    ServiceValidationError,
+    Unauthorized,
+    UnknownUser,
+)
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
+    ATTR_CONFIG_ENTRY_ID,
+    DATA_SHARED,
+    CATALOG_EXTENSION_DIR,
+    TRANSFER_DIR,
+    CONF_COMPACT_ENTITIES,
     CONF_PLANTS,
+    CONF_STORAGE_BACKEND,
+    COMPACT_ENTITY_SUFFIXES,
+    DEFAULT_COMPACT_ENTITIES,
+    DEFAULT_STORAGE_BACKEND,
+    STORAGE_BACKEND_JOURNAL,
     SERVICE_WATER_PLANT,
     SERVICE_ADD_PLANT,
     SERVICE_REMOVE_PLANT,
@@ -28,25 +55,83 @@ from .const import (
     SERVICE_REMOVE_PLANT_FROM_DASHBOARD,
     SERVICE_WATER_PLANT_CUSTOM_DATE,
     SERVICE_UPDATE_PLANT_SETTINGS,
+    SERVICE_SEARCH_SPECIES,
+    SERVICE_RELOAD_CATALOG,
+    SERVICE_IMPORT_PLANTS,
+    SERVICE_EXPORT_PLANTS,
+    SERVICE_GET_PLANTS,
+    SERVICE_START_WATERING_RUN,
+    SERVICE_STOP_WATERING_RUN,
+    PLANT_STATUS_HEALTHY,
+    PLANT_STATUS_NEEDS_WATER,
+    PLANT_STATUS_OVERDUE,
+    PLANT_STATUS_UNKNOWN,
 )
+from .catalog import PlantCatalog, async_setup_catalog, catalog_sources
+from .clock import get_clock
+from .search import SEARCH_DEFAULT_LIMIT, build_search_index
+from .views import PlantyImageView
+from .websocket_api import async_setup_websocket_api
 from .image import async_setup_image_handler
+from .irrigation import async_setup_irrigation
+from .detector import async_setup_detector
+from .digest import async_setup_digest
+from .engine import PlantyEngine
+from .entries import entry_storage_prefix
+from .fusion import FUSION_STRATEGIES
+from .history import HistoryCache
+from .journal import PlantyJournalStorage
+from .query import PLANT_FIELDS, query_plants
+from .rollup import GROUP_AREA, async_setup_rollup
+from .schedule import async_setup_schedule
+from .statistics import async_setup_statistics
+from .transfer import (
+    CONFLICT_RENAME,
+    CONFLICT_REPLACE,
+    CONFLICT_SKIP,
+    file_format,
+    plan_import,
+    plant_slug,
+    read_rows,
+    write_plants,
+)
 from .dashboard_manager import async_setup_dashboard
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BUTTON]
+PLATFORMS: list[Platform] = [
+    Platform.SENSOR,
+    Platform.BUTTON,
+    Platform.CALENDAR,
+    Platform.TODO,
+]
 
 # Service schemas
 WATER_PLANT_SCHEMA = vol.Schema({
-    vol.Required("plant_id"): cv.string,
+    vol.Required("plant_id"): vol.All(cv.ensure_list, [cv.string]),
 })
 
-ADD_PLANT_SCHEMA = vol.Schema({
+# One humidity sensor, or several probes as a list or comma separated
+HUMIDITY_SENSORS = vol.Any(cv.entity_id, cv.entity_ids)
+HUMIDITY_WEIGHTS = {cv.entity_id: vol.All(vol.Coerce(float), vol.Range(min=0))}
+VALVE_DURATION = vol.All(vol.Coerce(float), vol.Range(min=0.1))
+VALVE_FLOW = vol.All(vol.Coerce(float), vol.Range(min=0.1))
+
+PLANT_SCHEMA = vol.Schema({
     vol.Required("plant_name"): cv.string,
     vol.Optional("plant_type"): cv.string,
     vol.Optional("watering_mode", default="manual"): vol.In(["sensor", "manual"]),
-    vol.Optional("humidity_sensor"): cv.entity_id,
+    vol.Optional("humidity_sensor"): HUMIDITY_SENSORS,
+    vol.Optional("humidity_fusion"): vol.In(FUSION_STRATEGIES),
+    vol.Optional("humidity_weights"): HUMIDITY_WEIGHTS,
     vol.Optional("watering_interval", default=7): cv.positive_int,
+    vol.Optional("valve"): cv.entity_id,
+    vol.Optional("valve_duration"): VALVE_DURATION,
+    vol.Optional("valve_flow"): VALVE_FLOW,
+})
+
+ADD_PLANT_SCHEMA = PLANT_SCHEMA.extend({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
 })
 
 UPDATE_IMAGE_SCHEMA = vol.Schema({
@@ -55,7 +140,7 @@ UPDATE_IMAGE_SCHEMA = vol.Schema({
 })
 
 WATER_PLANT_CUSTOM_DATE_SCHEMA = vol.Schema({
-    vol.Required("plant_id"): cv.string,
+    vol.Required("plant_id"): vol.All(cv.ensure_list, [cv.string]),
     vol.Required("watered_date"): cv.string,
 })
 
@@ -64,18 +149,88 @@ UPDATE_PLANT_SETTINGS_SCHEMA = vol.Schema({
     vol.Optional("name"): cv.string,
     vol.Optional("plant_type"): cv.string,
     vol.Optional("watering_mode"): vol.In(["sensor", "manual"]),
-    vol.Optional("humidity_sensor"): cv.entity_id,
+    vol.Optional("humidity_sensor"): HUMIDITY_SENSORS,
+    vol.Optional("humidity_fusion"): vol.In(FUSION_STRATEGIES),
+    vol.Optional("humidity_weights"): HUMIDITY_WEIGHTS,
     vol.Optional("watering_interval"): cv.positive_int,
+    vol.Optional("valve"): cv.entity_id,
+    vol.Optional("valve_duration"): VALVE_DURATION,
+    vol.Optional("valve_flow"): VALVE_FLOW,
     vol.Optional("image_path"): cv.string,
 })
 
+# No defaults, so replacing a plant only changes the columns a file sets
+IMPORT_ROW_SCHEMA = vol.Schema({
+    vol.Required("plant_name"): cv.string,
+    vol.Optional("plant_type"): cv.string,
+    vol.Optional("watering_mode"): vol.In(["sensor", "manual"]),
+    vol.Optional("humidity_sensor"): HUMIDITY_SENSORS,
+    vol.Optional("humidity_fusion"): vol.In(FUSION_STRATEGIES),
+    vol.Optional("humidity_weights"): HUMIDITY_WEIGHTS,
+    vol.Optional("watering_interval"): cv.positive_int,
+    vol.Optional("valve"): cv.entity_id,
+    vol.Optional("valve_duration"): VALVE_DURATION,
+    vol.Optional("valve_flow"): VALVE_FLOW,
+    vol.Optional("last_watered"): cv.string,
+    vol.Optional("created"): cv.string,
+})
+
+IMPORT_PLANTS_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Required("file"): cv.string,
+    vol.Optional("on_conflict", default=CONFLICT_SKIP): vol.In(
+        [CONFLICT_SKIP, CONFLICT_RENAME, CONFLICT_REPLACE]
+    ),
+    vol.Optional("dry_run", default=False): cv.boolean,
+})
+
+EXPORT_PLANTS_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Required("file"): cv.string,
+})
+
+GET_PLANTS_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Optional("status"): vol.All(
+        cv.ensure_list,
+        [vol.In([
+            PLANT_STATUS_HEALTHY,
+            PLANT_STATUS_NEEDS_WATER,
+            PLANT_STATUS_OVERDUE,
+            PLANT_STATUS_UNKNOWN,
+        ])],
+    ),
+    vol.Optional("type"): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional("area"): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional("due_before"): cv.datetime,
+    vol.Optional("fields", default=[]): vol.All(
+        cv.ensure_list, [vol.In(PLANT_FIELDS)]
+    ),
+})
+
+START_WATERING_RUN_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Optional("plant_id"): vol.All(cv.ensure_list, [cv.string]),
+})
+
+STOP_WATERING_RUN_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+})
+
+SEARCH_SPECIES_SCHEMA = vol.Schema({
+    vol.Required("query"): cv.string,
+    vol.Optional("limit", default=SEARCH_DEFAULT_LIMIT): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=50)
+    ),
+})
+
 
 class PlantyStorage:
     """Handle storage for Planty data."""
     
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(self, hass: HomeAssistant, prefix: str = DOMAIN) -> None:
         """Initialize the storage handler."""
-        self._store = Store(hass, 1, f"{DOMAIN}.storage")
+        self._store = Store(hass, 1, f"{prefix}.storage")
         self._data: dict[str, Any] = {}
     
     async def async_load(self) -> dict[str, Any]:
@@ -94,27 +249,95 @@ class PlantyStorage:
     def data(self) -> dict[str, Any]:
         """Return the storage data."""
         return self._data
+    
+    async def async_update_plants(self, changes: dict[str, dict[str, Any]]) -> None:
+        """Merge changes into plants, creating plants that do not exist."""
+        plants = self._data.setdefault("plants", {})
+        for plant_id, plant_changes in changes.items():
+            plants.setdefault(plant_id, {}).update(plant_changes)
+        await self.async_save()
+    
+    async def async_set_plants(self, records: dict[str, dict[str, Any]]) -> None:
+        """Add plants or replace them entirely."""
+        self._data.setdefault("plants", {}).update(records)
+        await self.async_save()
+
+
+async def async_setup_storage(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> PlantyStorage | PlantyJournalStorage:
+    """Load plant storage with the backend chosen in the options."""
+    prefix = entry_storage_prefix(entry)
+    storage = PlantyStorage(hass, prefix)
+    journal = PlantyJournalStorage(hass, prefix)
+    backend = entry.options.get(CONF_STORAGE_BACKEND, DEFAULT_STORAGE_BACKEND)
+    if backend == STORAGE_BACKEND_JOURNAL:
+        # The first load starts the journal from the regular store
+        await journal.async_load(storage.async_load)
+        return journal
+    
+    await storage.async_load()
+    if await journal.async_exists():
+        # Switching back carries the journal's plants over
+        storage.data.clear()
+        storage.data.update(await journal.async_load())
+        await storage.async_save()
+        await journal.async_remove()
+        _LOGGER.info("Moved plants from the journal back to the regular store")
+    return storage
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Planty integration."""
+    async_setup_websocket_api(hass)
+    hass.http.register_view(PlantyImageView())
+    
+    # Every entry shares the species catalog and the image directory
+    catalog = await async_setup_catalog(hass)
+    hass.data[DATA_SHARED] = {
+        "catalog": catalog,
+        "search_index": await hass.async_add_executor_job(build_search_index, catalog),
+        "image_handler": await async_setup_image_handler(hass),
+    }
+    
+    async def async_close_catalog(_event: Event) -> None:
+        await hass.async_add_executor_job(catalog.close)
+    
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_close_catalog)
+    
+    # Register frontend resources
+    await async_register_frontend_resources(hass)
+    
+    # Register services, each call finds the entry it is for
+    await async_register_services(hass)
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Planty from a config entry."""
     # Initialize storage
-    storage = PlantyStorage(hass)
-    await storage.async_load()
+    storage = await async_setup_storage(hass, entry)
     
-    # Load plant database
-    plants_db = await async_load_plants_database(hass)
+    # Warm the shared species catalog with the species in use
+    shared = hass.data[DATA_SHARED]
+    catalog = shared["catalog"]
+    await catalog.async_prefetch(
+        hass,
+        {plant.get("type") for plant in storage.data.get("plants", {}).values()},
+        pin=True,
+    )
     
-    # Set up image handler
-    image_handler = await async_setup_image_handler(hass)
+    # Index upcoming waterings
+    schedule = await async_setup_schedule(hass, entry, storage)
     
-    # Register frontend resources
-    await async_register_frontend_resources(hass)
+    # Start tracking plant status transitions
+    engine = PlantyEngine(hass, entry, storage, catalog)
+    await engine.async_start()
+    rollup = await async_setup_rollup(hass, entry, engine)
+    await async_setup_digest(hass, entry, engine)
+    detector = await async_setup_detector(hass, entry, engine)
+    statistics = await async_setup_statistics(hass, entry, engine)
+    irrigation = await async_setup_irrigation(hass, entry, engine, schedule)
     
     # Set up dashboard manager (optional - don't fail if this errors)
     dashboard_manager = None
@@ -129,65 +352,90 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "storage": storage,
-        "plants_db": plants_db,
+        "catalog": catalog,
+        "search_index": shared["search_index"],
+        "schedule": schedule,
+        "engine": engine,
+        "rollup": rollup,
+        "statistics": statistics,
+        "irrigation": irrigation,
+        "detector": detector,
+        "history_cache": HistoryCache(hass),
         "config": entry.data,
-        "image_handler": image_handler,
+        "image_handler": shared["image_handler"],
         "dashboard_manager": dashboard_manager,
     }
     
+    # Drop per-plant entities that compact mode folds into one
+    if entry.options.get(CONF_COMPACT_ENTITIES, DEFAULT_COMPACT_ENTITIES):
+        async_migrate_compact_entities(hass, entry, storage)
+    
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
-    # Register services
-    await async_register_services(hass, entry)
+    # Reload when options change
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
     
     return True
 
 
+@callback
+def async_migrate_compact_entities(
+    hass: HomeAssistant, entry: ConfigEntry, storage: PlantyStorage
+) -> None:
+    """Remove registry entries of the entities replaced by compact mode.
+
+    The water status entity keeps its unique id and entity id, so history,
+    automations and cards referring to it carry over. Turning compact mode
+    off again recreates the removed entities on the next setup.
+    """
+    registry = er.async_get(hass)
+    obsolete = {
+        f"{DOMAIN}_{plant_id}_{suffix}"
+        for plant_id in storage.data.get("plants", {})
+        for suffix in COMPACT_ENTITY_SUFFIXES
+    }
+    removed = 0
+    for entity_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if entity_entry.unique_id in obsolete:
+            registry.async_remove(entity_entry.entity_id)
+            removed += 1
+    if removed:
+        _LOGGER.info("Removed %d entities replaced by compact entity mode", removed)
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        # Never leave a valve open behind an unloaded entry
+        await entry_data["irrigation"].async_stop()
+        if entry_data["statistics"]:
+            await entry_data["statistics"].async_save()
     return unload_ok
 
 
-async def async_load_plants_database(hass: HomeAssistant) -> dict[str, Any]:
-    """Load the plants database from JSON file."""
-    try:
-        integration_path = os.path.dirname(__file__)
-        plants_file = os.path.join(integration_path, "plants_data.json")
-        
-        def load_plants():
-            with open(plants_file, encoding="utf-8") as f:
-                return json.load(f)
-        
-        return await hass.async_add_executor_job(load_plants)
-    except (FileNotFoundError, json.JSONDecodeError) as err:
-        _LOGGER.error("Failed to load plants database: %s", err)
-        return {"plants": {}}
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored data of a removed entry."""
+    prefix = entry_storage_prefix(entry)
+    for key in (f"{prefix}.storage", f"{prefix}.statistics", f"{prefix}_dashboard"):
+        await Store(hass, 1, key).async_remove()
+    await PlantyJournalStorage(hass, prefix).async_remove()
 
 
-async def async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
+async def async_register_services(hass: HomeAssistant) -> None:
     """Register Planty services."""
     
     async def water_plant_service(call: ServiceCall) -> None:
         """Handle water plant service call."""
-        plant_id = call.data["plant_id"]
-        storage = hass.data[DOMAIN][entry.entry_id]["storage"]
-        
-        # Update last watered time
-        if "plants" not in storage.data:
-            storage.data["plants"] = {}
-        
-        if plant_id not in storage.data["plants"]:
-            storage.data["plants"][plant_id] = {}
-        
-        storage.data["plants"][plant_id]["last_watered"] = datetime.now().isoformat()
-        await storage.async_save()
-        
-        # Fire event to update sensors
-        hass.bus.async_fire(f"{DOMAIN}_plant_watered", {"plant_id": plant_id})
+        for entry_id, plant_ids in _plants_by_entry(hass, call.data["plant_id"]).items():
+            await async_record_waterings(hass, entry_id, plant_ids)
     
     async def add_plant_service(call: ServiceCall) -> None:
         """Handle add plant service call."""
@@ -197,75 +445,94 @@ async def async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> No
         humidity_sensor = call.data.get("humidity_sensor")
         watering_interval = call.data["watering_interval"]
         
-        storage = hass.data[DOMAIN][entry.entry_id]["storage"]
+        entry_id = _target_entry_id(hass, call)
+        storage = hass.data[DOMAIN][entry_id]["storage"]
+        
+        catalog = hass.data[DOMAIN][entry_id]["catalog"]
+        # Read from the executor on a cache miss, never on the loop
+        if plant_type and await catalog.async_get(hass, plant_type) is None:
+            search_index = hass.data[DOMAIN][entry_id]["search_index"]
+            suggestions = [match["key"] for match in search_index.search(plant_type, 3)]
+            _LOGGER.warning(
+                "Unknown plant type '%s' for %s, default humidity thresholds will be used. "
+                "Closest species: %s",
+                plant_type,
+                plant_name,
+                ", ".join(suggestions) or "none",
+            )
         
-        if "plants" not in storage.data:
-            storage.data["plants"] = {}
+        # Plant ids are unique across entries, like the entities named after them
+        plant_id = base_id = plant_slug(plant_name)
+        taken = _other_plant_ids(hass, entry_id)
+        suffix = 2
+        while plant_id in taken:
+            plant_id = f"{base_id}_{suffix}"
+            suffix += 1
         
-        plant_id = plant_name.lower().replace(" ", "_")
-        storage.data["plants"][plant_id] = {
+        record = {
             "name": plant_name,
             "type": plant_type,
             "watering_mode": watering_mode,
             "humidity_sensor": humidity_sensor,
             "watering_interval": watering_interval,
-            "created": datetime.now().isoformat(),
+            "created": get_clock(hass).timestamp(),
         }
-        
-        await storage.async_save()
+        for key in (
+            "humidity_fusion",
+            "humidity_weights",
+            "valve",
+            "valve_duration",
+            "valve_flow",
+        ):
+            if key in call.data:
+                record[key] = call.data[key]
+        await storage.async_set_plants({plant_id: record})
         
         # Update dashboard if available
-        dashboard_manager = hass.data[DOMAIN][entry.entry_id].get("dashboard_manager")
+        dashboard_manager = hass.data[DOMAIN][entry_id].get("dashboard_manager")
         if dashboard_manager:
             try:
                 await dashboard_manager.async_update_dashboard()
             except Exception as err:
                 _LOGGER.error("Failed to update dashboard: %s", err)
         
-        # Reload the integration to create new entities
-        await hass.config_entries.async_reload(entry.entry_id)
+        # Reload the entry to create new entities
+        await hass.config_entries.async_reload(entry_id)
     
     async def update_image_service(call: ServiceCall) -> None:
         """Handle update plant image service call."""
         plant_id = call.data["plant_id"]
         image_path = call.data["image_path"]
         
-        storage = hass.data[DOMAIN][entry.entry_id]["storage"]
-        
-        if "plants" in storage.data and plant_id in storage.data["plants"]:
-            storage.data["plants"][plant_id]["image_path"] = image_path
-            await storage.async_save()
-            
-            # Fire event to update entities
-            hass.bus.async_fire(f"{DOMAIN}_plant_updated", {"plant_id": plant_id})
+        entry_id = get_plant_entry_id(hass, plant_id)
+        if entry_id is not None:
+            await async_update_plant_image(hass, entry_id, plant_id, image_path)
     
     async def water_plant_custom_date_service(call: ServiceCall) -> None:
         """Handle water plant with custom date service call."""
-        plant_id = call.data["plant_id"]
-        watered_date = call.data["watered_date"]
-        
-        storage = hass.data[DOMAIN][entry.entry_id]["storage"]
-        
-        if "plants" in storage.data and plant_id in storage.data["plants"]:
-            storage.data["plants"][plant_id]["last_watered"] = watered_date
-            await storage.async_save()
-            
-            # Fire event to update entities
-            hass.bus.async_fire(f"{DOMAIN}_plant_watered", {"plant_id": plant_id})
+        for entry_id, plant_ids in _plants_by_entry(hass, call.data["plant_id"]).items():
+            await async_record_waterings(hass, entry_id, plant_ids, call.data["watered_date"])
     
     async def update_plant_settings_service(call: ServiceCall) -> None:
         """Handle update plant settings service call."""
         plant_id = call.data["plant_id"]
         settings = {k: v for k, v in call.data.items() if k != "plant_id"}
+        if "plant_type" in settings:
+            # Stored plants keep their species under "type"
+            settings["type"] = settings.pop("plant_type")
         
-        storage = hass.data[DOMAIN][entry.entry_id]["storage"]
+        entry_id = get_plant_entry_id(hass, plant_id)
         
-        if "plants" in storage.data and plant_id in storage.data["plants"]:
-            storage.data["plants"][plant_id].update(settings)
-            await storage.async_save()
+        if entry_id is not None:
+            storage = hass.data[DOMAIN][entry_id]["storage"]
+            await storage.async_update_plants({plant_id: settings})
+            
+            if settings.get("type"):
+                catalog = hass.data[DOMAIN][entry_id]["catalog"]
+                await catalog.async_prefetch(hass, {settings["type"]}, pin=True)
             
             # Update dashboard if available
-            dashboard_manager = hass.data[DOMAIN][entry.entry_id].get("dashboard_manager")
+            dashboard_manager = hass.data[DOMAIN][entry_id].get("dashboard_manager")
             if dashboard_manager:
                 try:
                     await dashboard_manager.async_update_dashboard()
@@ -275,6 +542,169 @@ async def async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> No
             # Fire event to update entities
             hass.bus.async_fire(f"{DOMAIN}_plant_updated", {"plant_id": plant_id})
     
+    async def async_transfer_path(call: ServiceCall) -> str:
+        """Resolve the import or export file of an admin's service call.
+        
+        Files must be inside the Planty transfer directory and outside the
+        catalog extensions, so no other configuration can be overwritten.
+        """
+        await _async_require_admin(hass, call)
+        file = call.data["file"]
+        
+        def resolve() -> str | None:
+            # Resolving follows symlinks, so it runs in the executor
+            transfer_dir = os.path.realpath(hass.config.path(TRANSFER_DIR))
+            catalog_dir = os.path.realpath(hass.config.path(CATALOG_EXTENSION_DIR))
+            path = os.path.realpath(hass.config.path(file))
+            if os.path.commonpath((transfer_dir, path)) != transfer_dir:
+                return None
+            if os.path.commonpath((catalog_dir, path)) == catalog_dir:
+                return None
+            return path
+        
+        path = await hass.async_add_executor_job(resolve)
+        if path is None:
+            raise ServiceValidationError(
+                f"{file} must be inside the {TRANSFER_DIR} folder of the config directory"
+            )
+        try:
+            file_format(path)
+        except ValueError as err:
+            raise ServiceValidationError(str(err)) from err
+        return path
+    
+    async def import_plants_service(call: ServiceCall) -> ServiceResponse:
+        """Handle import plants service call."""
+        path = await async_transfer_path(call)
+        entry_id = _target_entry_id(hass, call)
+        storage = hass.data[DOMAIN][entry_id]["storage"]
+        existing = dict(storage.data.get("plants", {}))
+        reserved = _other_plant_ids(hass, entry_id)
+        now = get_clock(hass).timestamp()
+        
+        def plan() -> dict[str, Any]:
+            return plan_import(
+                read_rows(path),
+                existing,
+                IMPORT_ROW_SCHEMA,
+                call.data["on_conflict"],
+                now,
+                reserved,
+            )
+        
+        try:
+            result = await hass.async_add_executor_job(plan)
+        except (OSError, ValueError) as err:
+            raise ServiceValidationError(f"Could not read {call.data['file']}: {err}") from err
+        
+        report = {**result["report"], "dry_run": call.data["dry_run"]}
+        if call.data["dry_run"] or not result["records"]:
+            return report
+        
+        # One storage write and one reload register every imported plant
+        await storage.async_set_plants(result["records"])
+        _LOGGER.info(
+            "Imported %d plants from %s", len(result["records"]), call.data["file"]
+        )
+        await hass.data[DOMAIN][entry_id]["catalog"].async_prefetch(
+            hass, {record.get("type") for record in result["records"].values()}
+        )
+        
+        dashboard_manager = hass.data[DOMAIN][entry_id].get("dashboard_manager")
+        if dashboard_manager:
+            try:
+                await dashboard_manager.async_update_dashboard()
+            except Exception as err:
+                _LOGGER.error("Failed to update dashboard: %s", err)
+        
+        hass.async_create_task(hass.config_entries.async_reload(entry_id))
+        return report
+    
+    async def export_plants_service(call: ServiceCall) -> ServiceResponse:
+        """Handle export plants service call."""
+        path = await async_transfer_path(call)
+        plants = {}
+        for entry_id in _selected_entry_ids(hass, call):
+            plants.update(hass.data[DOMAIN][entry_id]["storage"].data.get("plants", {}))
+        try:
+            count = await hass.async_add_executor_job(write_plants, path, plants)
+        except OSError as err:
+            raise HomeAssistantError(f"Could not write {call.data['file']}: {err}") from err
+        return {"file": path, "count": count}
+    
+    async def get_plants_service(call: ServiceCall) -> ServiceResponse:
+        """Handle get plants service call."""
+        filters = dict(call.data)
+        due_before = filters.get("due_before")
+        if due_before is not None and due_before.tzinfo is None:
+            # Naive times are local like the stored watering dates
+            filters["due_before"] = due_before.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+        
+        plants = []
+        for entry_id in _selected_entry_ids(hass, call):
+            entry_data = hass.data[DOMAIN][entry_id]
+            rollup = entry_data["rollup"]
+            plants.extend(
+                query_plants(
+                    entry_data["storage"].data.get("plants", {}),
+                    entry_data["engine"].status,
+                    entry_data["engine"].humidity,
+                    lambda plant_id, rollup=rollup: rollup.group(plant_id, GROUP_AREA),
+                    entry_data["schedule"].get,
+                    filters,
+                    call.data["fields"] or PLANT_FIELDS,
+                )
+            )
+        return {"count": len(plants), "plants": plants}
+    
+    async def start_watering_run_service(call: ServiceCall) -> ServiceResponse:
+        """Handle start watering run service call."""
+        if "plant_id" in call.data:
+            selected = _plants_by_entry(hass, call.data["plant_id"])
+        else:
+            selected = dict.fromkeys(_selected_entry_ids(hass, call))
+        runs = {}
+        for entry_id, plant_ids in selected.items():
+            irrigation = hass.data[DOMAIN][entry_id]["irrigation"]
+            runs[entry_id] = await irrigation.async_start(plant_ids)
+        return {"runs": runs}
+    
+    async def stop_watering_run_service(call: ServiceCall) -> None:
+        """Handle stop watering run service call."""
+        for entry_id in _selected_entry_ids(hass, call):
+            await hass.data[DOMAIN][entry_id]["irrigation"].async_stop()
+    
+    async def search_species_service(call: ServiceCall) -> ServiceResponse:
+        """Handle search species service call."""
+        search_index = hass.data[DATA_SHARED]["search_index"]
+        return {"results": search_index.search(call.data["query"], call.data["limit"])}
+    
+    async def reload_catalog_service(call: ServiceCall) -> None:
+        """Handle reload catalog service call."""
+        shared = hass.data[DATA_SHARED]
+        catalog = shared["catalog"]
+        
+        def reload() -> tuple[set[str], list[dict[str, Any]]]:
+            changed = catalog.reload(catalog_sources(hass))
+            return changed, catalog.summaries(changed) if changed else []
+        
+        changed, summaries = await hass.async_add_executor_job(reload)
+        if changed:
+            # Only re-index the species that changed
+            shared["search_index"].update(changed, summaries)
+            plants = {
+                plant_id: plant
+                for entry_data in hass.data.get(DOMAIN, {}).values()
+                for plant_id, plant in entry_data["storage"].data.get("plants", {}).items()
+            }
+            # Cached entries are replaced on the loop, never from the executor
+            plant_types = {plant.get("type") for plant in plants.values()}
+            await catalog.async_prefetch(hass, catalog.cached(changed) - plant_types)
+            await catalog.async_prefetch(hass, plant_types, pin=True)
+            for plant_id in plants:
+                hass.bus.async_fire(f"{DOMAIN}_plant_updated", {"plant_id": plant_id})
+        _LOGGER.info("Reloaded plant catalog, %d species changed", len(changed))
+    
     # Register services
     hass.services.async_register(
         DOMAIN, SERVICE_WATER_PLANT, water_plant_service, schema=WATER_PLANT_SCHEMA
@@ -291,6 +721,172 @@ async def async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> No
     hass.services.async_register(
         DOMAIN, SERVICE_UPDATE_PLANT_SETTINGS, update_plant_settings_service, schema=UPDATE_PLANT_SETTINGS_SCHEMA
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_PLANTS,
+        import_plants_service,
+        schema=IMPORT_PLANTS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_PLANTS,
+        export_plants_service,
+        schema=EXPORT_PLANTS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_PLANTS,
+        get_plants_service,
+        schema=GET_PLANTS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_WATERING_RUN,
+        start_watering_run_service,
+        schema=START_WATERING_RUN_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_WATERING_RUN,
+        stop_watering_run_service,
+        schema=STOP_WATERING_RUN_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEARCH_SPECIES,
+        search_species_service,
+        schema=SEARCH_SPECIES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_RELOAD_CATALOG, reload_catalog_service
+    )
+
+
+async def _async_require_admin(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Reject calls from users who are not administrators.
+
+    Same check as admin services, which cannot return responses on every
+    Home Assistant version Planty supports.
+    """
+    if not call.context.user_id:
+        return
+    user = await hass.auth.async_get_user(call.context.user_id)
+    if user is None:
+        raise UnknownUser(context=call.context)
+    if not user.is_admin:
+        raise Unauthorized(context=call.context)
+
+
+def _target_entry_id(hass: HomeAssistant, call: ServiceCall) -> str:
+    """Return the entry a service call adds plants to.
+
+    The entry can be left out while only one is loaded.
+    """
+    entries = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if entry_id is not None:
+        if entry_id not in entries:
+            raise ServiceValidationError(f"Planty entry {entry_id} is not loaded")
+        return entry_id
+    if len(entries) == 1:
+        return next(iter(entries))
+    if not entries:
+        raise ServiceValidationError("Planty is not loaded")
+    raise ServiceValidationError(
+        f"Several Planty entries are loaded, choose one with {ATTR_CONFIG_ENTRY_ID}"
+    )
+
+
+def _selected_entry_ids(hass: HomeAssistant, call: ServiceCall) -> list[str]:
+    """Return the entry a service call reads from, or all loaded entries."""
+    if call.data.get(ATTR_CONFIG_ENTRY_ID) is not None:
+        return [_target_entry_id(hass, call)]
+    return list(hass.data.get(DOMAIN, {}))
+
+
+def _plants_by_entry(hass: HomeAssistant, plant_ids: list[str]) -> dict[str, list[str]]:
+    """Group plants by the entry that stores them, raising if any is unknown."""
+    by_entry: dict[str, list[str]] = {}
+    unknown = []
+    for plant_id in plant_ids:
+        entry_id = get_plant_entry_id(hass, plant_id)
+        if entry_id is None:
+            unknown.append(plant_id)
+        else:
+            by_entry.setdefault(entry_id, []).append(plant_id)
+    if unknown:
+        raise ServiceValidationError(f"Unknown plants: {', '.join(unknown)}")
+    return by_entry
+
+
+def _other_plant_ids(hass: HomeAssistant, entry_id: str) -> set[str]:
+    """Return the plant ids the other loaded entries use."""
+    return {
+        plant_id
+        for other_id, entry_data in hass.data.get(DOMAIN, {}).items()
+        if other_id != entry_id
+        for plant_id in entry_data["storage"].data.get("plants", {})
+    }
+
+
+async def async_record_watering(
+    hass: HomeAssistant,
+    entry_id: str,
+    plant_id: str,
+    watered_at: str | None = None,
+) -> None:
+    """Record that a plant was watered and notify its entities."""
+    await async_record_waterings(hass, entry_id, [plant_id], watered_at)
+
+
+async def async_record_waterings(
+    hass: HomeAssistant,
+    entry_id: str,
+    plant_ids: list[str],
+    watered_at: str | None = None,
+) -> None:
+    """Record that several plants were watered with a single storage write."""
+    storage = hass.data[DOMAIN][entry_id]["storage"]
+    detector = hass.data[DOMAIN][entry_id].get("detector")
+    if watered_at is None and detector is not None:
+        # Pressing water right after the sensor detected it is the same watering
+        plant_ids = [
+            plant_id for plant_id in plant_ids if not detector.recently_detected(plant_id)
+        ]
+        if not plant_ids:
+            return
+    watered_at = watered_at or get_clock(hass).timestamp()
+    
+    # Update last watered time
+    await storage.async_update_plants(
+        {plant_id: {"last_watered": watered_at} for plant_id in plant_ids}
+    )
+    
+    # Fire events to update sensors
+    for plant_id in plant_ids:
+        hass.bus.async_fire(f"{DOMAIN}_plant_watered", {"plant_id": plant_id})
+
+
+async def async_update_plant_image(
+    hass: HomeAssistant, entry_id: str, plant_id: str, image_path: str
+) -> str | None:
+    """Process a new photo for a plant and return its image URL."""
+    storage = hass.data[DOMAIN][entry_id]["storage"]
+    image_handler = hass.data[DOMAIN][entry_id]["image_handler"]
+    
+    image_url = await image_handler.process_image(image_path, plant_id)
+    if image_url is None:
+        return None
+    await storage.async_update_plants({plant_id: {"image_path": image_url}})
+    
+    # Fire event to update entities
+    hass.bus.async_fire(f"{DOMAIN}_plant_updated", {"plant_id": plant_id})
+    return image_url
 
 
 def get_plant_data(hass: HomeAssistant, entry_id: str, plant_id: str) -> dict[str, Any] | None:
@@ -299,21 +895,57 @@ def get_plant_data(hass: HomeAssistant, entry_id: str, plant_id: str) -> dict[st
     return storage.data.get("plants", {}).get(plant_id)
 
 
-def get_plant_database(hass: HomeAssistant, entry_id: str) -> dict[str, Any]:
-    """Get the plants database."""
-    return hass.data[DOMAIN][entry_id]["plants_db"]
+def get_plant_entry_id(hass: HomeAssistant, plant_id: str) -> str | None:
+    """Return the id of the loaded entry that stores a plant."""
+    for entry_id, entry_data in hass.data.get(DOMAIN, {}).items():
+        if plant_id in entry_data["storage"].data.get("plants", {}):
+            return entry_id
+    return None
+
+
+def get_plant_for_device(hass: HomeAssistant, device_id: str) -> tuple[str, str] | None:
+    """Return the (entry_id, plant_id) of a Planty plant device."""
+    device = dr.async_get(hass).async_get(device_id)
+    if device is None:
+        return None
+    for domain, plant_id in device.identifiers:
+        if domain == DOMAIN:
+            for entry_id in device.config_entries:
+                return entry_id, plant_id
+    return None
+
+
+def get_plant_catalog(hass: HomeAssistant, entry_id: str) -> PlantCatalog:
+    """Get the species catalog."""
+    return hass.data[DOMAIN][entry_id]["catalog"]
 
 
 async def async_register_frontend_resources(hass: HomeAssistant) -> None:
     """Register frontend resources."""
     try:
-        import os
-        
         # Get integration path
         integration_path = os.path.dirname(__file__)
         www_path = os.path.join(integration_path, "www")
+        card_files = [
+            "planty-card.js",
+            "planty-grid-card.js",
+            "planty-header-card.js", 
+            "planty-settings-card.js", 
+            "planty-welcome-card.js"
+        ]
         
-        if not os.path.exists(www_path):
+        # Look at the files once, off the event loop
+        def existing_files() -> set[str] | None:
+            if not os.path.isdir(www_path):
+                return None
+            return {
+                card_file
+                for card_file in card_files
+                if os.path.exists(os.path.join(www_path, card_file))
+            }
+        
+        available = await hass.async_add_executor_job(existing_files)
+        if available is None:
             _LOGGER.warning("WWW path not found: %s", www_path)
             return
         
@@ -352,20 +984,14 @@ async def async_register_frontend_resources(hass: HomeAssistant) -> None:
             
             # Only register if we successfully registered static path
             if static_registered:
-                card_files = [
-                    "planty-card.js",
-                    "planty-header-card.js", 
-                    "planty-settings-card.js", 
-                    "planty-welcome-card.js"
-                ]
-                
                 for card_file in card_files:
-                    card_path = os.path.join(www_path, card_file)
-                    if os.path.exists(card_path):
+                    if card_file in available:
                         add_extra_js_url(hass, f"/planty_static/{card_file}")
                         _LOGGER.info("Registered frontend resource: %s", card_file)
                     else:
-                        _LOGGER.warning("Card file not found: %s", card_path)
+                        _LOGGER.warning(
+                            "Card file not found: %s", os.path.join(www_path, card_file)
+                        )
             else:
                 _LOGGER.info("Skipping frontend resource registration - static path not available")
             
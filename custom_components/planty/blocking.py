@@ -0,0 +1,54 @@
+"""Event loop blocking checks for Planty integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+# asyncio logs every slow callback or task step in debug mode with this message
+SLOW_CALLBACK_MESSAGE = "Executing %s took %.3f seconds"
+
+
+class LoopBlockMonitor(logging.Handler):
+    """Record Planty code that held the event loop longer than a threshold.
+
+    The loop is put in asyncio debug mode, which times every callback and
+    task step and logs the ones slower than slow_callback_duration. Steps
+    that ran Planty code are kept in blocks as (seconds, description).
+    Debug mode slows everything down, so this is for tests and simulations.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, threshold: float) -> None:
+        """Initialize the monitor with a threshold in seconds."""
+        super().__init__(logging.WARNING)
+        self._loop = loop
+        self._threshold = threshold
+        self._restore: tuple[bool, float] | None = None
+        self.blocks: list[tuple[float, str]] = []
+
+    def start(self) -> None:
+        """Start recording slow steps."""
+        self._restore = (self._loop.get_debug(), self._loop.slow_callback_duration)
+        self._loop.set_debug(True)
+        self._loop.slow_callback_duration = self._threshold
+        logging.getLogger("asyncio").addHandler(self)
+
+    def stop(self) -> None:
+        """Stop recording and restore the loop settings."""
+        logging.getLogger("asyncio").removeHandler(self)
+        if self._restore is not None:
+            self._loop.set_debug(self._restore[0])
+            self._loop.slow_callback_duration = self._restore[1]
+            self._restore = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Keep slow steps whose callback or coroutine belongs to Planty."""
+        if record.msg != SLOW_CALLBACK_MESSAGE or len(record.args or ()) != 2:
+            return
+        description, duration = record.args
+        # Planty's modules, classes and task names all carry its name
+        if "planty" in str(description).lower():
+            self.blocks.append((duration, str(description)))
+
+    def longest(self, count: int = 5) -> list[tuple[float, str]]:
+        """Return the longest recorded blocks, longest first."""
+        return sorted(self.blocks, key=lambda block: block[0], reverse=True)[:count]
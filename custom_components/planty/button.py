@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
 from typing import Any
 
 from homeassistant.components.button import ButtonEntity
@@ -11,8 +10,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import get_plant_data
-from .const import DOMAIN
+from . import async_record_watering
+from .const import CONF_COMPACT_ENTITIES, DEFAULT_COMPACT_ENTITIES, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +22,10 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Planty button entities from a config entry."""
+    # Plants are watered through services and cards in compact entity mode
+    if config_entry.options.get(CONF_COMPACT_ENTITIES, DEFAULT_COMPACT_ENTITIES):
+        return
+    
     storage = hass.data[DOMAIN][config_entry.entry_id]["storage"]
     
     entities = []
@@ -67,19 +70,6 @@ class PlantWaterButton(ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        storage = self.hass.data[DOMAIN][self._config_entry.entry_id]["storage"]
-        
-        # Update last watered time
-        if "plants" not in storage.data:
-            storage.data["plants"] = {}
-        
-        if self._plant_id not in storage.data["plants"]:
-            storage.data["plants"][self._plant_id] = {}
-        
-        storage.data["plants"][self._plant_id]["last_watered"] = datetime.now().isoformat()
-        await storage.async_save()
-        
-        # Fire event to update sensors
-        self.hass.bus.async_fire(f"{DOMAIN}_plant_watered", {"plant_id": self._plant_id})
+        await async_record_watering(self.hass, self._config_entry.entry_id, self._plant_id)
         
         _LOGGER.info("Plant %s was watered", self._plant_config.get("name", self._plant_id))
@@ -0,0 +1,105 @@
+"""Watering calendar for Planty integration."""
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timedelta
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .clock import get_clock
+from .const import DOMAIN
+from .entries import entry_name
+from .schedule import WateringSchedule
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Planty watering calendar from a config entry."""
+    schedule = hass.data[DOMAIN][config_entry.entry_id]["schedule"]
+    async_add_entities([PlantyWateringCalendar(hass, config_entry, schedule)])
+
+
+class PlantyWateringCalendar(CalendarEntity):
+    """Calendar of upcoming plant waterings."""
+
+    _attr_icon = "mdi:calendar-heart"
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        schedule: WateringSchedule,
+    ) -> None:
+        """Initialize the calendar."""
+        self.hass = hass
+        self._config_entry = config_entry
+        self._schedule = schedule
+
+        self._attr_name = f"{entry_name(config_entry)} Watering"
+        self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_watering_calendar"
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        self.async_on_remove(
+            self._schedule.async_add_listener(self._handle_schedule_update)
+        )
+
+    @callback
+    def _handle_schedule_update(self) -> None:
+        """Handle a change in the watering schedule."""
+        self.async_write_ha_state()
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the most pressing watering.
+
+        An overdue watering stays active until the plant is watered.
+        """
+        next_due = self._schedule.next_due()
+        if next_due is None:
+            return None
+
+        due, plant_id = next_due
+        start = dt_util.as_local(due).date()
+        end = max(start, get_clock(self.hass).now().date()) + timedelta(days=1)
+        return self._make_event(plant_id, start, end)
+
+    async def async_get_events(
+        self,
+        hass: HomeAssistant,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        """Return the projected waterings between start_date and end_date."""
+        events = []
+        # Waterings are all-day events on the local date they fall due
+        window_start = dt_util.start_of_local_day(dt_util.as_local(start_date))
+        for due, plant_id in self._schedule.occurrences(window_start, end_date):
+            day = dt_util.as_local(due).date()
+            events.append(self._make_event(plant_id, day, day + timedelta(days=1)))
+
+        events.sort(key=lambda event: (event.start, event.summary))
+        return events
+
+    def _make_event(self, plant_id: str, start: date, end: date) -> CalendarEvent:
+        """Build the calendar event for a plant watering."""
+        plant_data = self.hass.data[DOMAIN][self._config_entry.entry_id]["storage"].data.get(
+            "plants", {}
+        ).get(plant_id, {})
+        plant_name = plant_data.get("name", plant_id)
+        return CalendarEvent(
+            start=start,
+            end=end,
+            summary=f"Water {plant_name}",
+            description=f"Every {plant_data.get('watering_interval', 7)} days",
+            uid=f"{plant_id}_{start.isoformat()}",
+        )
@@ -0,0 +1,304 @@
+"""Species catalog for Planty integration."""
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CATALOG_CACHE_SIZE,
+    CATALOG_DB_FILE,
+    CATALOG_EXTENSION_DIR,
+    DEFAULT_HUMIDITY_MAX,
+    DEFAULT_HUMIDITY_MIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+CATALOG_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS species (
+    key TEXT PRIMARY KEY,
+    name TEXT,
+    scientific_name TEXT,
+    source TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS species_name ON species (name COLLATE NOCASE);
+"""
+
+
+class PlantCatalog:
+    """Species catalog compiled into an indexed SQLite file.
+
+    The JSON sources (the bundled ``plants_data.json`` followed by any user
+    extension catalogs) are only read when they change. Species are read in
+    the executor and kept in a bounded LRU filled from the event loop, so
+    lookups from the loop never touch the database and the resident size
+    does not depend on the size of the catalog. Species that plants use are
+    pinned and never evicted.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        sources: list[str],
+        cache_size: int = CATALOG_CACHE_SIZE,
+    ) -> None:
+        """Initialize the catalog."""
+        self._db_path = db_path
+        self._sources = sources
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, dict[str, Any] | None] = OrderedDict()
+        self._pinned: set[str] = set()
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def open(self) -> set[str]:
+        """Open the database and compile it if the sources changed.
+
+        Returns the set of species keys whose entries changed. Must be run
+        in the executor.
+        """
+        with self._lock:
+            if self._conn is None:
+                os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
+                self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+                self._conn.executescript(_SCHEMA)
+            return self._compile_if_needed()
+
+    def reload(self, sources: list[str]) -> set[str]:
+        """Recompile from a new list of sources. Must be run in the executor."""
+        self._sources = sources
+        return self.open()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get(self, key: str | None) -> dict[str, Any] | None:
+        """Return the cached catalog entry for a species key, or None.
+
+        Species that are not cached read as unknown; use async_get to read
+        them from the database.
+        """
+        if not key or key not in self._cache:
+            return None
+        self._cache.move_to_end(key)
+        return self._cache[key]
+
+    async def async_get(self, hass: HomeAssistant, key: str | None) -> dict[str, Any] | None:
+        """Return the catalog entry for a species key, reading it on a miss."""
+        if key and key not in self._cache:
+            await self.async_prefetch(hass, {key})
+        return self.get(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if the species key exists in the catalog."""
+        return isinstance(key, str) and self.get(key) is not None
+
+    def humidity_range(self, key: str | None) -> tuple[float, float]:
+        """Return the (min, max) soil humidity for a species."""
+        entry = self.get(key)
+        if entry is None:
+            return DEFAULT_HUMIDITY_MIN, DEFAULT_HUMIDITY_MAX
+        return (
+            entry.get("humidity_min", DEFAULT_HUMIDITY_MIN),
+            entry.get("humidity_max", DEFAULT_HUMIDITY_MAX),
+        )
+
+    async def async_prefetch(
+        self,
+        hass: HomeAssistant,
+        keys: Iterable[str | None],
+        pin: bool = False,
+    ) -> None:
+        """Read species in the executor and cache them for lookups from the loop.
+
+        Pinned species are the ones plants use; they are never evicted.
+        """
+        keys = {key for key in keys if key}
+        if not keys:
+            return
+        entries = await hass.async_add_executor_job(self.fetch, keys)
+        if pin:
+            self._pinned.update(keys)
+        for key, entry in entries.items():
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+        self._evict()
+
+    def cached(self, keys: Iterable[str]) -> set[str]:
+        """Return which of some species keys are cached."""
+        return {key for key in keys if key in self._cache}
+
+    def _evict(self) -> None:
+        """Drop the least recently used species beyond the cache size."""
+        excess = len(self._cache.keys() - self._pinned) - self._cache_size
+        for key in list(self._cache):
+            if excess <= 0:
+                break
+            if key not in self._pinned:
+                del self._cache[key]
+                excess -= 1
+
+    def fetch(self, keys: set[str]) -> dict[str, dict[str, Any] | None]:
+        """Read species entries from the database. Must run in the executor."""
+        with self._lock:
+            if self._conn is None:
+                return {}
+            return {key: self._read(key) for key in keys}
+
+    def summaries(self, keys: set[str] | None = None) -> list[dict[str, Any]]:
+        """Return name summaries for all or some species. Must run in the executor."""
+        query = (
+            "SELECT key, name, scientific_name, "
+            "json_extract(data, '$.watering_interval') FROM species"
+        )
+        with self._lock:
+            if self._conn is None:
+                return []
+            if keys is None:
+                rows = self._conn.execute(query).fetchall()
+            else:
+                rows = []
+                keys_list = list(keys)
+                # Stay below SQLite's bound parameter limit
+                for start in range(0, len(keys_list), 500):
+                    chunk = keys_list[start:start + 500]
+                    rows.extend(self._conn.execute(
+                        f"{query} WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                    ))
+        return [
+            {
+                "key": key,
+                "name": name or key,
+                "scientific_name": scientific_name,
+                "watering_interval": watering_interval,
+            }
+            for key, name, scientific_name, watering_interval in rows
+        ]
+
+    def _read(self, key: str) -> dict[str, Any] | None:
+        """Read a single entry with the lock held."""
+        assert self._conn is not None
+        row = self._conn.execute(
+            "SELECT data FROM species WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def _fingerprint(self) -> str:
+        """Return a fingerprint of the catalog sources on disk."""
+        parts = []
+        for path in self._sources:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            parts.append([path, stat.st_mtime_ns, stat.st_size])
+        return json.dumps([CATALOG_SCHEMA_VERSION, parts])
+
+    def _compile_if_needed(self) -> set[str]:
+        """Recompile the database from the JSON sources if they changed."""
+        assert self._conn is not None
+        fingerprint = self._fingerprint()
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'fingerprint'"
+        ).fetchone()
+        if row is not None and row[0] == fingerprint:
+            return set()
+
+        merged: dict[str, tuple[str, dict[str, Any]]] = {}
+        for path in self._sources:
+            for key, entry in _load_source(path).items():
+                if key in merged:
+                    # Extension catalogs override individual fields
+                    entry = {**merged[key][1], **entry}
+                merged[key] = (path, entry)
+
+        existing = dict(self._conn.execute("SELECT key, digest FROM species"))
+        changed: set[str] = set()
+
+        with self._conn:
+            for key, (source, entry) in merged.items():
+                data = json.dumps(entry, sort_keys=True, ensure_ascii=False)
+                digest = hashlib.sha1(data.encode("utf-8")).hexdigest()
+                if existing.pop(key, None) == digest:
+                    continue
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO species "
+                    "(key, name, scientific_name, source, digest, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        entry.get("name"),
+                        entry.get("scientific_name"),
+                        source,
+                        digest,
+                        data,
+                    ),
+                )
+                changed.add(key)
+
+            for key in existing:
+                self._conn.execute("DELETE FROM species WHERE key = ?", (key,))
+                changed.add(key)
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('fingerprint', ?)",
+                (fingerprint,),
+            )
+
+        _LOGGER.info(
+            "Compiled plant catalog: %d species, %d changed", len(merged), len(changed)
+        )
+        return changed
+
+
+def _load_source(path: str) -> dict[str, dict[str, Any]]:
+    """Load the species entries from one JSON catalog file."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get("plants", {})
+    except (OSError, json.JSONDecodeError, AttributeError) as err:
+        _LOGGER.error("Failed to load plant catalog %s: %s", path, err)
+        return {}
+
+
+def catalog_sources(hass: HomeAssistant) -> list[str]:
+    """Return the catalog source files, bundled catalog first."""
+    bundled = os.path.join(os.path.dirname(__file__), "plants_data.json")
+    extensions = sorted(
+        glob.glob(os.path.join(hass.config.path(CATALOG_EXTENSION_DIR), "*.json"))
+    )
+    return [bundled, *extensions]
+
+
+async def async_setup_catalog(hass: HomeAssistant) -> PlantCatalog:
+    """Set up the species catalog."""
+
+    def setup() -> PlantCatalog:
+        catalog = PlantCatalog(hass.config.path(CATALOG_DB_FILE), catalog_sources(hass))
+        catalog.open()
+        return catalog
+
+    return await hass.async_add_executor_job(setup)
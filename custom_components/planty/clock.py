@@ -0,0 +1,131 @@
+"""Time source for Planty integration."""
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+DATA_CLOCK = f"{DOMAIN}_clock"
+
+TimerAction = Callable[[datetime], Any]
+
+
+class Clock:
+    """Wall clock and timers used by every part of the integration.
+
+    Reading the time and arming timers through one object lets a
+    simulation swap in a clock it advances itself.
+    """
+
+    def utcnow(self) -> datetime:
+        """Return the current time in UTC."""
+        return dt_util.utcnow()
+
+    def now(self) -> datetime:
+        """Return the current local time."""
+        return dt_util.now()
+
+    def timestamp(self, when: datetime | None = None) -> str:
+        """Return a time, by default the current one, as plant data stores it."""
+        local = dt_util.as_local(when) if when is not None else self.now()
+        return local.replace(tzinfo=None).isoformat()
+
+    def monotonic(self) -> float:
+        """Return seconds from a clock that never goes back."""
+        return time.monotonic()
+
+    @callback
+    def call_at(
+        self, hass: HomeAssistant, when: datetime, action: TimerAction
+    ) -> Callable[[], None]:
+        """Call action at a point in time and return a cancel callback."""
+        return async_track_point_in_utc_time(hass, action, when)
+
+    @callback
+    def call_later(
+        self, hass: HomeAssistant, delay: float, action: TimerAction
+    ) -> Callable[[], None]:
+        """Call action after a delay in seconds and return a cancel callback."""
+        return async_call_later(hass, delay, action)
+
+
+class SimulatedClock(Clock):
+    """Clock that only moves when advanced.
+
+    Timers fire in order while the clock is advanced, each seeing the time
+    it was armed for, so weeks of plant care run in as long as the work
+    they cause takes.
+    """
+
+    def __init__(self, start: datetime) -> None:
+        """Initialize the clock at a start time."""
+        self._start = dt_util.as_utc(start)
+        self._now = self._start
+        self._timers: list[tuple[datetime, int, TimerAction]] = []
+        self._cancelled: set[int] = set()
+        self._ids = itertools.count()
+
+    def utcnow(self) -> datetime:
+        """Return the simulated time in UTC."""
+        return self._now
+
+    def now(self) -> datetime:
+        """Return the simulated local time."""
+        return dt_util.as_local(self._now)
+
+    def monotonic(self) -> float:
+        """Return simulated seconds since the start."""
+        return (self._now - self._start).total_seconds()
+
+    @callback
+    def call_at(
+        self, hass: HomeAssistant, when: datetime, action: TimerAction
+    ) -> Callable[[], None]:
+        """Arm a simulated timer."""
+        timer_id = next(self._ids)
+        heapq.heappush(self._timers, (dt_util.as_utc(when), timer_id, action))
+
+        @callback
+        def cancel() -> None:
+            self._cancelled.add(timer_id)
+
+        return cancel
+
+    @callback
+    def call_later(
+        self, hass: HomeAssistant, delay: float, action: TimerAction
+    ) -> Callable[[], None]:
+        """Arm a simulated timer relative to the simulated time."""
+        return self.call_at(hass, self._now + timedelta(seconds=delay), action)
+
+    @callback
+    def advance_to(self, when: datetime) -> int:
+        """Move the clock forward, firing due timers, and return how many fired."""
+        when = dt_util.as_utc(when)
+        fired = 0
+        while self._timers and self._timers[0][0] <= when:
+            due, timer_id, action = heapq.heappop(self._timers)
+            if timer_id in self._cancelled:
+                self._cancelled.discard(timer_id)
+                continue
+            self._now = max(self._now, due)
+            action(self._now)
+            fired += 1
+        self._now = max(self._now, when)
+        return fired
+
+
+def get_clock(hass: HomeAssistant) -> Clock:
+    """Return the clock the integration runs on."""
+    clock = hass.data.get(DATA_CLOCK)
+    if clock is None:
+        clock = hass.data[DATA_CLOCK] = Clock()
+    return clock
@@ -7,12 +7,44 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.util import slugify
 
-from .const import DOMAIN
+from .const import (
+    CONF_COMPACT_ENTITIES,
+    CONF_DETECTION_DEDUPE_WINDOW,
+    CONF_DETECTION_THRESHOLD,
+    CONF_DIGEST_NOTIFICATION,
+    CONF_DIGEST_WINDOW,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_PROBE_STALE_AFTER,
+    CONF_STORAGE_BACKEND,
+    CONF_VALVE_FLOW_BUDGET,
+    CONF_VALVE_MAX_CONCURRENT,
+    CONF_WATERING_DETECTION,
+    CONF_WRITE_MIN_DELTA,
+    CONF_WRITE_MIN_INTERVAL,
+    DEFAULT_COMPACT_ENTITIES,
+    DEFAULT_DETECTION_DEDUPE_WINDOW,
+    DEFAULT_DETECTION_THRESHOLD,
+    DEFAULT_DIGEST_NOTIFICATION,
+    DEFAULT_DIGEST_WINDOW,
+    DEFAULT_LONG_TERM_STATISTICS,
+    DEFAULT_NAME,
+    DEFAULT_PROBE_STALE_AFTER,
+    DEFAULT_STORAGE_BACKEND,
+    DEFAULT_VALVE_FLOW_BUDGET,
+    DEFAULT_VALVE_MAX_CONCURRENT,
+    DEFAULT_WATERING_DETECTION,
+    DEFAULT_WRITE_MIN_DELTA,
+    DEFAULT_WRITE_MIN_INTERVAL,
+    DOMAIN,
+    STORAGE_BACKEND_JOURNAL,
+    STORAGE_BACKEND_STORE,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,18 +62,106 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_show_form(
                 step_id="user",
                 data_schema=vol.Schema({
-                    vol.Optional("name", default="Planty"): str,
+                    vol.Optional("name", default=DEFAULT_NAME): str,
                 }),
             )
 
-        await self.async_set_unique_id("planty")
+        # Each collection (house, greenhouse, office) is its own entry
+        name = user_input.get("name", DEFAULT_NAME)
+        await self.async_set_unique_id(slugify(name))
         self._abort_if_unique_id_configured()
 
         return self.async_create_entry(
-            title=user_input.get("name", "Planty"),
+            title=name,
             data=user_input,
         )
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Planty options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Optional(
+                    CONF_DIGEST_WINDOW,
+                    default=options.get(CONF_DIGEST_WINDOW, DEFAULT_DIGEST_WINDOW),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Optional(
+                    CONF_DIGEST_NOTIFICATION,
+                    default=options.get(CONF_DIGEST_NOTIFICATION, DEFAULT_DIGEST_NOTIFICATION),
+                ): bool,
+                vol.Optional(
+                    CONF_WATERING_DETECTION,
+                    default=options.get(CONF_WATERING_DETECTION, DEFAULT_WATERING_DETECTION),
+                ): bool,
+                vol.Optional(
+                    CONF_DETECTION_THRESHOLD,
+                    default=options.get(CONF_DETECTION_THRESHOLD, DEFAULT_DETECTION_THRESHOLD),
+                ): vol.All(vol.Coerce(float), vol.Range(min=1, max=50)),
+                vol.Optional(
+                    CONF_DETECTION_DEDUPE_WINDOW,
+                    default=options.get(
+                        CONF_DETECTION_DEDUPE_WINDOW, DEFAULT_DETECTION_DEDUPE_WINDOW
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1440)),
+                vol.Optional(
+                    CONF_COMPACT_ENTITIES,
+                    default=options.get(CONF_COMPACT_ENTITIES, DEFAULT_COMPACT_ENTITIES),
+                ): bool,
+                vol.Optional(
+                    CONF_LONG_TERM_STATISTICS,
+                    default=options.get(
+                        CONF_LONG_TERM_STATISTICS, DEFAULT_LONG_TERM_STATISTICS
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_STORAGE_BACKEND,
+                    default=options.get(CONF_STORAGE_BACKEND, DEFAULT_STORAGE_BACKEND),
+                ): vol.In([STORAGE_BACKEND_STORE, STORAGE_BACKEND_JOURNAL]),
+                vol.Optional(
+                    CONF_PROBE_STALE_AFTER,
+                    default=options.get(CONF_PROBE_STALE_AFTER, DEFAULT_PROBE_STALE_AFTER),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=168)),
+                vol.Optional(
+                    CONF_WRITE_MIN_INTERVAL,
+                    default=options.get(CONF_WRITE_MIN_INTERVAL, DEFAULT_WRITE_MIN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Optional(
+                    CONF_WRITE_MIN_DELTA,
+                    default=options.get(CONF_WRITE_MIN_DELTA, DEFAULT_WRITE_MIN_DELTA),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=20)),
+                vol.Optional(
+                    CONF_VALVE_MAX_CONCURRENT,
+                    default=options.get(CONF_VALVE_MAX_CONCURRENT, DEFAULT_VALVE_MAX_CONCURRENT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
+                vol.Optional(
+                    CONF_VALVE_FLOW_BUDGET,
+                    default=options.get(CONF_VALVE_FLOW_BUDGET, DEFAULT_VALVE_FLOW_BUDGET),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            }),
+        )
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
@@ -4,6 +4,12 @@ from __future__ import annotations
 DOMAIN = "planty"
 DEFAULT_NAME = "Planty"
 
+# Data every entry shares, kept in hass.data next to the per-entry data
+DATA_SHARED = f"{DOMAIN}_shared"
+
+# Service field picking the entry a service adds to or reads from
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+
 # Configuration keys
 CONF_PLANTS = "plants"
 CONF_PLANT_NAME = "plant_name"
@@ -14,6 +20,21 @@ CONF_HUMIDITY_SENSOR = "humidity_sensor"
 CONF_WATERING_INTERVAL = "watering_interval"
 CONF_PLANT_IMAGE = "plant_image"
 
+# Options
+CONF_DIGEST_WINDOW = "digest_window"
+CONF_DIGEST_NOTIFICATION = "digest_notification"
+CONF_WATERING_DETECTION = "watering_detection"
+CONF_DETECTION_THRESHOLD = "detection_threshold"
+CONF_DETECTION_DEDUPE_WINDOW = "detection_dedupe_window"
+CONF_COMPACT_ENTITIES = "compact_entities"
+CONF_LONG_TERM_STATISTICS = "long_term_statistics"
+CONF_STORAGE_BACKEND = "storage_backend"
+CONF_PROBE_STALE_AFTER = "probe_stale_after"
+CONF_WRITE_MIN_INTERVAL = "write_min_interval"
+CONF_WRITE_MIN_DELTA = "write_min_delta"
+CONF_VALVE_MAX_CONCURRENT = "valve_max_concurrent"
+CONF_VALVE_FLOW_BUDGET = "valve_flow_budget"
+
 # Watering modes
 WATERING_MODE_SENSOR = "sensor"
 WATERING_MODE_MANUAL = "manual"
@@ -22,6 +43,38 @@ WATERING_MODE_MANUAL = "manual"
 DEFAULT_WATERING_INTERVAL = 7  # days
 DEFAULT_HUMIDITY_MIN = 30
 DEFAULT_HUMIDITY_MAX = 70
+OVERDUE_GRACE_DAYS = 2  # days past the due date before a plant is overdue
+
+DEFAULT_DIGEST_WINDOW = 120  # seconds
+DEFAULT_DIGEST_NOTIFICATION = False
+DEFAULT_WATERING_DETECTION = True
+DEFAULT_DETECTION_THRESHOLD = 10  # humidity points
+DEFAULT_DETECTION_DEDUPE_WINDOW = 60  # minutes
+DEFAULT_COMPACT_ENTITIES = False
+DEFAULT_LONG_TERM_STATISTICS = True
+DEFAULT_PROBE_STALE_AFTER = 24  # hours, 0 disables
+DEFAULT_WRITE_MIN_INTERVAL = 30  # seconds
+DEFAULT_WRITE_MIN_DELTA = 0.5  # percent humidity
+DEFAULT_VALVE_MAX_CONCURRENT = 2
+DEFAULT_VALVE_FLOW_BUDGET = 0.0  # liters per minute, 0 disables
+DEFAULT_VALVE_DURATION = 5  # minutes
+DEFAULT_VALVE_FLOW = 1.0  # liters per minute
+
+# Plant storage backends
+STORAGE_BACKEND_STORE = "store"
+STORAGE_BACKEND_JOURNAL = "journal"
+DEFAULT_STORAGE_BACKEND = STORAGE_BACKEND_STORE
+
+# Per-plant entities whose values the water status entity carries in compact mode
+COMPACT_ENTITY_SUFFIXES = ("days_until_water", "last_watered", "humidity", "water_button")
+
+# Species catalog
+CATALOG_DB_FILE = ".storage/planty.catalog.db"
+CATALOG_EXTENSION_DIR = "planty/catalog"
+CATALOG_CACHE_SIZE = 256
+
+# Import and export files live here, outside the catalog extensions
+TRANSFER_DIR = "planty"
 
 # Services
 SERVICE_WATER_PLANT = "water_plant"
@@ -32,6 +85,23 @@ SERVICE_ADD_PLANT_TO_DASHBOARD = "add_plant_to_dashboard"
 SERVICE_REMOVE_PLANT_FROM_DASHBOARD = "remove_plant_from_dashboard"
 SERVICE_WATER_PLANT_CUSTOM_DATE = "water_plant_custom_date"
 SERVICE_UPDATE_PLANT_SETTINGS = "update_plant_settings"
+SERVICE_SEARCH_SPECIES = "search_species"
+SERVICE_RELOAD_CATALOG = "reload_catalog"
+SERVICE_IMPORT_PLANTS = "import_plants"
+SERVICE_EXPORT_PLANTS = "export_plants"
+SERVICE_GET_PLANTS = "get_plants"
+SERVICE_START_WATERING_RUN = "start_watering_run"
+SERVICE_STOP_WATERING_RUN = "stop_watering_run"
+
+# Events
+EVENT_PLANTS_NEED_WATER = f"{DOMAIN}_plants_need_water"
+EVENT_WATERING_RUN_FINISHED = f"{DOMAIN}_watering_run_finished"
+
+# Dispatcher signals, formatted with the plant id
+SIGNAL_STATUS_CHANGED = f"{DOMAIN}_status_changed_{{}}"
+SIGNAL_PLANT_WATERED = f"{DOMAIN}_plant_watered_{{}}"
+SIGNAL_PLANT_UPDATED = f"{DOMAIN}_plant_updated_{{}}"
+SIGNAL_HUMIDITY_UPDATED = f"{DOMAIN}_humidity_updated_{{}}"
 
 # Entity types
 SENSOR_TYPES = {
@@ -7,16 +7,22 @@ from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.storage import Store
+from homeassistant.util import slugify
 from homeassistant.components import frontend
 
 from .const import DOMAIN
+from .entries import entry_storage_prefix, is_original_entry
+from .rollup import GROUP_ALL
 
 _LOGGER = logging.getLogger(__name__)
 
 DASHBOARD_URL_PATH = "my-plants"
 DASHBOARD_TITLE = "My Plants"
 DASHBOARD_ICON = "mdi:leaf"
+# Above this many plants a single virtualized grid card replaces per plant cards
+DASHBOARD_GRID_THRESHOLD = 40
 
 
 class DashboardManager:
@@ -26,7 +32,14 @@ class DashboardManager:
         """Initialize the dashboard manager."""
         self.hass = hass
         self.entry = entry
-        self._store = Store(hass, 1, f"{DOMAIN}_dashboard")
+        self._store = Store(hass, 1, f"{entry_storage_prefix(entry)}_dashboard")
+        if is_original_entry(entry):
+            self.url_path = DASHBOARD_URL_PATH
+            self.title = DASHBOARD_TITLE
+        else:
+            # Every entry gets a dashboard of its own
+            self.url_path = f"{DASHBOARD_URL_PATH}-{slugify(entry.title)}"
+            self.title = f"{entry.title} Plants"
     
     async def async_create_dashboard(self) -> None:
         """Create and register the My Plants dashboard."""
@@ -67,8 +80,8 @@ class DashboardManager:
             # Remove from lovelace config if it exists
             if hasattr(self.hass.data, "lovelace"):
                 lovelace_config = self.hass.data.get("lovelace", {})
-                if DASHBOARD_URL_PATH in lovelace_config.get("dashboards", {}):
-                    del lovelace_config["dashboards"][DASHBOARD_URL_PATH]
+                if self.url_path in lovelace_config.get("dashboards", {}):
+                    del lovelace_config["dashboards"][self.url_path]
             
             _LOGGER.info("Removed My Plants dashboard")
         except Exception as err:
@@ -82,10 +95,14 @@ class DashboardManager:
         # Generate cards for each plant
         cards = []
         
-        # Add header card
+        # Add header card showing this entry's rollup of all plants
+        header_entity = er.async_get(self.hass).async_get_entity_id(
+            "sensor", DOMAIN, f"{DOMAIN}_{self.entry.entry_id}_rollup_{GROUP_ALL}"
+        )
         cards.append({
             "type": "custom:planty-header-card",
-            "title": "My Plants",
+            "entity": header_entity or "sensor.planty_all_plants",
+            "title": self.title,
             "subtitle": f"{len(plants)} plants tracked"
         })
         
@@ -94,8 +111,26 @@ class DashboardManager:
             "type": "custom:planty-settings-card"
         })
         
+        # Add one grid card for large collections
+        if len(plants) > DASHBOARD_GRID_THRESHOLD:
+            cards.append({
+                "type": "custom:planty-grid-card",
+                "plants": [
+                    {
+                        "plant_id": plant_id,
+                        "entity": f"sensor.planty_{plant_id}_water_status",
+                        "name": plant_config.get("name", plant_id),
+                        "plant_type": plant_config.get("type", "custom"),
+                    }
+                    for plant_id, plant_config in plants.items()
+                ],
+            })
+            plants_with_cards = {}
+        else:
+            plants_with_cards = plants
+        
         # Add plant cards
-        for plant_id, plant_config in plants.items():
+        for plant_id, plant_config in plants_with_cards.items():
             plant_name = plant_config.get("name", plant_id)
             plant_type = plant_config.get("type", "custom")
             watering_mode = plant_config.get("watering_mode", "manual")
@@ -121,8 +156,8 @@ class DashboardManager:
             })
         
         return {
-            "title": DASHBOARD_TITLE,
-            "path": DASHBOARD_URL_PATH,
+            "title": self.title,
+            "path": self.url_path,
             "icon": DASHBOARD_ICON,
             "show_in_sidebar": True,
             "cards": cards
@@ -172,14 +207,14 @@ class DashboardManager:
             frontend.async_register_built_in_panel(
                 self.hass,
                 "lovelace",
-                DASHBOARD_TITLE,
+                self.title,
                 DASHBOARD_ICON,
-                DASHBOARD_URL_PATH,
+                self.url_path,
                 {"mode": "yaml"},
                 require_admin=False,
-                sidebar_title=DASHBOARD_TITLE,
+                sidebar_title=self.title,
                 sidebar_icon=DASHBOARD_ICON,
-                url_path=DASHBOARD_URL_PATH
+                url_path=self.url_path
             )
             
         except Exception as err:
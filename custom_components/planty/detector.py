@@ -0,0 +1,150 @@
+"""Automatic watering detection for Planty integration."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .clock import get_clock
+from .const import (
+    CONF_DETECTION_DEDUPE_WINDOW,
+    CONF_DETECTION_THRESHOLD,
+    CONF_WATERING_DETECTION,
+    DEFAULT_DETECTION_DEDUPE_WINDOW,
+    DEFAULT_DETECTION_THRESHOLD,
+    DEFAULT_WATERING_DETECTION,
+)
+from .engine import PlantyEngine
+from .schedule import parse_timestamp
+
+_LOGGER = logging.getLogger(__name__)
+
+# Share of the threshold forgiven per sample, so slow drifts and sensor
+# noise bleed out of the accumulated rise instead of adding up to a watering
+DRIFT_FACTOR = 0.1
+
+
+class RiseDetector:
+    """One-sided CUSUM change-point detector for a humidity stream.
+
+    Each sample adds its rise over the previous sample, minus a small drift,
+    to a running sum that never drops below zero. A watering shows up as a
+    sharp rise over a few samples and pushes the sum past the threshold.
+    Every sample costs constant time and memory.
+    """
+
+    __slots__ = ("threshold", "drift", "_previous", "_sum")
+
+    def __init__(self, threshold: float) -> None:
+        """Initialize the detector."""
+        self.threshold = threshold
+        self.drift = threshold * DRIFT_FACTOR
+        self._previous: float | None = None
+        self._sum = 0.0
+
+    def add(self, value: float) -> bool:
+        """Feed a sample and return True when a sharp rise is detected."""
+        previous, self._previous = self._previous, value
+        if previous is None:
+            return False
+        self._sum = max(0.0, self._sum + value - previous - self.drift)
+        if self._sum < self.threshold:
+            return False
+        self._sum = 0.0
+        return True
+
+
+class WateringDetector:
+    """Record waterings of sensor mode plants from their humidity stream.
+
+    A detection is dropped when the plant was already recorded as watered
+    within the dedupe window, and waterings recorded as happening now are
+    dropped within the window after a detection, so pressing the water
+    button right before or after watering does not count twice.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        engine: PlantyEngine,
+        threshold: float,
+        dedupe_window: timedelta,
+    ) -> None:
+        """Initialize the detector."""
+        self.hass = hass
+        self.entry = entry
+        self._engine = engine
+        self._threshold = threshold
+        self._dedupe_window = dedupe_window
+        self._detectors: dict[str, RiseDetector] = {}
+        self._detected: dict[str, datetime] = {}
+
+    @callback
+    def recently_detected(self, plant_id: str) -> bool:
+        """Return True if a watering of the plant was detected within the window."""
+        detected = self._detected.get(plant_id)
+        return (
+            detected is not None
+            and get_clock(self.hass).utcnow() - detected < self._dedupe_window
+        )
+
+    @callback
+    def handle_sample(self, plant_id: str, humidity: float, when: datetime) -> None:
+        """Feed a humidity sample to the plant's detector."""
+        detector = self._detectors.get(plant_id)
+        if detector is None:
+            detector = self._detectors[plant_id] = RiseDetector(self._threshold)
+        if not detector.add(humidity):
+            return
+
+        last_watered = parse_timestamp(
+            self._engine.plants.get(plant_id, {}).get("last_watered")
+        )
+        if last_watered is not None and abs(when - last_watered) < self._dedupe_window:
+            _LOGGER.debug(
+                "Ignoring detected watering of %s, already recorded at %s",
+                plant_id,
+                last_watered,
+            )
+            return
+
+        _LOGGER.info("Detected watering of %s from its humidity sensor", plant_id)
+        self._detected[plant_id] = when
+        # Imported here to avoid a cycle with the integration module
+        from . import async_record_watering
+
+        self.entry.async_create_background_task(
+            self.hass,
+            async_record_watering(
+                self.hass,
+                self.entry.entry_id,
+                plant_id,
+                get_clock(self.hass).timestamp(when),
+            ),
+            f"planty record detected watering {plant_id}",
+        )
+
+
+async def async_setup_detector(
+    hass: HomeAssistant, entry: ConfigEntry, engine: PlantyEngine
+) -> WateringDetector | None:
+    """Set up watering detection if it is enabled."""
+    if not entry.options.get(CONF_WATERING_DETECTION, DEFAULT_WATERING_DETECTION):
+        return None
+
+    detector = WateringDetector(
+        hass,
+        entry,
+        engine,
+        entry.options.get(CONF_DETECTION_THRESHOLD, DEFAULT_DETECTION_THRESHOLD),
+        timedelta(
+            minutes=entry.options.get(
+                CONF_DETECTION_DEDUPE_WINDOW, DEFAULT_DETECTION_DEDUPE_WINDOW
+            )
+        ),
+    )
+    entry.async_on_unload(engine.async_add_sample_listener(detector.handle_sample))
+    return detector
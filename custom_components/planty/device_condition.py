@@ -0,0 +1,95 @@
+"""Device conditions for Planty integration."""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components.device_automation.exceptions import (
+    InvalidDeviceAutomationConfig,
+)
+from homeassistant.const import CONF_CONDITION, CONF_DEVICE_ID, CONF_DOMAIN, CONF_TYPE
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.condition import ConditionCheckerType
+from homeassistant.helpers.config_validation import DEVICE_CONDITION_BASE_SCHEMA
+from homeassistant.helpers.typing import ConfigType, TemplateVarsType
+
+from . import get_plant_for_device
+from .const import (
+    DOMAIN,
+    PLANT_STATUS_HEALTHY,
+    PLANT_STATUS_NEEDS_WATER,
+    PLANT_STATUS_OVERDUE,
+    WATERING_MODE_SENSOR,
+)
+
+CONDITION_NEEDS_WATER = "needs_water"
+CONDITION_OVERDUE = "overdue"
+CONDITION_HEALTHY = "healthy"
+CONDITION_HUMIDITY_BELOW_MIN = "humidity_below_min"
+
+CONDITION_STATUSES = {
+    CONDITION_NEEDS_WATER: PLANT_STATUS_NEEDS_WATER,
+    CONDITION_OVERDUE: PLANT_STATUS_OVERDUE,
+    CONDITION_HEALTHY: PLANT_STATUS_HEALTHY,
+}
+
+CONDITION_TYPES = {*CONDITION_STATUSES, CONDITION_HUMIDITY_BELOW_MIN}
+
+CONDITION_SCHEMA = DEVICE_CONDITION_BASE_SCHEMA.extend({
+    vol.Required(CONF_TYPE): vol.In(CONDITION_TYPES),
+})
+
+
+async def async_get_conditions(
+    hass: HomeAssistant, device_id: str
+) -> list[dict[str, Any]]:
+    """List the conditions of a Planty plant device."""
+    plant = get_plant_for_device(hass, device_id)
+    if plant is None:
+        return []
+    entry_id, plant_id = plant
+
+    condition_types = list(CONDITION_STATUSES)
+    entry_data = hass.data.get(DOMAIN, {}).get(entry_id)
+    if entry_data is not None:
+        plant_data = entry_data["engine"].plants.get(plant_id, {})
+        if plant_data.get("watering_mode") == WATERING_MODE_SENSOR:
+            condition_types.append(CONDITION_HUMIDITY_BELOW_MIN)
+
+    return [
+        {
+            CONF_CONDITION: "device",
+            CONF_DOMAIN: DOMAIN,
+            CONF_DEVICE_ID: device_id,
+            CONF_TYPE: condition_type,
+        }
+        for condition_type in condition_types
+    ]
+
+
+@callback
+def async_condition_from_config(
+    hass: HomeAssistant, config: ConfigType
+) -> ConditionCheckerType:
+    """Create a condition that reads the plant engine's current state."""
+    plant = get_plant_for_device(hass, config[CONF_DEVICE_ID])
+    if plant is None:
+        raise InvalidDeviceAutomationConfig(
+            f"Device {config[CONF_DEVICE_ID]} is not a Planty plant"
+        )
+    entry_id, plant_id = plant
+    condition_type = config[CONF_TYPE]
+
+    @callback
+    def test_is_state(hass: HomeAssistant, variables: TemplateVarsType) -> bool:
+        # The engine is looked up on every test so the condition survives reloads
+        entry_data = hass.data.get(DOMAIN, {}).get(entry_id)
+        if entry_data is None:
+            return False
+        engine = entry_data["engine"]
+        if condition_type == CONDITION_HUMIDITY_BELOW_MIN:
+            return engine.humidity_below_min(plant_id)
+        return engine.status(plant_id) == CONDITION_STATUSES[condition_type]
+
+    return test_is_state
@@ -0,0 +1,142 @@
+"""Device triggers for Planty integration."""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.components.device_automation.exceptions import (
+    InvalidDeviceAutomationConfig,
+)
+from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_PLATFORM, CONF_TYPE
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.typing import ConfigType
+
+from . import get_plant_for_device
+from .const import (
+    DOMAIN,
+    PLANT_STATUS_NEEDS_WATER,
+    PLANT_STATUS_OVERDUE,
+    SIGNAL_PLANT_WATERED,
+    SIGNAL_STATUS_CHANGED,
+    WATERING_MODE_SENSOR,
+)
+
+TRIGGER_NEEDS_WATER = "needs_water"
+TRIGGER_OVERDUE = "overdue"
+TRIGGER_WATERED = "watered"
+TRIGGER_HUMIDITY_BELOW_MIN = "humidity_below_min"
+
+TRIGGER_TYPES = {
+    TRIGGER_NEEDS_WATER,
+    TRIGGER_OVERDUE,
+    TRIGGER_WATERED,
+    TRIGGER_HUMIDITY_BELOW_MIN,
+}
+
+TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend({
+    vol.Required(CONF_TYPE): vol.In(TRIGGER_TYPES),
+})
+
+
+def _is_sensor_plant(hass: HomeAssistant, entry_id: str, plant_id: str) -> bool:
+    """Return True if a loaded plant is watered by humidity sensor."""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry_id)
+    if entry_data is None:
+        return False
+    plant_data = entry_data["storage"].data.get("plants", {}).get(plant_id, {})
+    return plant_data.get("watering_mode") == WATERING_MODE_SENSOR
+
+
+async def async_get_triggers(
+    hass: HomeAssistant, device_id: str
+) -> list[dict[str, Any]]:
+    """List the triggers of a Planty plant device."""
+    plant = get_plant_for_device(hass, device_id)
+    if plant is None:
+        return []
+
+    trigger_types = [TRIGGER_NEEDS_WATER, TRIGGER_OVERDUE, TRIGGER_WATERED]
+    if _is_sensor_plant(hass, *plant):
+        trigger_types.append(TRIGGER_HUMIDITY_BELOW_MIN)
+
+    return [
+        {
+            CONF_PLATFORM: "device",
+            CONF_DOMAIN: DOMAIN,
+            CONF_DEVICE_ID: device_id,
+            CONF_TYPE: trigger_type,
+        }
+        for trigger_type in trigger_types
+    ]
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Attach a trigger to the plant engine's transition detection."""
+    plant = get_plant_for_device(hass, config[CONF_DEVICE_ID])
+    if plant is None:
+        raise InvalidDeviceAutomationConfig(
+            f"Device {config[CONF_DEVICE_ID]} is not a Planty plant"
+        )
+    entry_id, plant_id = plant
+    trigger_type = config[CONF_TYPE]
+    job = HassJob(action, f"Planty device trigger {trigger_type}")
+
+    @callback
+    def fire(description: str, **extra: Any) -> None:
+        hass.async_run_hass_job(
+            job,
+            {
+                "trigger": {
+                    **trigger_info["trigger_data"],
+                    CONF_PLATFORM: "device",
+                    CONF_DOMAIN: DOMAIN,
+                    CONF_DEVICE_ID: config[CONF_DEVICE_ID],
+                    CONF_TYPE: trigger_type,
+                    "plant_id": plant_id,
+                    "description": description,
+                    **extra,
+                }
+            },
+        )
+
+    if trigger_type == TRIGGER_WATERED:
+
+        @callback
+        def handle_watered() -> None:
+            fire(f"{plant_id} watered")
+
+        return async_dispatcher_connect(
+            hass, SIGNAL_PLANT_WATERED.format(plant_id), handle_watered
+        )
+
+    @callback
+    def handle_transition(old_status: str | None, new_status: str) -> None:
+        if trigger_type == TRIGGER_NEEDS_WATER:
+            matched = new_status == PLANT_STATUS_NEEDS_WATER
+        elif trigger_type == TRIGGER_OVERDUE:
+            matched = new_status == PLANT_STATUS_OVERDUE
+        else:
+            # In sensor mode a plant needs water exactly when it is below
+            # its species minimum humidity
+            matched = new_status == PLANT_STATUS_NEEDS_WATER and _is_sensor_plant(
+                hass, entry_id, plant_id
+            )
+        if matched:
+            fire(
+                f"{plant_id} {old_status} to {new_status}",
+                from_status=old_status,
+                to_status=new_status,
+            )
+
+    return async_dispatcher_connect(
+        hass, SIGNAL_STATUS_CHANGED.format(plant_id), handle_transition
+    )
@@ -0,0 +1,126 @@
+"""Watering digests for Planty integration."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Callable
+
+from homeassistant.components import persistent_notification
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .clock import get_clock
+from .const import (
+    CONF_DIGEST_NOTIFICATION,
+    CONF_DIGEST_WINDOW,
+    DEFAULT_DIGEST_NOTIFICATION,
+    DEFAULT_DIGEST_WINDOW,
+    EVENT_PLANTS_NEED_WATER,
+    PLANT_STATUS_NEEDS_WATER,
+)
+from .engine import PlantyEngine
+from .entries import is_original_entry
+
+_LOGGER = logging.getLogger(__name__)
+
+DIGEST_NOTIFICATION_ID = "planty_plants_need_water"
+
+
+class WateringDigest:
+    """Coalesce plants crossing into needs_water into one event.
+
+    The first crossing opens a batching window. Every plant that crosses
+    before the window closes is reported in a single event, and plants that
+    are watered in the meantime are dropped from it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        engine: PlantyEngine,
+        window: float,
+        notify: bool,
+    ) -> None:
+        """Initialize the digest."""
+        self.hass = hass
+        self._engine = engine
+        self._clock = get_clock(hass)
+        self._window = window
+        self._notify = notify
+        self._pending: dict[str, None] = {}
+        self._unsub_flush: Callable[[], None] | None = None
+
+    @callback
+    def handle_transition(self, plant_id: str, old_status: str | None, new_status: str) -> None:
+        """Collect plants that start needing water."""
+        if new_status != PLANT_STATUS_NEEDS_WATER:
+            self._pending.pop(plant_id, None)
+            return
+
+        self._pending[plant_id] = None
+        if self._unsub_flush is None:
+            self._unsub_flush = self._clock.call_later(self.hass, self._window, self._flush)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop any pending digest."""
+        if self._unsub_flush:
+            self._unsub_flush()
+            self._unsub_flush = None
+        self._pending.clear()
+
+    @callback
+    def _flush(self, _now: datetime) -> None:
+        """Report the plants collected during the window."""
+        self._unsub_flush = None
+        if not self._pending:
+            return
+
+        plants = [
+            {
+                "plant_id": plant_id,
+                "name": self._engine.plants.get(plant_id, {}).get("name", plant_id),
+            }
+            for plant_id in self._pending
+        ]
+        self._pending.clear()
+
+        entry = self._engine.entry
+        self.hass.bus.async_fire(
+            EVENT_PLANTS_NEED_WATER,
+            {
+                "config_entry_id": entry.entry_id,
+                "count": len(plants),
+                "plant_ids": [plant["plant_id"] for plant in plants],
+                "plants": plants,
+            },
+        )
+        _LOGGER.debug("Reported %d plants needing water", len(plants))
+
+        if self._notify:
+            names = "\n".join(f"- {plant['name']}" for plant in plants)
+            persistent_notification.async_create(
+                self.hass,
+                f"These plants need water:\n\n{names}",
+                title=f"🌱 {len(plants)} plants need water"
+                if len(plants) > 1
+                else f"🌱 {plants[0]['name']} needs water",
+                notification_id=DIGEST_NOTIFICATION_ID
+                if is_original_entry(entry)
+                else f"{DIGEST_NOTIFICATION_ID}_{entry.entry_id}",
+            )
+
+
+async def async_setup_digest(
+    hass: HomeAssistant, entry: ConfigEntry, engine: PlantyEngine
+) -> WateringDigest:
+    """Set up watering digests for an entry."""
+    digest = WateringDigest(
+        hass,
+        engine,
+        entry.options.get(CONF_DIGEST_WINDOW, DEFAULT_DIGEST_WINDOW),
+        entry.options.get(CONF_DIGEST_NOTIFICATION, DEFAULT_DIGEST_NOTIFICATION),
+    )
+    entry.async_on_unload(engine.async_add_listener(digest.handle_transition))
+    entry.async_on_unload(digest.async_cancel)
+    return digest
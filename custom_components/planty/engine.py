@@ -0,0 +1,409 @@
+"""Plant status engine for Planty integration."""
+from __future__ import annotations
+
+import heapq
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .catalog import PlantCatalog
+from .clock import get_clock
+from .const import (
+    CONF_PROBE_STALE_AFTER,
+    DEFAULT_PROBE_STALE_AFTER,
+    DOMAIN,
+    OVERDUE_GRACE_DAYS,
+    PLANT_STATUS_HEALTHY,
+    PLANT_STATUS_NEEDS_WATER,
+    PLANT_STATUS_OVERDUE,
+    PLANT_STATUS_UNKNOWN,
+    SIGNAL_HUMIDITY_UPDATED,
+    SIGNAL_PLANT_UPDATED,
+    SIGNAL_PLANT_WATERED,
+    SIGNAL_STATUS_CHANGED,
+    WATERING_MODE_SENSOR,
+)
+from .fusion import FUSION_MEAN, ProbeFusion, plant_probes
+from .schedule import plant_due_date
+
+_LOGGER = logging.getLogger(__name__)
+
+StatusListener = Callable[[str, str | None, str], None]
+SampleListener = Callable[[str, float, datetime], None]
+
+
+def read_humidity(hass: HomeAssistant, entity_id: str | None) -> float | None:
+    """Return the numeric state of a humidity sensor."""
+    if not entity_id:
+        return None
+    state = hass.states.get(entity_id)
+    if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        return None
+    try:
+        return float(state.state)
+    except (ValueError, TypeError):
+        return None
+
+
+def compute_status(
+    plant_data: dict[str, Any],
+    humidity: float | None,
+    humidity_range: tuple[float, float],
+    now: datetime,
+) -> str:
+    """Return the watering status of a plant."""
+    if plant_data.get("watering_mode") == WATERING_MODE_SENSOR:
+        if humidity is None:
+            return PLANT_STATUS_UNKNOWN
+        humidity_min, humidity_max = humidity_range
+        if humidity < humidity_min:
+            return PLANT_STATUS_NEEDS_WATER
+        if humidity > humidity_max:
+            return PLANT_STATUS_OVERDUE  # Too wet
+        return PLANT_STATUS_HEALTHY
+
+    if not plant_data.get("last_watered"):
+        return PLANT_STATUS_NEEDS_WATER
+
+    due = plant_due_date(plant_data)
+    if due is None:
+        return PLANT_STATUS_UNKNOWN
+    next_watering = due[0]
+    if now >= next_watering + timedelta(days=OVERDUE_GRACE_DAYS):
+        return PLANT_STATUS_OVERDUE
+    if now >= next_watering:
+        return PLANT_STATUS_NEEDS_WATER
+    return PLANT_STATUS_HEALTHY
+
+
+def next_transition(
+    plant_data: dict[str, Any], now: datetime, fusion: ProbeFusion | None = None
+) -> datetime | None:
+    """Return when the status of a plant will next change without new readings."""
+    if plant_data.get("watering_mode") == WATERING_MODE_SENSOR:
+        # Sensor plants only change on their own when a probe goes stale
+        return fusion.next_stale(now) if fusion else None
+    if not plant_data.get("last_watered"):
+        return None
+    due = plant_due_date(plant_data)
+    if due is None:
+        return None
+    for boundary in (due[0], due[0] + timedelta(days=OVERDUE_GRACE_DAYS)):
+        if now < boundary:
+            return boundary
+    return None
+
+
+class PlantyEngine:
+    """Track the watering status of every plant and detect transitions.
+
+    Statuses are re-evaluated only for the plant that changed: when it is
+    watered or updated, when its humidity sensor reports, or when its timer
+    crosses a due date. Listeners are called once per actual transition.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        storage: Any,
+        catalog: PlantCatalog,
+    ) -> None:
+        """Initialize the engine."""
+        self.hass = hass
+        self.entry = entry
+        self._storage = storage
+        self._catalog = catalog
+        self._clock = get_clock(hass)
+        self._statuses: dict[str, str] = {}
+        self._sensor_plants: dict[str, set[str]] = {}
+        self._fusions: dict[str, ProbeFusion] = {}
+        stale_hours = entry.options.get(CONF_PROBE_STALE_AFTER, DEFAULT_PROBE_STALE_AFTER)
+        self._stale_after = timedelta(hours=stale_hours) if stale_hours else None
+        self._listeners: list[StatusListener] = []
+        self._sample_listeners: list[SampleListener] = []
+        self._plant_listeners: dict[str, list[Callable[[], None]]] = {}
+        self._timers: list[tuple[datetime, str]] = []
+        self._timer_at: dict[str, datetime] = {}
+        self._armed_at: datetime | None = None
+        self._unsub_timer: Callable[[], None] | None = None
+        self._unsub_sensors: Callable[[], None] | None = None
+
+    @property
+    def plants(self) -> dict[str, dict[str, Any]]:
+        """Return the stored plants."""
+        return self._storage.data.get("plants", {})
+
+    def status(self, plant_id: str) -> str:
+        """Return the current status of a plant."""
+        return self._statuses.get(plant_id, PLANT_STATUS_UNKNOWN)
+
+    @property
+    def statuses(self) -> dict[str, str]:
+        """Return the current status of every plant."""
+        return self._statuses
+
+    def humidity(self, plant_id: str) -> float | None:
+        """Return the fused humidity of a sensor mode plant."""
+        fusion = self._fusions.get(plant_id)
+        return fusion.value(self._clock.utcnow()) if fusion else None
+
+    def fresh_probes(self, plant_id: str) -> list[str]:
+        """Return the probes of a plant with a current reading."""
+        fusion = self._fusions.get(plant_id)
+        return list(fusion.fresh(self._clock.utcnow())) if fusion else []
+
+    def history_fusion(self, plant_id: str) -> ProbeFusion | None:
+        """Return an empty fusion configured like the plant's, to replay history."""
+        plant_data = self.plants.get(plant_id)
+        probes = plant_probes(plant_data) if plant_data else []
+        if not probes:
+            return None
+        return ProbeFusion(
+            probes,
+            plant_data.get("humidity_fusion", FUSION_MEAN),
+            plant_data.get("humidity_weights"),
+            self._stale_after,
+        )
+
+    def humidity_margin(self, plant_id: str) -> float | None:
+        """Return how far a sensor mode plant is above its species minimum."""
+        plant_data = self.plants.get(plant_id)
+        if not plant_data or plant_data.get("watering_mode") != WATERING_MODE_SENSOR:
+            return None
+        humidity = self.humidity(plant_id)
+        if humidity is None:
+            return None
+        humidity_min, _ = self._catalog.humidity_range(plant_data.get("type"))
+        return humidity - humidity_min
+
+    def humidity_below_min(self, plant_id: str) -> bool:
+        """Return True if a sensor mode plant is below its species minimum."""
+        margin = self.humidity_margin(plant_id)
+        return margin is not None and margin < 0
+
+    async def async_start(self) -> None:
+        """Evaluate every plant and start tracking changes."""
+        self._track_sensors()
+        for plant_id in self.plants:
+            self._evaluate(plant_id, notify=False)
+
+        for event_type in (f"{DOMAIN}_plant_watered", f"{DOMAIN}_plant_updated"):
+            self.entry.async_on_unload(
+                self.hass.bus.async_listen(event_type, self._handle_plant_event)
+            )
+        self.entry.async_on_unload(self._async_stop)
+
+    @callback
+    def async_add_listener(self, listener: StatusListener) -> Callable[[], None]:
+        """Listen for status transitions of any plant."""
+        self._listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def async_add_sample_listener(self, listener: SampleListener) -> Callable[[], None]:
+        """Listen for humidity samples of sensor mode plants."""
+        self._sample_listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            self._sample_listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def async_add_plant_listener(
+        self, plant_id: str, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Listen for status transitions of one plant."""
+        listeners = self._plant_listeners.setdefault(plant_id, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop tracking."""
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if self._unsub_sensors:
+            self._unsub_sensors()
+            self._unsub_sensors = None
+
+    def _track_sensors(self) -> None:
+        """Track the humidity probes of sensor mode plants."""
+        sensor_plants: dict[str, set[str]] = {}
+        fusions: dict[str, ProbeFusion] = {}
+        for plant_id, plant_data in self.plants.items():
+            probes = plant_probes(plant_data)
+            if plant_data.get("watering_mode") != WATERING_MODE_SENSOR or not probes:
+                continue
+            for probe in probes:
+                sensor_plants.setdefault(probe, set()).add(plant_id)
+            fusions[plant_id] = self._fusion_for(plant_id, plant_data, probes)
+        self._fusions = fusions
+
+        if sensor_plants.keys() == self._sensor_plants.keys():
+            self._sensor_plants = sensor_plants
+            return
+
+        self._sensor_plants = sensor_plants
+        if self._unsub_sensors:
+            self._unsub_sensors()
+            self._unsub_sensors = None
+        if sensor_plants:
+            self._unsub_sensors = async_track_state_change_event(
+                self.hass, list(sensor_plants), self._handle_sensor_change
+            )
+
+    def _fusion_for(
+        self, plant_id: str, plant_data: dict[str, Any], probes: list[str]
+    ) -> ProbeFusion:
+        """Return the fusion of a plant, reusing it while its config holds."""
+        strategy = plant_data.get("humidity_fusion", FUSION_MEAN)
+        weights = plant_data.get("humidity_weights")
+        fusion = self._fusions.get(plant_id)
+        if (
+            fusion is not None
+            and fusion.probes == probes
+            and fusion.strategy == strategy
+            and fusion.weights == (weights or {})
+        ):
+            return fusion
+
+        fusion = ProbeFusion(probes, strategy, weights, self._stale_after)
+        for probe in probes:
+            state = self.hass.states.get(probe)
+            if state is not None:
+                fusion.update(
+                    probe,
+                    read_humidity(self.hass, probe),
+                    getattr(state, "last_reported", state.last_updated),
+                )
+        return fusion
+
+    @callback
+    def _handle_plant_event(self, event: Event) -> None:
+        """Handle a plant being watered or updated."""
+        plant_id = event.data.get("plant_id")
+        if not plant_id or (plant_id not in self.plants and plant_id not in self._statuses):
+            # A plant of another entry
+            return
+        if event.event_type == f"{DOMAIN}_plant_updated":
+            self._track_sensors()
+        self._evaluate(plant_id)
+        # Entities subscribe per plant instead of filtering every bus event
+        if event.event_type == f"{DOMAIN}_plant_watered":
+            async_dispatcher_send(self.hass, SIGNAL_PLANT_WATERED.format(plant_id))
+        else:
+            async_dispatcher_send(self.hass, SIGNAL_PLANT_UPDATED.format(plant_id))
+
+    @callback
+    def _handle_sensor_change(self, event: Event) -> None:
+        """Handle a humidity probe report."""
+        probe = event.data["entity_id"]
+        plant_ids = self._sensor_plants.get(probe, ())
+        value = read_humidity(self.hass, probe)
+        when = self._clock.utcnow()
+        for plant_id in plant_ids:
+            fusion = self._fusions[plant_id]
+            # Only this probe's reading changes, the others are kept
+            fusion.update(probe, value, when)
+            if self._sample_listeners and value is not None:
+                humidity = fusion.value(when)
+                if humidity is not None:
+                    for listener in list(self._sample_listeners):
+                        listener(plant_id, humidity, when)
+            self._evaluate(plant_id)
+            async_dispatcher_send(self.hass, SIGNAL_HUMIDITY_UPDATED.format(plant_id))
+
+    @callback
+    def _handle_timer(self, now: datetime) -> None:
+        """Re-evaluate the plants whose timer expired."""
+        self._unsub_timer = None
+        self._armed_at = None
+        while self._timers and self._timers[0][0] <= now:
+            when, plant_id = heapq.heappop(self._timers)
+            if self._timer_at.get(plant_id) == when:
+                del self._timer_at[plant_id]
+                self._evaluate(plant_id)
+        self._schedule_timer()
+
+    def _schedule_timer(self) -> None:
+        """Arm the timer for the earliest pending transition."""
+        # Drop stale heap entries left behind by rescheduled plants
+        while self._timers and self._timer_at.get(self._timers[0][1]) != self._timers[0][0]:
+            heapq.heappop(self._timers)
+
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._armed_at = self._timers[0][0] if self._timers else None
+        if self._armed_at is not None:
+            self._unsub_timer = self._clock.call_at(
+                self.hass, self._armed_at, self._handle_timer
+            )
+
+    def _evaluate(self, plant_id: str, notify: bool = True) -> None:
+        """Recompute the status of a plant and notify on transitions."""
+        plant_data = self.plants.get(plant_id)
+        now = self._clock.utcnow()
+
+        if plant_data is None:
+            new_status = None
+            self._timer_at.pop(plant_id, None)
+        else:
+            humidity = self.humidity(plant_id)
+            new_status = compute_status(
+                plant_data,
+                humidity,
+                self._catalog.humidity_range(plant_data.get("type")),
+                now,
+            )
+            when = next_transition(plant_data, now, self._fusions.get(plant_id))
+            if when != self._timer_at.get(plant_id):
+                if when is None:
+                    self._timer_at.pop(plant_id, None)
+                else:
+                    self._timer_at[plant_id] = when
+                    heapq.heappush(self._timers, (when, plant_id))
+                    if self._armed_at is None or when < self._armed_at:
+                        self._schedule_timer()
+
+        old_status = self._statuses.get(plant_id)
+        if new_status == old_status:
+            return
+
+        if new_status is None:
+            del self._statuses[plant_id]
+            return
+        self._statuses[plant_id] = new_status
+
+        if not notify:
+            return
+
+        _LOGGER.debug("Plant %s changed from %s to %s", plant_id, old_status, new_status)
+        for listener in list(self._listeners):
+            listener(plant_id, old_status, new_status)
+        for update_callback in list(self._plant_listeners.get(plant_id, ())):
+            update_callback()
+        # Device triggers outlive reloads, so they listen on the dispatcher
+        async_dispatcher_send(
+            self.hass, SIGNAL_STATUS_CHANGED.format(plant_id), old_status, new_status
+        )
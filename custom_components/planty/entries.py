@@ -0,0 +1,28 @@
+"""Config entry helpers for Planty integration."""
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+
+from .const import DEFAULT_NAME, DOMAIN
+
+
+def is_original_entry(entry: ConfigEntry) -> bool:
+    """Return True for the entry set up before several entries were supported.
+
+    It keeps its storage keys and entity names so nothing moves on upgrade.
+    """
+    return entry.unique_id == DOMAIN
+
+
+def entry_storage_prefix(entry: ConfigEntry) -> str:
+    """Return the prefix of the storage keys and files of an entry."""
+    if is_original_entry(entry):
+        return DOMAIN
+    return f"{DOMAIN}.{entry.entry_id}"
+
+
+def entry_name(entry: ConfigEntry) -> str:
+    """Return the name entry wide entities and the dashboard start with."""
+    if is_original_entry(entry):
+        return DEFAULT_NAME
+    return entry.title
@@ -0,0 +1,94 @@
+"""Multi-probe humidity fusion for Planty integration."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from statistics import median
+from typing import Any
+
+FUSION_MEAN = "mean"
+FUSION_MEDIAN = "median"
+FUSION_MIN = "min"
+FUSION_WEIGHTED = "weighted"
+FUSION_STRATEGIES = [FUSION_MEAN, FUSION_MEDIAN, FUSION_MIN, FUSION_WEIGHTED]
+
+
+def plant_probes(plant_data: dict[str, Any]) -> list[str]:
+    """Return the humidity sensors of a plant as a list."""
+    sensors = plant_data.get("humidity_sensor")
+    if not sensors:
+        return []
+    if isinstance(sensors, str):
+        return [sensors]
+    return list(sensors)
+
+
+class ProbeFusion:
+    """Fused humidity of one plant from the latest reading of each probe.
+
+    Each probe update replaces only that probe's reading. Readings older
+    than the staleness limit, and probes that went unavailable, are left
+    out, so one dead probe does not take down the whole plant.
+    """
+
+    def __init__(
+        self,
+        probes: list[str],
+        strategy: str = FUSION_MEAN,
+        weights: dict[str, float] | None = None,
+        stale_after: timedelta | None = None,
+    ) -> None:
+        """Initialize the fusion without readings."""
+        self.probes = probes
+        self.strategy = strategy
+        self.weights = weights or {}
+        self._stale_after = stale_after
+        self._readings: dict[str, tuple[float, datetime]] = {}
+
+    def update(self, probe: str, value: float | None, when: datetime) -> None:
+        """Record a probe reading, or drop it when the probe has no value."""
+        if value is None:
+            self._readings.pop(probe, None)
+        else:
+            self._readings[probe] = (value, when)
+
+    def fresh(self, now: datetime) -> dict[str, float]:
+        """Return the readings that are not stale."""
+        if self._stale_after is None:
+            return {probe: value for probe, (value, _) in self._readings.items()}
+        oldest = now - self._stale_after
+        return {
+            probe: value
+            for probe, (value, when) in self._readings.items()
+            if when >= oldest
+        }
+
+    def value(self, now: datetime) -> float | None:
+        """Return the fused humidity of the fresh readings."""
+        readings = self.fresh(now)
+        if not readings:
+            return None
+        if len(readings) == 1:
+            return next(iter(readings.values()))
+        if self.strategy == FUSION_MEDIAN:
+            return median(readings.values())
+        if self.strategy == FUSION_MIN:
+            return min(readings.values())
+        if self.strategy == FUSION_WEIGHTED:
+            total_weight = sum(self.weights.get(probe, 1.0) for probe in readings)
+            if total_weight > 0:
+                return (
+                    sum(value * self.weights.get(probe, 1.0) for probe, value in readings.items())
+                    / total_weight
+                )
+        return sum(readings.values()) / len(readings)
+
+    def next_stale(self, now: datetime) -> datetime | None:
+        """Return when the next fresh reading goes stale."""
+        if self._stale_after is None:
+            return None
+        expiries = [
+            when + self._stale_after
+            for _, when in self._readings.values()
+            if when + self._stale_after > now
+        ]
+        return min(expiries) if expiries else None
@@ -0,0 +1,204 @@
+"""Downsampled humidity history for Planty integration."""
+from __future__ import annotations
+
+import heapq
+import logging
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.recorder import get_instance, history
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant, State
+from homeassistant.util import dt as dt_util
+
+from .clock import get_clock
+from .fusion import ProbeFusion
+
+_LOGGER = logging.getLogger(__name__)
+
+HISTORY_CACHE_SIZE = 512
+HISTORY_CACHE_TTL = 300  # seconds
+
+Point = tuple[float, float]
+
+
+def lttb(points: list[Point], threshold: int) -> list[Point]:
+    """Downsample a series with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last point and, from each bucket in between, the
+    point forming the largest triangle with the previously kept point and
+    the average of the next bucket, which preserves peaks and dips.
+    """
+    if threshold >= len(points) or threshold < 3:
+        return points
+
+    sampled = [points[0]]
+    every = (len(points) - 2) / (threshold - 2)
+    kept = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        next_end = min(int((bucket + 2) * every) + 1, len(points))
+
+        next_bucket = points[end:next_end] or points[-1:]
+        avg_x = sum(point[0] for point in next_bucket) / len(next_bucket)
+        avg_y = sum(point[1] for point in next_bucket) / len(next_bucket)
+
+        kept_x, kept_y = points[kept]
+        best_area = -1.0
+        best = start
+        for index in range(start, end):
+            x, y = points[index]
+            area = abs((kept_x - avg_x) * (y - kept_y) - (kept_x - x) * (avg_y - kept_y))
+            if area > best_area:
+                best_area = area
+                best = index
+        sampled.append(points[best])
+        kept = best
+
+    sampled.append(points[-1])
+    return sampled
+
+
+class HistoryCache:
+    """Short lived LRU cache of downsampled series.
+
+    Windows end on a multiple of the TTL, so every card asking for the same
+    plant and window within that period shares one entry.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        size: int = HISTORY_CACHE_SIZE,
+        ttl: float = HISTORY_CACHE_TTL,
+    ) -> None:
+        """Initialize the cache."""
+        self._clock = get_clock(hass)
+        self._size = size
+        self._ttl = ttl
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, list[Point]]] = OrderedDict()
+
+    def get(self, key: tuple[Any, ...]) -> list[Point] | None:
+        """Return a cached series that has not expired."""
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+        if cached[0] < self._clock.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return cached[1]
+
+    def set(self, key: tuple[Any, ...], series: list[Point]) -> None:
+        """Cache a series, evicting the least recently used entries."""
+        self._entries[key] = (self._clock.monotonic() + self._ttl, series)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._size:
+            self._entries.popitem(last=False)
+
+    def window_end(self) -> float:
+        """Return the end of the current shared window as a timestamp."""
+        now = self._clock.utcnow().timestamp()
+        return now - now % self._ttl + self._ttl
+
+
+def _to_sample(state: State | dict[str, Any]) -> tuple[float, float | None]:
+    """Convert a recorder row to a timestamp and value, None when unavailable."""
+    if isinstance(state, State):
+        value, changed = state.state, state.last_changed.timestamp()
+    else:
+        value = state["state"]
+        changed = dt_util.parse_datetime(state["last_changed"]).timestamp()
+    if value in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        return changed, None
+    try:
+        return changed, float(value)
+    except (ValueError, TypeError):
+        return changed, None
+
+
+def _fused_points(
+    fusion: ProbeFusion, states: dict[str, list[State | dict[str, Any]]]
+) -> list[Point]:
+    """Replay the probe histories of a plant through its fusion.
+
+    Every probe report yields a point with the fused value at that time, as
+    the engine computes it live. A single probe is passed through as is.
+    """
+    if len(fusion.probes) == 1:
+        samples = map(_to_sample, states.get(fusion.probes[0], ()))
+        return [(when, value) for when, value in samples if value is not None]
+
+    reports = heapq.merge(
+        *(
+            [(when, probe, value) for when, value in map(_to_sample, states.get(probe, ()))]
+            for probe in fusion.probes
+        ),
+        key=lambda report: report[0],
+    )
+    points: list[Point] = []
+    for when, probe, value in reports:
+        reported = dt_util.utc_from_timestamp(when)
+        fusion.update(probe, value, reported)
+        fused = fusion.value(reported)
+        if fused is not None:
+            points.append((when, fused))
+    return points
+
+
+async def async_get_humidity_series(
+    hass: HomeAssistant,
+    cache: HistoryCache,
+    fusions: dict[str, ProbeFusion],
+    hours: int,
+    points: int,
+) -> dict[str, list[Point]]:
+    """Return downsampled humidity series keyed by plant id.
+
+    Plants with several probes get the history of their fused humidity.
+    Plants missing from the cache are loaded from the recorder in a single
+    query for all their probes.
+    """
+    end = cache.window_end()
+    series: dict[str, list[Point]] = {}
+    missing: dict[str, tuple[Any, ...]] = {}
+    for plant_id, fusion in fusions.items():
+        key = (plant_id, tuple(fusion.probes), fusion.strategy, hours, points, end)
+        cached = cache.get(key)
+        if cached is None:
+            missing[plant_id] = key
+        else:
+            series[plant_id] = cached
+
+    if not missing:
+        return series
+
+    end_time = dt_util.utc_from_timestamp(end)
+    started = time.monotonic()
+    states = await get_instance(hass).async_add_executor_job(
+        history.get_significant_states,
+        hass,
+        end_time - timedelta(hours=hours),
+        end_time,
+        list({probe for plant_id in missing for probe in fusions[plant_id].probes}),
+        None,
+        True,  # include_start_time_state
+        False,  # significant_changes_only
+        True,  # minimal_response
+        True,  # no_attributes
+    )
+
+    for plant_id, key in missing.items():
+        downsampled = lttb(_fused_points(fusions[plant_id], states), points)
+        cache.set(key, downsampled)
+        series[plant_id] = downsampled
+
+    _LOGGER.debug(
+        "Loaded humidity history of %d plants in %.1f ms",
+        len(missing),
+        (time.monotonic() - started) * 1000,
+    )
+    return series
@@ -1,8 +1,11 @@
 """Image handling for Planty integration."""
 from __future__ import annotations
 
+import hashlib
 import os
 import logging
+from collections import OrderedDict
+from functools import partial
 from typing import Any
 
 from homeassistant.core import HomeAssistant
@@ -11,6 +14,45 @@ from PIL import Image
 
 _LOGGER = logging.getLogger(__name__)
 
+IMAGE_URL = "/api/planty/images/{}"
+IMAGE_CACHE_BYTES = 16 * 1024 * 1024
+
+
+class ImageCache:
+    """In-memory LRU of processed images bounded by their total size."""
+
+    def __init__(self, max_bytes: int = IMAGE_CACHE_BYTES) -> None:
+        """Initialize the cache."""
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._entries: OrderedDict[str, tuple[bytes, str]] = OrderedDict()
+
+    def get(self, plant_id: str) -> tuple[bytes, str] | None:
+        """Return the image and ETag of a plant."""
+        entry = self._entries.get(plant_id)
+        if entry is not None:
+            self._entries.move_to_end(plant_id)
+        return entry
+
+    def set(self, plant_id: str, data: bytes) -> tuple[bytes, str]:
+        """Cache an image and return it with its strong ETag."""
+        self.evict(plant_id)
+        entry = (data, f'"{hashlib.sha256(data).hexdigest()[:32]}"')
+        if len(data) > self._max_bytes:
+            return entry
+        self._entries[plant_id] = entry
+        self._bytes += len(data)
+        while self._bytes > self._max_bytes:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+        return entry
+
+    def evict(self, plant_id: str) -> None:
+        """Drop the cached image of a plant."""
+        entry = self._entries.pop(plant_id, None)
+        if entry is not None:
+            self._bytes -= len(entry[0])
+
 
 class ImageHandler:
     """Handle plant image operations."""
@@ -20,8 +62,29 @@ class ImageHandler:
         self.hass = hass
         self.www_path = os.path.join(hass.config.config_dir, "www", "planty")
         
-        # Ensure directory exists
-        os.makedirs(self.www_path, exist_ok=True)
+        self.cache = ImageCache()
+    
+    def image_file(self, plant_id: str) -> str:
+        """Return the path of a plant's processed image."""
+        return os.path.join(self.www_path, f"{plant_id}.jpg")
+    
+    async def async_get_image(self, plant_id: str) -> tuple[bytes, str] | None:
+        """Return a plant's image and ETag, reading it from disk on a miss."""
+        cached = self.cache.get(plant_id)
+        if cached is not None:
+            return cached
+        
+        def read() -> bytes | None:
+            try:
+                with open(self.image_file(plant_id), "rb") as image_file:
+                    return image_file.read()
+            except FileNotFoundError:
+                return None
+        
+        data = await self.hass.async_add_executor_job(read)
+        if data is None:
+            return None
+        return self.cache.set(plant_id, data)
     
     async def process_image(self, image_path: str, plant_id: str) -> str | None:
         """Process and save plant image."""
@@ -46,12 +109,13 @@ class ImageHandler:
                         img = square_img
                     
                     # Save processed image
-                    output_path = os.path.join(self.www_path, f"{plant_id}.jpg")
-                    img.save(output_path, "JPEG", quality=85, optimize=True)
+                    img.save(self.image_file(plant_id), "JPEG", quality=85, optimize=True)
                     
-                    return f"/local/planty/{plant_id}.jpg"
+                    return IMAGE_URL.format(plant_id)
             
-            return await self.hass.async_add_executor_job(process)
+            url = await self.hass.async_add_executor_job(process)
+            self.cache.evict(plant_id)
+            return url
             
         except Exception as err:
             _LOGGER.error("Failed to process image for plant %s: %s", plant_id, err)
@@ -60,4 +124,10 @@ class ImageHandler:
 
 async def async_setup_image_handler(hass: HomeAssistant) -> ImageHandler:
     """Set up the image handler."""
-    return ImageHandler(hass)
+    image_handler = ImageHandler(hass)
+    
+    # Ensure directory exists
+    await hass.async_add_executor_job(
+        partial(os.makedirs, image_handler.www_path, exist_ok=True)
+    )
+    return image_handler
@@ -0,0 +1,424 @@
+"""Valve watering runs for Planty integration."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .clock import get_clock
+from .const import (
+    CONF_VALVE_FLOW_BUDGET,
+    CONF_VALVE_MAX_CONCURRENT,
+    DEFAULT_VALVE_DURATION,
+    DEFAULT_VALVE_FLOW,
+    DEFAULT_VALVE_FLOW_BUDGET,
+    DEFAULT_VALVE_MAX_CONCURRENT,
+    EVENT_WATERING_RUN_FINISHED,
+    PLANT_STATUS_NEEDS_WATER,
+    PLANT_STATUS_OVERDUE,
+    WATERING_MODE_SENSOR,
+)
+from .engine import PlantyEngine
+from .schedule import WateringSchedule
+
+_LOGGER = logging.getLogger(__name__)
+
+# Overdue plants go first, then the ones needing water, then the rest
+STATUS_RANKS = {PLANT_STATUS_OVERDUE: 0, PLANT_STATUS_NEEDS_WATER: 1}
+DRY_RANK = STATUS_RANKS[PLANT_STATUS_NEEDS_WATER]
+OTHER_RANK = 2
+
+
+class ValveJob:
+    """One valve opened for a while to water the plants behind it."""
+
+    def __init__(
+        self,
+        valve: str,
+        plant_ids: list[str],
+        duration: float,
+        flow: float,
+        rank: int,
+        due: float,
+        margin: float = 0.0,
+    ) -> None:
+        """Initialize the job with its duration in seconds and flow in L/min.
+
+        Timer plants are ordered by their due time, sensor plants by how far
+        their soil is above the species minimum.
+        """
+        self.valve = valve
+        self.plant_ids = plant_ids
+        self.duration = duration
+        self.flow = flow
+        self.rank = rank
+        self.due = due
+        self.margin = margin
+
+    @property
+    def sort_key(self) -> tuple[int, float, float, str]:
+        """Return the key ordering jobs by urgency."""
+        return (self.rank, self.due, self.margin, self.valve)
+
+
+def build_jobs(
+    plants: dict[str, dict[str, Any]],
+    plant_ids: list[str],
+    rank: Callable[[str], int],
+    due: Callable[[str], float],
+    margin: Callable[[str], float] = lambda plant_id: 0.0,
+) -> list[ValveJob]:
+    """Group plants by valve into jobs, most urgent first.
+
+    Plants sharing a valve are watered by one opening, as long as the
+    longest of their durations and at the largest of their flows.
+    """
+    jobs: dict[str, ValveJob] = {}
+    for plant_id in plant_ids:
+        plant = plants[plant_id]
+        duration = plant.get("valve_duration", DEFAULT_VALVE_DURATION) * 60
+        flow = plant.get("valve_flow", DEFAULT_VALVE_FLOW)
+        job = ValveJob(
+            plant["valve"],
+            [plant_id],
+            duration,
+            flow,
+            rank(plant_id),
+            due(plant_id),
+            margin(plant_id),
+        )
+        if job.valve in jobs:
+            merge_job(jobs[job.valve], job)
+        else:
+            jobs[job.valve] = job
+    return sorted(jobs.values(), key=lambda job: job.sort_key)
+
+
+def merge_job(job: ValveJob, other: ValveJob) -> None:
+    """Fold another job on the same valve into a job."""
+    job.plant_ids.extend(
+        plant_id for plant_id in other.plant_ids if plant_id not in job.plant_ids
+    )
+    job.duration = max(job.duration, other.duration)
+    job.flow = max(job.flow, other.flow)
+    job.rank = min(job.rank, other.rank)
+    job.due = min(job.due, other.due)
+    job.margin = min(job.margin, other.margin)
+
+
+def next_job(
+    queue: list[ValveJob],
+    running: list[ValveJob],
+    max_concurrent: int,
+    flow_budget: float,
+) -> ValveJob | None:
+    """Return the first queued job that fits next to the running ones.
+
+    A job may only be passed over by jobs of the same rank, so a large
+    overdue valve waiting for flow is not starved by plants that can wait.
+    A valve needing more than the whole budget runs on its own.
+    """
+    if len(running) >= max_concurrent:
+        return None
+    flow = sum(job.flow for job in running)
+    blocked_rank: int | None = None
+    for job in queue:
+        if blocked_rank is not None and job.rank > blocked_rank:
+            return None
+        if not flow_budget or not running or flow + job.flow <= flow_budget:
+            return job
+        if blocked_rank is None:
+            blocked_rank = job.rank
+    return None
+
+
+def estimate_duration(
+    jobs: list[ValveJob], max_concurrent: int, flow_budget: float
+) -> float:
+    """Return how long a run of the jobs takes, in seconds."""
+    queue = sorted(jobs, key=lambda job: job.sort_key)
+    running: list[tuple[float, int, ValveJob]] = []
+    now = 0.0
+    while queue or running:
+        while job := next_job(
+            queue, [item[2] for item in running], max_concurrent, flow_budget
+        ):
+            queue.remove(job)
+            heapq.heappush(running, (now + job.duration, id(job), job))
+        now, _, _ = heapq.heappop(running)
+    return now
+
+
+class IrrigationScheduler:
+    """Run the valves of an entry's plants within the pump's limits.
+
+    Queued valves open as soon as there is room under the concurrency
+    limit and the flow budget. Each valve closes after its duration and
+    its plants are recorded as watered, then the next valves open.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        engine: PlantyEngine,
+        schedule: WateringSchedule,
+        max_concurrent: int,
+        flow_budget: float,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.entry = entry
+        self._engine = engine
+        self._schedule = schedule
+        self._clock = get_clock(hass)
+        self._max_concurrent = max_concurrent
+        self._flow_budget = flow_budget
+        self._queue: list[ValveJob] = []
+        # Valves being opened have no close timer yet
+        self._running: dict[str, tuple[ValveJob, Callable[[], None] | None]] = {}
+        self._started: datetime | None = None
+        self._watered: list[str] = []
+        self._failed: list[str] = []
+        self._valves = 0
+        self._peak = 0
+        self.last_run: dict[str, Any] | None = None
+
+    @property
+    def active(self) -> bool:
+        """Return whether a run is in progress."""
+        return self._started is not None
+
+    def _rank(self, plant_id: str) -> int:
+        """Return the priority rank of a plant."""
+        if self._engine.plants[plant_id].get("watering_mode") == WATERING_MODE_SENSOR:
+            # Overdue means too wet in sensor mode, only dry soil is urgent
+            return DRY_RANK if self._engine.humidity_below_min(plant_id) else OTHER_RANK
+        return STATUS_RANKS.get(self._engine.status(plant_id), OTHER_RANK)
+
+    def _due(self, plant_id: str) -> float:
+        """Return when a plant is due as a timestamp, unscheduled plants last."""
+        due = self._schedule.get(plant_id)
+        return due.timestamp() if due is not None else float("inf")
+
+    def _margin(self, plant_id: str) -> float:
+        """Return how far a sensor plant is above its minimum, driest first."""
+        margin = self._engine.humidity_margin(plant_id)
+        return margin if margin is not None else 0.0
+
+    async def async_start(self, plant_ids: list[str] | None = None) -> dict[str, Any]:
+        """Queue plants for watering, by default every valve plant needing water.
+
+        Plants joining a run in progress are merged into its queue.
+        """
+        plants = self._engine.plants
+        if plant_ids is None:
+            plant_ids = [
+                plant_id
+                for plant_id, plant in plants.items()
+                if plant.get("valve") and self._rank(plant_id) < OTHER_RANK
+            ]
+        skipped = [plant_id for plant_id in plant_ids if not plants[plant_id].get("valve")]
+        jobs = build_jobs(
+            plants,
+            [plant_id for plant_id in plant_ids if plant_id not in skipped],
+            self._rank,
+            self._due,
+            self._margin,
+        )
+
+        if jobs and not self.active:
+            self._started = self._clock.utcnow()
+            self._watered, self._failed = [], []
+            self._valves = self._peak = 0
+        queued = {job.valve: job for job in self._queue}
+        added = []
+        for job in jobs:
+            if job.valve in self._running:
+                # The valve is open, plants it is not watering wait for the next run
+                watering = self._running[job.valve][0].plant_ids
+                skipped.extend(
+                    plant_id for plant_id in job.plant_ids if plant_id not in watering
+                )
+            elif job.valve in queued:
+                merge_job(queued[job.valve], job)
+                added.append(job)
+            else:
+                self._queue.append(job)
+                self._valves += 1
+                added.append(job)
+        self._queue.sort(key=lambda job: job.sort_key)
+
+        plan = {
+            "plant_ids": [plant_id for job in added for plant_id in job.plant_ids],
+            "skipped": skipped,
+            "valves": [job.valve for job in added],
+            "estimated_duration": round(
+                estimate_duration(self._jobs(), self._max_concurrent, self._flow_budget)
+            ),
+        }
+        if skipped:
+            _LOGGER.warning("Skipped watering %s", ", ".join(skipped))
+        await self._async_fill()
+        return plan
+
+    def _jobs(self) -> list[ValveJob]:
+        """Return the running and queued jobs."""
+        return [job for job, _ in self._running.values()] + self._queue
+
+    async def async_stop(self) -> None:
+        """Close every open valve and drop the queue.
+
+        Plants whose valve was cut short are not recorded as watered.
+        """
+        if not self.active:
+            return
+        self._queue.clear()
+        running = list(self._running.values())
+        self._running.clear()
+        for job, cancel in running:
+            if cancel is not None:
+                cancel()
+            self._failed.extend(job.plant_ids)
+        self._finish_run(stopped=True)
+        await asyncio.gather(*(self._async_close(job) for job, _ in running))
+
+    async def _async_fill(self) -> None:
+        """Open queued valves while there is room for them.
+
+        A valve takes its place among the running ones before the service
+        call opening it, so concurrent fills never exceed the limits and a
+        slow valve does not hold up the others or a stop.
+        """
+        while (
+            job := next_job(
+                self._queue,
+                [job for job, _ in self._running.values()],
+                self._max_concurrent,
+                self._flow_budget,
+            )
+        ):
+            self._queue.remove(job)
+            self._running[job.valve] = (job, None)
+            self._peak = max(self._peak, len(self._running))
+            opened = False
+            try:
+                await self._async_switch(job.valve, True)
+                opened = True
+            except HomeAssistantError as err:
+                _LOGGER.error("Could not open valve %s: %s", job.valve, err)
+            finally:
+                # Any failure, cancellation included, frees the slot and its flow
+                if not opened:
+                    if self._running.get(job.valve, (None,))[0] is job:
+                        del self._running[job.valve]
+                    self._failed.extend(job.plant_ids)
+            if not opened:
+                continue
+            if self._running.get(job.valve, (None,))[0] is not job:
+                # Stopped while opening, the stop may have closed it first
+                await self._async_close(job)
+                continue
+            _LOGGER.debug("Opened %s for %.0f seconds", job.valve, job.duration)
+            self._running[job.valve] = (
+                job,
+                self._clock.call_later(
+                    self.hass, job.duration, partial(self._handle_done, job)
+                ),
+            )
+        if self.active and not self._queue and not self._running:
+            self._finish_run()
+
+    @callback
+    def _handle_done(self, job: ValveJob, _now: datetime) -> None:
+        """Close a valve whose time is up."""
+        self.entry.async_create_background_task(
+            self.hass, self._async_complete(job), f"planty close valve {job.valve}"
+        )
+
+    async def _async_complete(self, job: ValveJob) -> None:
+        """Close a valve, record its plants and open the next valves."""
+        if self._running.pop(job.valve, None) is None:
+            return
+        await self._async_close(job)
+        # Imported here to avoid a cycle with the integration module
+        from . import async_record_waterings
+
+        await async_record_waterings(self.hass, self.entry.entry_id, job.plant_ids)
+        self._watered.extend(job.plant_ids)
+        await self._async_fill()
+
+    async def _async_close(self, job: ValveJob) -> None:
+        """Close a valve, logging when it refuses."""
+        try:
+            await self._async_switch(job.valve, False)
+        except HomeAssistantError as err:
+            _LOGGER.error("Could not close valve %s: %s", job.valve, err)
+
+    async def _async_switch(self, valve: str, open_valve: bool) -> None:
+        """Open or close a valve, or turn its switch on or off."""
+        domain = valve.split(".", 1)[0]
+        if domain == "valve":
+            service = "open_valve" if open_valve else "close_valve"
+        else:
+            service = "turn_on" if open_valve else "turn_off"
+        await self.hass.services.async_call(
+            domain, service, {"entity_id": valve}, blocking=True
+        )
+
+    def _finish_run(self, stopped: bool = False) -> None:
+        """Report how the run went."""
+        duration = (self._clock.utcnow() - self._started).total_seconds()
+        self._started = None
+        self.last_run = {
+            "config_entry_id": self.entry.entry_id,
+            "duration": round(duration),
+            "valves": self._valves,
+            "peak_concurrency": self._peak,
+            "watered": list(self._watered),
+            "failed": list(self._failed),
+            "stopped": stopped,
+        }
+        self.hass.bus.async_fire(EVENT_WATERING_RUN_FINISHED, self.last_run)
+        _LOGGER.info(
+            "Watering run %s after %d seconds: %d plants watered, %d failed, "
+            "up to %d valves at once",
+            "stopped" if stopped else "finished",
+            duration,
+            len(self._watered),
+            len(self._failed),
+            self._peak,
+        )
+
+
+async def async_setup_irrigation(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    engine: PlantyEngine,
+    schedule: WateringSchedule,
+) -> IrrigationScheduler:
+    """Set up valve watering runs for an entry."""
+    scheduler = IrrigationScheduler(
+        hass,
+        entry,
+        engine,
+        schedule,
+        entry.options.get(CONF_VALVE_MAX_CONCURRENT, DEFAULT_VALVE_MAX_CONCURRENT),
+        entry.options.get(CONF_VALVE_FLOW_BUDGET, DEFAULT_VALVE_FLOW_BUDGET),
+    )
+
+    async def async_stop_run(_event: Event) -> None:
+        """Close the valves, entries are not unloaded when Home Assistant stops."""
+        await scheduler.async_stop()
+
+    # Not a once listener, whose unsubscribe errors after it fired
+    entry.async_on_unload(hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, async_stop_run))
+    return scheduler
@@ -0,0 +1,194 @@
+"""Append-only journal storage for Planty integration."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Awaitable, Callable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+JOURNAL_COMPACT_BYTES = 1024 * 1024
+
+OP_UPDATE = "update"
+OP_SET = "set"
+
+
+def apply_record(data: dict[str, Any], record: dict[str, Any]) -> None:
+    """Apply a journal record to the plant data."""
+    plants = data.setdefault("plants", {})
+    op = record["op"]
+    for plant_id, plant_data in record["plants"].items():
+        if op == OP_UPDATE:
+            plants.setdefault(plant_id, {}).update(plant_data)
+        elif op == OP_SET:
+            plants[plant_id] = plant_data
+
+
+class PlantyJournalStorage:
+    """Plant storage that appends each mutation to a journal file.
+
+    A mutation writes one short line whatever the number of plants. Once the
+    journal passes a size threshold a background task writes a snapshot of
+    the whole document and truncates the journal. Loading reads the snapshot
+    and replays the records after it, skipping records the snapshot already
+    contains and a torn last line left by a crash.
+    """
+
+    def __init__(self, hass: HomeAssistant, prefix: str = DOMAIN) -> None:
+        """Initialize the journal storage."""
+        self.hass = hass
+        self._snapshot_path = hass.config.path(STORAGE_DIR, f"{prefix}.snapshot")
+        self._journal_path = hass.config.path(STORAGE_DIR, f"{prefix}.journal")
+        self._data: dict[str, Any] = {"plants": {}}
+        self._seq = 0
+        self._journal_bytes = 0
+        self._lock = asyncio.Lock()
+        self._compacting = False
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """Return the storage data."""
+        return self._data
+
+    async def async_exists(self) -> bool:
+        """Return True if a snapshot or journal is on disk."""
+        return await self.hass.async_add_executor_job(self._exists)
+
+    def _exists(self) -> bool:
+        return os.path.exists(self._snapshot_path) or os.path.exists(self._journal_path)
+
+    async def async_load(
+        self, seed: Callable[[], Awaitable[dict[str, Any] | None]] | None = None
+    ) -> dict[str, Any]:
+        """Load the snapshot and replay the journal.
+
+        Without files on disk the data is taken from seed, usually the
+        document of the regular store, and written as the first snapshot.
+        """
+        loaded = await self.hass.async_add_executor_job(self._load)
+        if loaded is None:
+            seeded = await seed() if seed else None
+            self._data.clear()
+            self._data.update(seeded or {"plants": {}})
+            await self.async_save()
+            return self._data
+
+        data, self._seq, self._journal_bytes = loaded
+        self._data.clear()
+        self._data.update(data)
+        return self._data
+
+    def _load(self) -> tuple[dict[str, Any], int, int] | None:
+        """Read the snapshot and replay the journal tail."""
+        if not self._exists():
+            return None
+
+        seq = 0
+        data: dict[str, Any] = {"plants": {}}
+        if os.path.exists(self._snapshot_path):
+            with open(self._snapshot_path, encoding="utf-8") as snapshot_file:
+                snapshot = json.load(snapshot_file)
+            seq = snapshot["seq"]
+            data = snapshot["data"]
+
+        journal_bytes = 0
+        replayed = 0
+        if os.path.exists(self._journal_path):
+            with open(self._journal_path, "rb+") as journal_file:
+                for line in journal_file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Only the last append can be torn, drop it
+                        _LOGGER.warning("Dropping incomplete record at end of plant journal")
+                        journal_file.truncate(journal_bytes)
+                        break
+                    journal_bytes += len(line)
+                    if record["seq"] <= seq:
+                        continue
+                    apply_record(data, record)
+                    seq = record["seq"]
+                    replayed += 1
+
+        _LOGGER.debug("Loaded plant snapshot and replayed %d journal records", replayed)
+        return data, seq, journal_bytes
+
+    async def async_update_plants(self, changes: dict[str, dict[str, Any]]) -> None:
+        """Merge changes into plants, creating plants that do not exist."""
+        await self._async_append(OP_UPDATE, changes)
+
+    async def async_set_plants(self, records: dict[str, dict[str, Any]]) -> None:
+        """Add plants or replace them entirely."""
+        await self._async_append(OP_SET, records)
+
+    async def async_save(self) -> None:
+        """Write a snapshot of all data and truncate the journal."""
+        async with self._lock:
+            # Serialized here so later mutations cannot leak into it
+            snapshot = json.dumps({"seq": self._seq, "data": self._data})
+            await self.hass.async_add_executor_job(self._write_snapshot, snapshot)
+            self._journal_bytes = 0
+
+    async def async_remove(self) -> None:
+        """Delete the snapshot and journal."""
+        await self.hass.async_add_executor_job(self._remove)
+
+    def _remove(self) -> None:
+        for path in (self._snapshot_path, self._journal_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    async def _async_append(self, op: str, plants: dict[str, dict[str, Any]]) -> None:
+        """Apply a mutation in memory and append it to the journal."""
+        self._seq += 1
+        record = {"seq": self._seq, "op": op, "plants": plants}
+        apply_record(self._data, record)
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+
+        # The lock keeps appends in order and out of a running compaction
+        async with self._lock:
+            await self.hass.async_add_executor_job(self._write_line, line)
+            self._journal_bytes += len(line.encode("utf-8"))
+
+        if self._journal_bytes > JOURNAL_COMPACT_BYTES and not self._compacting:
+            self._compacting = True
+            self.hass.async_create_background_task(
+                self._async_compact(), f"{DOMAIN} journal compaction"
+            )
+
+    async def _async_compact(self) -> None:
+        """Fold the journal into a new snapshot."""
+        try:
+            await self.async_save()
+            _LOGGER.debug("Compacted plant journal at record %d", self._seq)
+        except OSError as err:
+            _LOGGER.error("Failed to compact plant journal: %s", err)
+        finally:
+            self._compacting = False
+
+    def _write_line(self, line: str) -> None:
+        """Append a line and make sure it reached the disk."""
+        with open(self._journal_path, "a", encoding="utf-8") as journal_file:
+            journal_file.write(line)
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+    def _write_snapshot(self, snapshot: str) -> None:
+        """Atomically replace the snapshot, then empty the journal."""
+        os.makedirs(os.path.dirname(self._snapshot_path), exist_ok=True)
+        temp_path = f"{self._snapshot_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as snapshot_file:
+            snapshot_file.write(snapshot)
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+        os.replace(temp_path, self._snapshot_path)
+        # Records the snapshot contains are skipped on replay if this fails
+        with open(self._journal_path, "w", encoding="utf-8"):
+            pass
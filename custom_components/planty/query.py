@@ -0,0 +1,77 @@
+"""Bulk plant queries for Planty integration."""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Callable, Iterator
+
+from .const import DEFAULT_WATERING_INTERVAL
+
+# Fields a query can return, in response order
+PLANT_FIELDS = (
+    "plant_id",
+    "name",
+    "type",
+    "status",
+    "area",
+    "watering_mode",
+    "watering_interval",
+    "humidity_sensor",
+    "humidity",
+    "last_watered",
+    "next_watering",
+    "image_path",
+)
+
+
+def query_plants(
+    plants: dict[str, dict[str, Any]],
+    status: Callable[[str], str],
+    humidity: Callable[[str], float | None],
+    area: Callable[[str], str | None],
+    due: Callable[[str], datetime | None],
+    filters: dict[str, Any],
+    fields: list[str],
+) -> Iterator[dict[str, Any]]:
+    """Yield the plants matching all filters, projected to the given fields.
+
+    Cheap filters run first and only the requested fields are computed, so
+    a narrow query over a large collection does little work per plant.
+    """
+    statuses = set(filters.get("status") or ())
+    types = set(filters.get("type") or ())
+    areas = set(filters.get("area") or ())
+    due_before = filters.get("due_before")
+
+    getters: dict[str, Callable[[str, dict[str, Any]], Any]] = {
+        "plant_id": lambda plant_id, data: plant_id,
+        "name": lambda plant_id, data: data.get("name", plant_id),
+        "type": lambda plant_id, data: data.get("type"),
+        "status": lambda plant_id, data: status(plant_id),
+        "area": lambda plant_id, data: area(plant_id),
+        "watering_mode": lambda plant_id, data: data.get("watering_mode", "manual"),
+        "watering_interval": lambda plant_id, data: data.get(
+            "watering_interval", DEFAULT_WATERING_INTERVAL
+        ),
+        "humidity_sensor": lambda plant_id, data: data.get("humidity_sensor"),
+        "humidity": lambda plant_id, data: humidity(plant_id),
+        "last_watered": lambda plant_id, data: data.get("last_watered"),
+        "next_watering": lambda plant_id, data: (
+            due(plant_id).isoformat() if due(plant_id) else None
+        ),
+        "image_path": lambda plant_id, data: data.get("image_path"),
+    }
+    selected = [(field, getters[field]) for field in fields]
+
+    for plant_id, plant_data in plants.items():
+        if types and plant_data.get("type") not in types:
+            continue
+        if statuses and status(plant_id) not in statuses:
+            continue
+        if areas and area(plant_id) not in areas:
+            continue
+        if due_before is not None:
+            # Sensor plants have no due date and never match
+            due_date = due(plant_id)
+            if due_date is None or due_date >= due_before:
+                continue
+        yield {field: getter(plant_id, plant_data) for field, getter in selected}
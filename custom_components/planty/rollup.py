@@ -0,0 +1,182 @@
+"""Status rollups for Planty integration."""
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from typing import Any, Callable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+
+from .const import DOMAIN
+from .engine import PlantyEngine
+
+_LOGGER = logging.getLogger(__name__)
+
+GROUP_ALL = "all"
+GROUP_AREA = "area"
+GROUP_TYPE = "type"
+
+
+def group_key(kind: str, value: str | None = None) -> str:
+    """Return the key of a rollup group."""
+    return kind if value is None else f"{kind}:{value}"
+
+
+class StatusRollup:
+    """Per-group status counters adjusted on every transition.
+
+    Each plant belongs to the overall group, its area group and its plant
+    type group. A status transition or group move only touches the counters
+    of the groups involved.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self._counts: dict[str, Counter[str]] = {}
+        self._statuses: dict[str, str] = {}
+        self._groups: dict[str, tuple[str, ...]] = {}
+        self._listeners: dict[str, list[Callable[[], None]]] = {}
+        self._group_listeners: list[Callable[[str], None]] = []
+
+    @property
+    def groups(self) -> list[str]:
+        """Return the known groups."""
+        return list(self._counts)
+
+    def counts(self, group: str) -> Counter[str]:
+        """Return the status counts of a group."""
+        return self._counts.get(group, Counter())
+
+    def group(self, plant_id: str, kind: str) -> str | None:
+        """Return the value of a plant's group of the given kind."""
+        prefix = f"{kind}:"
+        for group in self._groups.get(plant_id, ()):
+            if group.startswith(prefix):
+                return group[len(prefix):]
+        return None
+
+    def set_plant(self, plant_id: str, groups: tuple[str, ...], status: str) -> None:
+        """Add a plant or change its groups and status."""
+        old_groups = self._groups.get(plant_id, ())
+        old_status = self._statuses.get(plant_id)
+        if old_groups == groups and old_status == status:
+            return
+
+        for group in old_groups:
+            self._counts[group][old_status] -= 1
+        for group in groups:
+            if group not in self._counts:
+                self._counts[group] = Counter()
+                for group_callback in list(self._group_listeners):
+                    group_callback(group)
+            self._counts[group][status] += 1
+
+        self._groups[plant_id] = groups
+        self._statuses[plant_id] = status
+        self._notify({*old_groups, *groups})
+
+    def set_status(self, plant_id: str, status: str) -> None:
+        """Move a plant to a new status within its groups."""
+        if plant_id in self._groups:
+            self.set_plant(plant_id, self._groups[plant_id], status)
+
+    def set_group(self, plant_id: str, kind: str, value: str | None) -> None:
+        """Move a plant to another group of the given kind."""
+        if plant_id not in self._groups:
+            return
+        prefix = f"{kind}:"
+        groups = tuple(
+            group for group in self._groups[plant_id] if not group.startswith(prefix)
+        )
+        if value is not None:
+            groups = (*groups, group_key(kind, value))
+        self.set_plant(plant_id, groups, self._statuses[plant_id])
+
+    @callback
+    def async_add_listener(self, group: str, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Listen for count changes of a group."""
+        listeners = self._listeners.setdefault(group, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_add_group_listener(self, group_callback: Callable[[str], None]) -> Callable[[], None]:
+        """Listen for new groups."""
+        self._group_listeners.append(group_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._group_listeners.remove(group_callback)
+
+        return remove_listener
+
+    def _notify(self, groups: set[str]) -> None:
+        """Call the listeners of the changed groups."""
+        for group in groups:
+            for update_callback in list(self._listeners.get(group, ())):
+                update_callback()
+
+
+def _plant_groups(plant_data: dict[str, Any], area_id: str | None) -> tuple[str, ...]:
+    """Return the rollup groups of a plant."""
+    groups = [GROUP_ALL]
+    if area_id:
+        groups.append(group_key(GROUP_AREA, area_id))
+    if plant_data.get("type"):
+        groups.append(group_key(GROUP_TYPE, plant_data["type"]))
+    return tuple(groups)
+
+
+async def async_setup_rollup(
+    hass: HomeAssistant, entry: ConfigEntry, engine: PlantyEngine
+) -> StatusRollup:
+    """Set up status rollups and keep them in sync with the engine."""
+    rollup = StatusRollup()
+    device_registry = dr.async_get(hass)
+
+    def plant_area(plant_id: str) -> str | None:
+        device = device_registry.async_get_device(identifiers={(DOMAIN, plant_id)})
+        return device.area_id if device else None
+
+    for plant_id, plant_data in engine.plants.items():
+        rollup.set_plant(
+            plant_id, _plant_groups(plant_data, plant_area(plant_id)), engine.status(plant_id)
+        )
+
+    @callback
+    def handle_transition(plant_id: str, old_status: str | None, new_status: str) -> None:
+        rollup.set_status(plant_id, new_status)
+
+    @callback
+    def handle_plant_updated(event: Event) -> None:
+        plant_id = event.data.get("plant_id")
+        plant_data = engine.plants.get(plant_id)
+        if plant_data is not None:
+            rollup.set_group(plant_id, GROUP_TYPE, plant_data.get("type"))
+
+    @callback
+    def handle_device_updated(event: Event) -> None:
+        if event.data["action"] != "update" or "area_id" not in event.data.get("changes", {}):
+            return
+        device = device_registry.async_get(event.data["device_id"])
+        if device is None:
+            return
+        for domain, plant_id in device.identifiers:
+            if domain == DOMAIN:
+                rollup.set_group(plant_id, GROUP_AREA, device.area_id)
+
+    entry.async_on_unload(engine.async_add_listener(handle_transition))
+    entry.async_on_unload(
+        hass.bus.async_listen(f"{DOMAIN}_plant_updated", handle_plant_updated)
+    )
+    entry.async_on_unload(
+        hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, handle_device_updated)
+    )
+    return rollup
@@ -0,0 +1,169 @@
+"""Watering schedule index for Planty integration."""
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterator
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DEFAULT_WATERING_INTERVAL, DOMAIN, WATERING_MODE_SENSOR
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_timestamp(value: str | None) -> datetime | None:
+    """Parse a stored timestamp into an aware datetime.
+
+    Timestamps written by older versions are naive local times.
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return parsed
+
+
+def plant_due_date(plant_data: dict[str, Any]) -> tuple[datetime, int] | None:
+    """Return the next due date and interval of a timer based plant."""
+    if plant_data.get("watering_mode") == WATERING_MODE_SENSOR:
+        return None
+
+    interval = plant_data.get("watering_interval", DEFAULT_WATERING_INTERVAL)
+    last_watered = parse_timestamp(plant_data.get("last_watered"))
+    if last_watered is None:
+        # Never watered plants are due from the day they were added
+        created = parse_timestamp(plant_data.get("created"))
+        if created is None:
+            return None
+        return created, interval
+
+    return last_watered + timedelta(days=interval), interval
+
+
+class WateringSchedule:
+    """Ordered index of upcoming waterings.
+
+    Plants are bucketed by watering interval and each bucket is kept sorted
+    by due date, so the waterings in a window are found with a couple of
+    bisections per interval and projected occurrence instead of a pass over
+    every plant.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty schedule."""
+        self._plants: dict[str, tuple[datetime, int]] = {}
+        self._buckets: dict[int, list[tuple[datetime, str]]] = {}
+        self._listeners: list[Callable[[], None]] = []
+
+    def __len__(self) -> int:
+        """Return the number of scheduled plants."""
+        return len(self._plants)
+
+    def set(self, plant_id: str, due: datetime, interval: int) -> None:
+        """Schedule a plant, replacing its previous due date."""
+        self._discard(plant_id)
+        self._plants[plant_id] = (due, interval)
+        insort(self._buckets.setdefault(interval, []), (due, plant_id))
+        self._notify()
+
+    def remove(self, plant_id: str) -> None:
+        """Remove a plant from the schedule."""
+        if self._discard(plant_id):
+            self._notify()
+
+    def update_plant(self, plant_id: str, plant_data: dict[str, Any] | None) -> None:
+        """Reschedule a plant from its stored data."""
+        due = plant_due_date(plant_data) if plant_data else None
+        if due is None:
+            self.remove(plant_id)
+        elif self._plants.get(plant_id) != due:
+            self.set(plant_id, *due)
+
+    def get(self, plant_id: str) -> datetime | None:
+        """Return the next due date of a plant."""
+        scheduled = self._plants.get(plant_id)
+        return scheduled[0] if scheduled else None
+
+    def next_due(self) -> tuple[datetime, str] | None:
+        """Return the earliest due date and its plant."""
+        heads = [bucket[0] for bucket in self._buckets.values() if bucket]
+        return min(heads) if heads else None
+
+    def occurrences(
+        self, start: datetime, end: datetime
+    ) -> Iterator[tuple[datetime, str]]:
+        """Yield projected waterings in [start, end) as (time, plant_id)."""
+        for interval, bucket in self._buckets.items():
+            if not bucket:
+                continue
+            step = timedelta(days=interval)
+            first_due = bucket[0][0]
+            # The k-th recurrence of every plant in the bucket lands in the
+            # window exactly when its due date is in the shifted window.
+            skip = max(0, (start - bucket[-1][0]) // step)
+            shift = skip * step
+            while end - shift > first_due:
+                low = bisect_left(bucket, (start - shift,))
+                high = bisect_left(bucket, (end - shift,))
+                for due, plant_id in bucket[low:high]:
+                    yield due + shift, plant_id
+                shift += step
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Listen for schedule changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    def _discard(self, plant_id: str) -> bool:
+        """Drop a plant from its bucket without notifying."""
+        scheduled = self._plants.pop(plant_id, None)
+        if scheduled is None:
+            return False
+        due, interval = scheduled
+        bucket = self._buckets[interval]
+        pos = bisect_left(bucket, (due, plant_id))
+        if pos < len(bucket) and bucket[pos] == (due, plant_id):
+            del bucket[pos]
+        if not bucket:
+            del self._buckets[interval]
+        return True
+
+    def _notify(self) -> None:
+        """Call the change listeners."""
+        for update_callback in list(self._listeners):
+            update_callback()
+
+
+async def async_setup_schedule(
+    hass: HomeAssistant, entry: ConfigEntry, storage: Any
+) -> WateringSchedule:
+    """Set up the watering schedule and keep it in sync with plant events."""
+    schedule = WateringSchedule()
+    for plant_id, plant_data in storage.data.get("plants", {}).items():
+        schedule.update_plant(plant_id, plant_data)
+
+    @callback
+    def handle_plant_event(event: Event) -> None:
+        plant_id = event.data.get("plant_id")
+        if plant_id:
+            schedule.update_plant(plant_id, storage.data.get("plants", {}).get(plant_id))
+
+    for event_type in (f"{DOMAIN}_plant_watered", f"{DOMAIN}_plant_updated"):
+        entry.async_on_unload(hass.bus.async_listen(event_type, handle_plant_event))
+
+    _LOGGER.debug("Scheduled %d plants", len(schedule))
+    return schedule
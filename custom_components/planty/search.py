@@ -0,0 +1,189 @@
+"""Species search for Planty integration."""
+from __future__ import annotations
+
+import math
+import re
+from bisect import bisect_left, insort
+from typing import Any, Iterable
+
+from .catalog import PlantCatalog
+
+SEARCH_DEFAULT_LIMIT = 10
+
+# Relative weight of each kind of match
+SCORE_EXACT = 1.0
+SCORE_PREFIX = 0.9
+SCORE_WORD_PREFIX = 0.8
+SCORE_TRIGRAM = 0.7
+
+# Upper bound on prefix entries inspected per query
+_PREFIX_SCAN_LIMIT = 200
+
+# Queries shorter than this only use the prefix index
+_TRIGRAM_MIN_QUERY = 3
+_TRIGRAM_MIN_SIMILARITY = 0.5
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text: str) -> str:
+    """Normalize a name for indexing and querying."""
+    return _NON_ALNUM.sub(" ", text.lower()).strip()
+
+
+def trigrams(text: str) -> set[str]:
+    """Return the padded trigrams of a normalized string."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SpeciesSearchIndex:
+    """Ranked prefix and trigram index over species keys and names.
+
+    The index only keeps the searchable strings and a short summary per
+    species, and is updated per key when the catalog changes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._summaries: dict[str, dict[str, Any]] = {}
+        self._terms: dict[str, tuple[str, ...]] = {}
+        self._words: dict[str, tuple[str, ...]] = {}
+        self._grams: dict[str, set[str]] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._prefix: list[tuple[str, str]] = []
+
+    def __len__(self) -> int:
+        """Return the number of indexed species."""
+        return len(self._summaries)
+
+    def add(self, summary: dict[str, Any]) -> None:
+        """Index a species summary, replacing any previous entry."""
+        self.remove(summary["key"])
+        for entry in self._index(summary):
+            insort(self._prefix, entry)
+
+    def add_all(self, summaries: Iterable[dict[str, Any]]) -> None:
+        """Index many new species, sorting the prefix entries once."""
+        for summary in summaries:
+            self.remove(summary["key"])
+            self._prefix.extend(self._index(summary))
+        self._prefix.sort()
+
+    def _index(self, summary: dict[str, Any]) -> list[tuple[str, str]]:
+        """Index a species except for its prefix entries, which are returned."""
+        key = summary["key"]
+
+        terms = {
+            normalize(value)
+            for value in (key, summary.get("name"), summary.get("scientific_name"))
+            if value
+        }
+        terms.discard("")
+
+        grams: set[str] = set()
+        for term in terms:
+            grams |= trigrams(term)
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(key)
+
+        words = {word for term in terms for word in term.split()} - terms
+        self._summaries[key] = summary
+        self._terms[key] = tuple(terms)
+        self._words[key] = tuple(words)
+        self._grams[key] = grams
+        return [(term, key) for term in terms] + [(word, key) for word in words]
+
+    def remove(self, key: str) -> None:
+        """Remove a species from the index."""
+        if key not in self._summaries:
+            return
+
+        for gram in self._grams.pop(key):
+            postings = self._postings[gram]
+            postings.discard(key)
+            if not postings:
+                del self._postings[gram]
+
+        for term in (*self._terms.pop(key), *self._words.pop(key)):
+            pos = bisect_left(self._prefix, (term, key))
+            if pos < len(self._prefix) and self._prefix[pos] == (term, key):
+                del self._prefix[pos]
+
+        del self._summaries[key]
+
+    def search(self, query: str, limit: int = SEARCH_DEFAULT_LIMIT) -> list[dict[str, Any]]:
+        """Return the best matching species for a query, best first."""
+        query = normalize(query)
+        if not query:
+            return []
+
+        scores: dict[str, float] = {}
+
+        def score(key: str, value: float) -> None:
+            if value > scores.get(key, 0.0):
+                scores[key] = value
+
+        # Prefix matches on whole terms and on the words inside them
+        pos = bisect_left(self._prefix, (query, ""))
+        for term, key in self._prefix[pos:pos + _PREFIX_SCAN_LIMIT]:
+            if not term.startswith(query):
+                break
+            if term == query and term in self._terms[key]:
+                score(key, SCORE_EXACT)
+            elif term in self._terms[key]:
+                # Prefer the shorter completion
+                score(key, SCORE_PREFIX + 0.09 * len(query) / len(term))
+            else:
+                score(key, SCORE_WORD_PREFIX)
+
+        # Fall back to fuzzy trigram matching when prefixes are not enough
+        if len(scores) < limit and len(query) >= _TRIGRAM_MIN_QUERY:
+            for key, value in self._fuzzy_matches(query).items():
+                scores.setdefault(key, value)
+
+        ranked = sorted(
+            scores.items(),
+            key=lambda item: (-item[1], self._summaries[item[0]].get("name") or item[0]),
+        )
+        return [
+            {**self._summaries[key], "score": round(value, 3)}
+            for key, value in ranked[:limit]
+        ]
+
+    def _fuzzy_matches(self, query: str) -> dict[str, float]:
+        """Score fuzzy matches by the share of query trigrams they contain."""
+        query_grams = sorted(
+            trigrams(query), key=lambda gram: len(self._postings.get(gram, ()))
+        )
+        # A match must share at least this many trigrams with the query, so
+        # it has to appear in one of the rarest len - needed + 1 postings.
+        needed = max(1, math.ceil(_TRIGRAM_MIN_SIMILARITY * len(query_grams)))
+        candidates: set[str] = set()
+        for gram in query_grams[:len(query_grams) - needed + 1]:
+            candidates.update(self._postings.get(gram, ()))
+
+        matches: dict[str, float] = {}
+        for key in candidates:
+            grams = self._grams[key]
+            shared = sum(1 for gram in query_grams if gram in grams)
+            similarity = shared / len(query_grams)
+            if similarity >= _TRIGRAM_MIN_SIMILARITY:
+                matches[key] = SCORE_TRIGRAM * similarity
+        return matches
+
+    def update(self, keys: Iterable[str], summaries: list[dict[str, Any]]) -> None:
+        """Re-index changed keys from their fresh catalog summaries."""
+        found = {summary["key"]: summary for summary in summaries}
+        for key in keys:
+            if key in found:
+                self.add(found[key])
+            else:
+                self.remove(key)
+
+
+def build_search_index(catalog: PlantCatalog) -> SpeciesSearchIndex:
+    """Build a search index over the whole catalog. Must run in the executor."""
+    index = SpeciesSearchIndex()
+    index.add_all(catalog.summaries())
+    return index
@@ -3,26 +3,42 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Callable
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
-from homeassistant.util import dt as dt_util
 
-from . import get_plant_data, get_plant_database
+from . import get_plant_catalog, get_plant_data
 from .const import (
+    CONF_COMPACT_ENTITIES,
+    CONF_WRITE_MIN_DELTA,
+    CONF_WRITE_MIN_INTERVAL,
+    DEFAULT_COMPACT_ENTITIES,
+    DEFAULT_WRITE_MIN_DELTA,
+    DEFAULT_WRITE_MIN_INTERVAL,
     DOMAIN,
     SENSOR_TYPES,
     PLANT_STATUS_HEALTHY,
     PLANT_STATUS_NEEDS_WATER,
     PLANT_STATUS_OVERDUE,
     PLANT_STATUS_UNKNOWN,
+    SIGNAL_HUMIDITY_UPDATED,
+    SIGNAL_PLANT_UPDATED,
+    SIGNAL_PLANT_WATERED,
     WATERING_MODE_SENSOR,
 )
+from .clock import get_clock
+from .engine import PlantyEngine
+from .entries import entry_name
+from .fusion import FUSION_MEAN, plant_probes
+from .rollup import GROUP_ALL, GROUP_AREA, StatusRollup
+from .schedule import parse_timestamp, plant_due_date
+from .throttle import StateWriteThrottle
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,12 +50,17 @@ async def async_setup_entry(
 ) -> None:
     """Set up Planty sensors from a config entry."""
     storage = hass.data[DOMAIN][config_entry.entry_id]["storage"]
-    plants_db = hass.data[DOMAIN][config_entry.entry_id]["plants_db"]
     
     entities = []
+    compact = config_entry.options.get(CONF_COMPACT_ENTITIES, DEFAULT_COMPACT_ENTITIES)
     
     # Create sensors for each plant
     for plant_id, plant_config in storage.data.get("plants", {}).items():
+        if compact:
+            # One entity per plant carrying every derived value
+            entities.append(PlantCompactSensor(hass, config_entry, plant_id, plant_config))
+            continue
+        
         # Create basic sensors for all plants
         entities.extend([
             PlantDaysUntilWaterSensor(hass, config_entry, plant_id, plant_config),
@@ -53,11 +74,42 @@ async def async_setup_entry(
                 PlantHumiditySensor(hass, config_entry, plant_id, plant_config)
             )
     
+    # Create rollup sensors over all plants and per area and plant type
+    rollup = hass.data[DOMAIN][config_entry.entry_id]["rollup"]
+    entities.extend(
+        PlantyStatusTotalSensor(hass, config_entry, rollup, status)
+        for status in ROLLUP_STATUSES
+    )
+    entities.extend(
+        PlantyRollupSensor(hass, config_entry, rollup, group) for group in rollup.groups
+    )
+    
+    @callback
+    def handle_new_group(group: str) -> None:
+        async_add_entities([PlantyRollupSensor(hass, config_entry, rollup, group)])
+    
+    config_entry.async_on_unload(rollup.async_add_group_listener(handle_new_group))
+    
     async_add_entities(entities)
 
 
+ROLLUP_STATUSES = (
+    PLANT_STATUS_HEALTHY,
+    PLANT_STATUS_NEEDS_WATER,
+    PLANT_STATUS_OVERDUE,
+    PLANT_STATUS_UNKNOWN,
+)
+
+
 class PlantSensorBase(SensorEntity):
-    """Base class for plant sensors."""
+    """Base class for plant sensors.
+
+    Sensors write state when their plant changes. The ones counting days
+    until or since watering also write when that count changes, instead of
+    polling.
+    """
+
+    _attr_should_poll = False
 
     def __init__(
         self, 
@@ -73,6 +125,8 @@ class PlantSensorBase(SensorEntity):
         self._plant_id = plant_id
         self._plant_config = plant_config
         self._sensor_type = sensor_type
+        self._clock = get_clock(hass)
+        self._unsub_day_tick: Callable[[], None] | None = None
         
         sensor_info = SENSOR_TYPES[sensor_type]
         plant_name = plant_config.get("name", plant_id)
@@ -92,27 +146,81 @@ class PlantSensorBase(SensorEntity):
             sw_version="1.0.0",
         )
 
+    @property
+    def _engine(self) -> PlantyEngine:
+        """Return the status engine of the entry."""
+        return self.hass.data[DOMAIN][self._config_entry.entry_id]["engine"]
+
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
-        # Listen for plant events
-        self.async_on_remove(
-            self.hass.bus.async_listen(
-                f"{DOMAIN}_plant_watered",
-                self._handle_plant_event,
+        # Listen for this plant's events
+        for signal in (SIGNAL_PLANT_WATERED, SIGNAL_PLANT_UPDATED):
+            self.async_on_remove(
+                async_dispatcher_connect(
+                    self.hass, signal.format(self._plant_id), self._handle_plant_event
+                )
             )
+        self._async_schedule_day_tick()
+        self.async_on_remove(self._async_cancel_day_tick)
+
+    @callback
+    def _handle_plant_event(self) -> None:
+        """Handle plant events."""
+        self.async_schedule_update_ha_state()
+        self._async_schedule_day_tick()
+
+    def _next_watering(self) -> datetime | None:
+        """Return when the plant is next due, for sensors counting days to it."""
+        return None
+
+    @callback
+    def _async_cancel_day_tick(self) -> None:
+        """Cancel the pending day tick."""
+        if self._unsub_day_tick:
+            self._unsub_day_tick()
+            self._unsub_day_tick = None
+
+    @callback
+    def _async_schedule_day_tick(self) -> None:
+        """Arm a write for when the whole days left until watering drop."""
+        self._async_cancel_day_tick()
+        next_watering = self._next_watering()
+        now = self._clock.now()
+        if next_watering is None or next_watering <= now:
+            return
+        # The count drops just after a whole number of days before the due time
+        tick = next_watering - timedelta(days=(next_watering - now).days, seconds=-1)
+        self._unsub_day_tick = self._clock.call_at(self.hass, tick, self._handle_day_tick)
+
+    @callback
+    def _handle_day_tick(self, _now: datetime) -> None:
+        """Write the new day count and arm the next tick."""
+        self._unsub_day_tick = None
+        self.async_write_ha_state()
+        self._async_schedule_day_tick()
+
+    @callback
+    def _async_track_humidity(self, flush_on_status: bool) -> None:
+        """Write state on humidity updates, throttled by the entry options."""
+        options = self._config_entry.options
+        throttle = StateWriteThrottle(
+            self.hass,
+            options.get(CONF_WRITE_MIN_INTERVAL, DEFAULT_WRITE_MIN_INTERVAL),
+            options.get(CONF_WRITE_MIN_DELTA, DEFAULT_WRITE_MIN_DELTA),
+            lambda: self._engine.humidity(self._plant_id),
+            self.async_write_ha_state,
         )
         self.async_on_remove(
-            self.hass.bus.async_listen(
-                f"{DOMAIN}_plant_updated",
-                self._handle_plant_event,
+            async_dispatcher_connect(
+                self.hass, SIGNAL_HUMIDITY_UPDATED.format(self._plant_id), throttle.request
             )
         )
-
-    @callback
-    def _handle_plant_event(self, event) -> None:
-        """Handle plant events."""
-        if event.data.get("plant_id") == self._plant_id:
-            self.async_schedule_update_ha_state()
+        if flush_on_status:
+            # Readings that change the water status are written at once
+            self.async_on_remove(
+                self._engine.async_add_plant_listener(self._plant_id, throttle.flush)
+            )
+        self.async_on_remove(throttle.cancel)
 
 
 class PlantDaysUntilWaterSensor(PlantSensorBase):
@@ -129,6 +237,14 @@ class PlantDaysUntilWaterSensor(PlantSensorBase):
         super().__init__(hass, config_entry, plant_id, plant_config, "days_until_water")
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
+    def _next_watering(self) -> datetime | None:
+        """Return when the plant is next due."""
+        plant_data = get_plant_data(self.hass, self._config_entry.entry_id, self._plant_id)
+        last_watered = parse_timestamp((plant_data or {}).get("last_watered"))
+        if last_watered is None:
+            return None
+        return last_watered + timedelta(days=plant_data.get("watering_interval", 7))
+
     @property
     def native_value(self) -> int | None:
         """Return the number of days until next watering."""
@@ -141,10 +257,10 @@ class PlantDaysUntilWaterSensor(PlantSensorBase):
             return 0  # Needs to be watered immediately
 
         try:
-            last_watered = datetime.fromisoformat(last_watered_str)
+            last_watered = parse_timestamp(last_watered_str)
             watering_interval = plant_data.get("watering_interval", 7)
             next_watering = last_watered + timedelta(days=watering_interval)
-            days_until = (next_watering - datetime.now()).days
+            days_until = (next_watering - self._clock.now()).days
             return max(0, days_until)
         except (ValueError, TypeError):
             return None
@@ -186,9 +302,9 @@ class PlantDaysUntilWaterSensor(PlantSensorBase):
             return 100  # Needs water immediately
 
         try:
-            last_watered = datetime.fromisoformat(last_watered_str)
+            last_watered = parse_timestamp(last_watered_str)
             watering_interval = plant_data.get("watering_interval", 7)
-            days_passed = (datetime.now() - last_watered).days
+            days_passed = (self._clock.now() - last_watered).days
             
             # Calculate percentage (0% = just watered, 100% = needs water)
             percentage = min(100, max(0, (days_passed / watering_interval) * 100))
@@ -251,75 +367,37 @@ class PlantWaterStatusSensor(PlantSensorBase):
         """Initialize the sensor."""
         super().__init__(hass, config_entry, plant_id, plant_config, "water_status")
 
-    @property
-    def native_value(self) -> str:
-        """Return the plant's water status."""
-        plant_data = get_plant_data(self.hass, self._config_entry.entry_id, self._plant_id)
-        if not plant_data:
-            return PLANT_STATUS_UNKNOWN
-
-        # Check if using sensor mode
-        if plant_data.get("watering_mode") == WATERING_MODE_SENSOR:
-            return self._get_sensor_status(plant_data)
-        else:
-            return self._get_manual_status(plant_data)
-
-    def _get_sensor_status(self, plant_data: dict[str, Any]) -> str:
-        """Get status based on humidity sensor."""
-        humidity_sensor = plant_data.get("humidity_sensor")
-        if not humidity_sensor:
-            return PLANT_STATUS_UNKNOWN
-
-        humidity_state = self.hass.states.get(humidity_sensor)
-        if not humidity_state or humidity_state.state == "unavailable":
-            return PLANT_STATUS_UNKNOWN
-
-        try:
-            current_humidity = float(humidity_state.state)
-            
-            # Get plant type data if available
-            plants_db = get_plant_database(self.hass, self._config_entry.entry_id)
-            plant_type = plant_data.get("type")
-            
-            if plant_type and plant_type in plants_db.get("plants", {}):
-                plant_info = plants_db["plants"][plant_type]
-                humidity_min = plant_info.get("humidity_min", 30)
-                humidity_max = plant_info.get("humidity_max", 70)
-            else:
-                humidity_min = 30
-                humidity_max = 70
-
-            if current_humidity < humidity_min:
-                return PLANT_STATUS_NEEDS_WATER
-            elif current_humidity > humidity_max:
-                return PLANT_STATUS_OVERDUE  # Too wet
-            else:
-                return PLANT_STATUS_HEALTHY
-
-        except (ValueError, TypeError):
-            return PLANT_STATUS_UNKNOWN
-
-    def _get_manual_status(self, plant_data: dict[str, Any]) -> str:
-        """Get status based on manual countdown."""
-        last_watered_str = plant_data.get("last_watered")
-        if not last_watered_str:
-            return PLANT_STATUS_NEEDS_WATER
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        
+        # Write state as soon as the engine detects a status transition
+        self.async_on_remove(
+            self._engine.async_add_plant_listener(self._plant_id, self.async_write_ha_state)
+        )
+        
+        if self._plant_config.get("watering_mode") == WATERING_MODE_SENSOR:
+            # Keep the humidity and progress attributes current for the cards;
+            # status changes are already written by the status listener
+            self._async_track_humidity(flush_on_status=False)
 
-        try:
-            last_watered = datetime.fromisoformat(last_watered_str)
-            watering_interval = plant_data.get("watering_interval", 7)
-            next_watering = last_watered + timedelta(days=watering_interval)
-            now = datetime.now()
+    def _next_watering(self) -> datetime | None:
+        """Return when the whole days since a manual watering next go up.
 
-            if now > next_watering + timedelta(days=2):  # 2 days overdue
-                return PLANT_STATUS_OVERDUE
-            elif now >= next_watering:
-                return PLANT_STATUS_NEEDS_WATER
-            else:
-                return PLANT_STATUS_HEALTHY
+        The progress and days since watered attributes change then.
+        """
+        plant_data = get_plant_data(self.hass, self._config_entry.entry_id, self._plant_id)
+        if not plant_data or plant_data.get("watering_mode") == WATERING_MODE_SENSOR:
+            return None
+        last_watered = parse_timestamp(plant_data.get("last_watered"))
+        if last_watered is None:
+            return None
+        return last_watered + timedelta(days=(self._clock.now() - last_watered).days + 1)
 
-        except (ValueError, TypeError):
-            return PLANT_STATUS_UNKNOWN
+    @property
+    def native_value(self) -> str:
+        """Return the plant's water status."""
+        return self._engine.status(self._plant_id)
 
     @property
     def icon(self) -> str:
@@ -352,12 +430,9 @@ class PlantWaterStatusSensor(PlantSensorBase):
         if plant_data.get("watering_mode") == WATERING_MODE_SENSOR:
             humidity_sensor = plant_data.get("humidity_sensor")
             if humidity_sensor:
-                humidity_state = self.hass.states.get(humidity_sensor)
-                if humidity_state and humidity_state.state != "unavailable":
-                    try:
-                        attrs["current_humidity"] = float(humidity_state.state)
-                    except (ValueError, TypeError):
-                        pass
+                humidity = self._engine.humidity(self._plant_id)
+                if humidity is not None:
+                    attrs["current_humidity"] = round(humidity, 1)
                 attrs["humidity_sensor"] = humidity_sensor
         else:
             # Manual mode attributes
@@ -365,8 +440,8 @@ class PlantWaterStatusSensor(PlantSensorBase):
             last_watered_str = plant_data.get("last_watered")
             if last_watered_str:
                 try:
-                    last_watered = datetime.fromisoformat(last_watered_str)
-                    days_since_watered = (datetime.now() - last_watered).days
+                    last_watered = parse_timestamp(last_watered_str)
+                    days_since_watered = (self._clock.now() - last_watered).days
                     attrs["days_since_watered"] = days_since_watered
                 except (ValueError, TypeError):
                     pass
@@ -386,28 +461,15 @@ class PlantWaterStatusSensor(PlantSensorBase):
     
     def _calculate_sensor_progress(self, plant_data: dict[str, Any]) -> int:
         """Calculate progress for sensor mode."""
-        humidity_sensor = plant_data.get("humidity_sensor")
-        if not humidity_sensor:
-            return 0
-
-        humidity_state = self.hass.states.get(humidity_sensor)
-        if not humidity_state or humidity_state.state == "unavailable":
+        current_humidity = self._engine.humidity(self._plant_id)
+        if current_humidity is None:
             return 0
 
         try:
-            current_humidity = float(humidity_state.state)
             
-            # Get plant type thresholds
-            plants_db = get_plant_database(self.hass, self._config_entry.entry_id)
-            plant_type = plant_data.get("type")
-            
-            if plant_type and plant_type in plants_db.get("plants", {}):
-                plant_info = plants_db["plants"][plant_type]
-                humidity_min = plant_info.get("humidity_min", 30)
-                humidity_max = plant_info.get("humidity_max", 70)
-            else:
-                humidity_min = 30
-                humidity_max = 70
+            # Get plant type thresholds from the catalog
+            catalog = get_plant_catalog(self.hass, self._config_entry.entry_id)
+            humidity_min, humidity_max = catalog.humidity_range(plant_data.get("type"))
             
             # Calculate inverse percentage (lower humidity = higher progress)
             optimal_range = humidity_max - humidity_min
@@ -430,9 +492,9 @@ class PlantWaterStatusSensor(PlantSensorBase):
             return 100  # Needs water immediately
 
         try:
-            last_watered = datetime.fromisoformat(last_watered_str)
+            last_watered = parse_timestamp(last_watered_str)
             watering_interval = plant_data.get("watering_interval", 7)
-            days_passed = (datetime.now() - last_watered).days
+            days_passed = (self._clock.now() - last_watered).days
             
             # Calculate percentage (0% = just watered, 100% = needs water)
             percentage = min(100, max(0, (days_passed / watering_interval) * 100))
@@ -452,6 +514,43 @@ class PlantWaterStatusSensor(PlantSensorBase):
             return "green"  # Happy camper
 
 
+class PlantCompactSensor(PlantWaterStatusSensor):
+    """Water status sensor that also carries the values of the other plant sensors.
+
+    Used in compact entity mode. It keeps the water status unique id, so its
+    entity id and history stay the same when the mode is switched on.
+    Its days until watering drop when the inherited days since watering go
+    up, so it shares their day tick.
+    """
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra state attributes."""
+        attrs = super().extra_state_attributes
+        plant_data = get_plant_data(self.hass, self._config_entry.entry_id, self._plant_id)
+        if not plant_data:
+            return attrs
+
+        last_watered = parse_timestamp(plant_data.get("last_watered"))
+        attrs["last_watered"] = last_watered.isoformat() if last_watered else None
+
+        due = plant_due_date(plant_data)
+        if due is not None:
+            next_watering = due[0]
+            attrs["next_watering"] = next_watering.isoformat()
+            attrs["days_until_water"] = max(0, (next_watering - self._clock.now()).days)
+
+        if plant_data.get("watering_mode") == WATERING_MODE_SENSOR:
+            catalog = get_plant_catalog(self.hass, self._config_entry.entry_id)
+            plant_type = plant_data.get("type")
+            if plant_type in catalog:
+                attrs["humidity_min"], attrs["humidity_max"] = catalog.humidity_range(
+                    plant_type
+                )
+
+        return attrs
+
+
 class PlantHumiditySensor(PlantSensorBase):
     """Sensor for plant soil humidity (proxy sensor)."""
 
@@ -466,67 +565,152 @@ class PlantHumiditySensor(PlantSensorBase):
         super().__init__(hass, config_entry, plant_id, plant_config, "humidity")
         self._attr_state_class = SensorStateClass.MEASUREMENT
         
-        # Track the source humidity sensor
-        self._source_sensor = plant_config.get("humidity_sensor")
+        # Track the source humidity probes
+        self._source_sensors = plant_probes(plant_config)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
         
-        # Track source sensor state changes
-        if self._source_sensor:
-            self.async_on_remove(
-                async_track_state_change_event(
-                    self.hass,
-                    [self._source_sensor],
-                    self._source_sensor_changed,
-                )
-            )
-
-    @callback
-    def _source_sensor_changed(self, event) -> None:
-        """Handle source sensor state change."""
-        self.async_schedule_update_ha_state()
+        # Follow the engine's fused reading of the source probes
+        if self._source_sensors:
+            self._async_track_humidity(flush_on_status=True)
 
     @property
     def native_value(self) -> float | None:
-        """Return the current humidity from the source sensor."""
-        if not self._source_sensor:
-            return None
-
-        source_state = self.hass.states.get(self._source_sensor)
-        if not source_state or source_state.state == "unavailable":
-            return None
-
-        try:
-            return float(source_state.state)
-        except (ValueError, TypeError):
-            return None
+        """Return the current humidity fused from the source probes."""
+        humidity = self._engine.humidity(self._plant_id)
+        return round(humidity, 1) if humidity is not None else None
 
     @property
     def available(self) -> bool:
-        """Return if entity is available."""
-        if not self._source_sensor:
-            return False
-
-        source_state = self.hass.states.get(self._source_sensor)
-        return source_state is not None and source_state.state != "unavailable"
+        """Return if any source probe has a current reading."""
+        return self._engine.humidity(self._plant_id) is not None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        attrs = {"source_sensor": self._source_sensor}
+        attrs: dict[str, Any] = {"source_sensor": self._plant_config.get("humidity_sensor")}
+        if len(self._source_sensors) > 1:
+            attrs["fusion"] = self._plant_config.get("humidity_fusion", FUSION_MEAN)
+            attrs["fresh_probes"] = self._engine.fresh_probes(self._plant_id)
         
         # Get plant type data if available
-        plants_db = get_plant_database(self.hass, self._config_entry.entry_id)
+        catalog = get_plant_catalog(self.hass, self._config_entry.entry_id)
         plant_type = self._plant_config.get("type")
         
-        if plant_type and plant_type in plants_db.get("plants", {}):
-            plant_info = plants_db["plants"][plant_type]
+        if plant_type in catalog:
+            humidity_min, humidity_max = catalog.humidity_range(plant_type)
             attrs.update({
-                "humidity_min": plant_info.get("humidity_min", 30),
-                "humidity_max": plant_info.get("humidity_max", 70),
+                "humidity_min": humidity_min,
+                "humidity_max": humidity_max,
                 "plant_type": plant_type,
             })
 
         return attrs
+
+
+class PlantyRollupSensorBase(SensorEntity):
+    """Base class for sensors backed by status rollup counters."""
+
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "plants"
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        rollup: StatusRollup,
+        group: str,
+    ) -> None:
+        """Initialize the sensor."""
+        self.hass = hass
+        self._config_entry = config_entry
+        self._rollup = rollup
+        self._group = group
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        self.async_on_remove(
+            self._rollup.async_add_listener(self._group, self.async_write_ha_state)
+        )
+
+
+class PlantyStatusTotalSensor(PlantyRollupSensorBase):
+    """Sensor counting all plants in one status."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        rollup: StatusRollup,
+        status: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(hass, config_entry, rollup, GROUP_ALL)
+        self._status = status
+
+        self._attr_name = (
+            f"{entry_name(config_entry)} Plants {status.replace('_', ' ').title()}"
+        )
+        self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_total_{status}"
+        self._attr_icon = {
+            PLANT_STATUS_HEALTHY: "mdi:water-check",
+            PLANT_STATUS_NEEDS_WATER: "mdi:water-alert",
+            PLANT_STATUS_OVERDUE: "mdi:water-off",
+        }.get(status, "mdi:water-remove-outline")
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of plants in the status."""
+        return self._rollup.counts(GROUP_ALL)[self._status]
+
+
+class PlantyRollupSensor(PlantyRollupSensorBase):
+    """Sensor counting the plants of a group, with a breakdown per status."""
+
+    _attr_icon = "mdi:sprout"
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        rollup: StatusRollup,
+        group: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(hass, config_entry, rollup, group)
+
+        kind, _, value = group.partition(":")
+        self._kind = kind
+        self._value = value or None
+
+        self._attr_name = f"{entry_name(config_entry)} {self._group_name()} Plants"
+        self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_rollup_{group}"
+
+    def _group_name(self) -> str:
+        """Return a friendly name for the group."""
+        if self._kind == GROUP_ALL:
+            return "All"
+        if self._kind == GROUP_AREA:
+            area = ar.async_get(self.hass).async_get_area(self._value)
+            return area.name if area else self._value
+        entry = get_plant_catalog(self.hass, self._config_entry.entry_id).get(self._value)
+        if entry:
+            return entry.get("name", self._value)
+        return self._value.replace("_", " ").title()
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of plants in the group."""
+        return sum(self._rollup.counts(self._group).values())
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the plant count per status."""
+        counts = self._rollup.counts(self._group)
+        attrs: dict[str, Any] = {status: counts[status] for status in ROLLUP_STATUSES}
+        if self._value is not None:
+            attrs[self._kind] = self._value
+        return attrs
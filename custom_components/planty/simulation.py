@@ -0,0 +1,439 @@
+"""Accelerated simulation of Planty for load and behaviour testing.
+
+Runs the status engine, watering schedule, rollups, digests, watering
+detection and state write throttling on a simulated clock inside a bare
+Home Assistant core, so weeks of plant care for thousands of plants run in
+minutes and every run with the same seed is the same. Run it from the
+repository root with Home Assistant installed:
+
+    python -m custom_components.planty.simulation --plants 2000 --days 30
+
+Humidity comes from a synthetic drying model, or from a recorded trace
+given with --trace as a CSV file with time, entity_id and value columns.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.util import dt as dt_util
+
+from . import async_record_waterings, async_setup_storage
+from .catalog import async_setup_catalog
+from .blocking import LoopBlockMonitor
+from .clock import DATA_CLOCK, SimulatedClock
+from .const import (
+    CONF_DIGEST_NOTIFICATION,
+    CONF_STORAGE_BACKEND,
+    CONF_WATERING_DETECTION,
+    CONF_WRITE_MIN_DELTA,
+    CONF_WRITE_MIN_INTERVAL,
+    DEFAULT_STORAGE_BACKEND,
+    DEFAULT_WRITE_MIN_DELTA,
+    DEFAULT_WRITE_MIN_INTERVAL,
+    DOMAIN,
+    PLANT_STATUS_NEEDS_WATER,
+    PLANT_STATUS_OVERDUE,
+    SIGNAL_HUMIDITY_UPDATED,
+    WATERING_MODE_MANUAL,
+    WATERING_MODE_SENSOR,
+)
+from .detector import async_setup_detector
+from .digest import async_setup_digest
+from .engine import PlantyEngine
+from .rollup import async_setup_rollup
+from .schedule import async_setup_schedule
+from .throttle import StateWriteThrottle
+
+_LOGGER = logging.getLogger(__name__)
+
+SIMULATION_TYPES = ("snake_plant", "pothos", "peace_lily", "monstera", "zz_plant")
+
+
+class SimulationEntry:
+    """Config entry the simulated parts of the integration hang off."""
+
+    def __init__(self, options: dict[str, Any]) -> None:
+        """Initialize the entry."""
+        self.entry_id = "simulation"
+        self.unique_id = "simulation"
+        self.title = "Simulation"
+        self.data: dict[str, Any] = {}
+        self.options = options
+        self._on_unload: list[Callable[[], None]] = []
+
+    def async_on_unload(self, func: Callable[[], None]) -> None:
+        """Remember a callback to run when the simulation ends."""
+        self._on_unload.append(func)
+
+    def async_create_background_task(self, hass: HomeAssistant, target, name: str):
+        """Run a task the way a config entry does."""
+        return hass.async_create_task(target)
+
+    def async_unload(self) -> None:
+        """Run the unload callbacks."""
+        while self._on_unload:
+            self._on_unload.pop()()
+
+
+class PlantySimulation:
+    """Drive Planty through simulated time and count the work it does."""
+
+    def __init__(self, hass: HomeAssistant, args: argparse.Namespace) -> None:
+        """Initialize the simulation."""
+        self.hass = hass
+        self.args = args
+        self.counts: Counter[str] = Counter()
+        self._random = random.Random(args.seed)
+        self._trace = read_trace(args.trace) if args.trace else None
+        start = self._trace[0][0] if self._trace else dt_util.utcnow()
+        self.start = start.replace(second=0, microsecond=0)
+        self.clock = SimulatedClock(self.start)
+        self.entry = SimulationEntry({
+            CONF_STORAGE_BACKEND: args.storage,
+            CONF_WATERING_DETECTION: not args.no_detection,
+            CONF_DIGEST_NOTIFICATION: False,
+            CONF_WRITE_MIN_INTERVAL: args.write_interval,
+            CONF_WRITE_MIN_DELTA: args.write_delta,
+        })
+        self._humidity: dict[str, float] = {}
+        self._drying: dict[str, float] = {}
+        self._engine: PlantyEngine | None = None
+
+    def make_plants(self) -> dict[str, dict[str, Any]]:
+        """Return the simulated plants and set their probes' first readings."""
+        plants: dict[str, dict[str, Any]] = {}
+        if self._trace:
+            probes = sorted({entity_id for _, entity_id, _ in self._trace})
+            for index, probe in enumerate(probes):
+                plants[f"plant_{index}"] = self._sensor_plant(index, [probe])
+            return plants
+
+        now = self.clock.now()
+        for index in range(self.args.plants):
+            if self._random.random() < self.args.sensor_share:
+                probes = [
+                    f"sensor.sim_probe_{index}_{probe}" for probe in range(self.args.probes)
+                ]
+                plants[f"plant_{index}"] = self._sensor_plant(index, probes)
+                for probe in probes:
+                    self._humidity[probe] = self._random.uniform(30, 80)
+                    self._drying[probe] = self._random.uniform(0.1, 0.6)
+                continue
+            interval = self._random.randint(3, 14)
+            watered = now - timedelta(days=self._random.uniform(0, interval))
+            plants[f"plant_{index}"] = {
+                "name": f"Plant {index}",
+                "type": self._random.choice(SIMULATION_TYPES),
+                "watering_mode": WATERING_MODE_MANUAL,
+                "humidity_sensor": None,
+                "watering_interval": interval,
+                "last_watered": watered.replace(tzinfo=None).isoformat(),
+                "created": now.replace(tzinfo=None).isoformat(),
+            }
+        return plants
+
+    def _sensor_plant(self, index: int, probes: list[str]) -> dict[str, Any]:
+        """Return a sensor mode plant reading the given probes."""
+        return {
+            "name": f"Plant {index}",
+            "type": self._random.choice(SIMULATION_TYPES),
+            "watering_mode": WATERING_MODE_SENSOR,
+            "humidity_sensor": probes if len(probes) > 1 else probes[0],
+            "watering_interval": 7,
+            "created": self.clock.now().replace(tzinfo=None).isoformat(),
+        }
+
+    async def async_run(self) -> dict[str, Any]:
+        """Run the simulation and return its report."""
+        hass = self.hass
+        hass.data[DATA_CLOCK] = self.clock
+        await dr.async_load(hass)
+
+        storage = await async_setup_storage(hass, self.entry)
+        self._count_calls(storage, ("async_save", "_async_append"), "storage_writes")
+        await storage.async_set_plants(self.make_plants())
+        for probe, humidity in self._humidity.items():
+            self._set_probe(probe, humidity)
+        hass.data.setdefault(DOMAIN, {})[self.entry.entry_id] = {"storage": storage}
+
+        monitor = None
+        if self.args.max_block_ms:
+            monitor = LoopBlockMonitor(hass.loop, self.args.max_block_ms / 1000)
+            monitor.start()
+
+        catalog = await async_setup_catalog(hass)
+        await async_setup_schedule(hass, self.entry, storage)
+        engine = self._engine = PlantyEngine(hass, self.entry, storage, catalog)
+        await engine.async_start()
+        rollup = await async_setup_rollup(hass, self.entry, engine)
+        await async_setup_digest(hass, self.entry, engine)
+        await async_setup_detector(hass, self.entry, engine)
+        self._track_writes(engine, rollup)
+        self.counts.clear()
+
+        end = self.start + timedelta(days=self.args.days)
+        cpu_started = time.process_time()
+        wall_started = time.perf_counter()
+        if self._trace:
+            await self._replay_trace(end)
+        else:
+            await self._run_synthetic(end)
+        cpu = time.process_time() - cpu_started
+        wall = time.perf_counter() - wall_started
+
+        self.entry.async_unload()
+        await hass.async_add_executor_job(catalog.close)
+        if monitor is not None:
+            monitor.stop()
+
+        simulated = (end - self.start).total_seconds()
+        state_writes = (
+            self.counts["status_writes"]
+            + self.counts["humidity_writes"]
+            + self.counts["rollup_writes"]
+        )
+        report = {
+            "plants": len(engine.plants),
+            "simulated_days": self.args.days,
+            "samples": self.counts["samples"],
+            "transitions": self.counts["transitions"],
+            "transitions_per_second": round(self.counts["transitions"] / wall, 1) if wall else None,
+            "state_writes": state_writes,
+            "status_writes": self.counts["status_writes"],
+            "humidity_writes": self.counts["humidity_writes"],
+            "rollup_writes": self.counts["rollup_writes"],
+            "storage_writes": self.counts["storage_writes"],
+            "waterings": self.counts["waterings"],
+            "cpu_seconds": round(cpu, 2),
+            "wall_seconds": round(wall, 2),
+            "speedup": round(simulated / wall) if wall else None,
+        }
+        if monitor is not None:
+            report["loop_blocks"] = len(monitor.blocks)
+            report["longest_blocks"] = [
+                {"ms": round(duration * 1000, 1), "step": step}
+                for duration, step in monitor.longest()
+            ]
+        return report
+
+    async def _run_synthetic(self, end: datetime) -> None:
+        """Dry the probes step by step and water plants in a daily round."""
+        step = timedelta(minutes=self.args.sample_minutes)
+        hours = step.total_seconds() / 3600
+        next_round = self._next_round(self.clock.utcnow())
+        now = self.clock.utcnow()
+        while now < end:
+            now = min(now + step, end)
+            self.clock.advance_to(now)
+            for probe, humidity in self._humidity.items():
+                humidity -= self._drying[probe] * hours
+                humidity += self._random.gauss(0, self.args.noise)
+                self._humidity[probe] = min(100.0, max(0.0, humidity))
+                self._report_probe(probe, self._humidity[probe])
+            if now >= next_round:
+                await self._watering_round()
+                next_round += timedelta(days=1)
+            await self.hass.async_block_till_done()
+
+    async def _replay_trace(self, end: datetime) -> None:
+        """Feed recorded readings at their recorded times."""
+        next_round = self._next_round(self.clock.utcnow())
+        for when, entity_id, value in self._trace:
+            if when >= end:
+                break
+            while next_round <= when:
+                self.clock.advance_to(next_round)
+                await self._watering_round()
+                next_round += timedelta(days=1)
+            self.clock.advance_to(when)
+            self._report_probe(entity_id, value)
+            await self.hass.async_block_till_done()
+        self.clock.advance_to(end)
+
+    def _next_round(self, after: datetime) -> datetime:
+        """Return the next time the gardener waters."""
+        local = dt_util.as_local(after)
+        round_time = local.replace(hour=self.args.round_hour, minute=0, second=0, microsecond=0)
+        if round_time <= local:
+            round_time += timedelta(days=1)
+        return dt_util.as_utc(round_time)
+
+    async def _watering_round(self) -> None:
+        """Water every plant that needs it in one bulk call."""
+        engine = self._engine
+        thirsty = [
+            plant_id
+            for plant_id, status in engine.statuses.items()
+            if status in (PLANT_STATUS_NEEDS_WATER, PLANT_STATUS_OVERDUE)
+        ]
+        if not thirsty:
+            return
+        await async_record_waterings(self.hass, self.entry.entry_id, thirsty)
+        self.counts["waterings"] += len(thirsty)
+        if self._trace:
+            return
+        for plant_id in thirsty:
+            plant_data = engine.plants[plant_id]
+            if plant_data.get("watering_mode") != WATERING_MODE_SENSOR:
+                continue
+            sensors = plant_data["humidity_sensor"]
+            for probe in [sensors] if isinstance(sensors, str) else sensors:
+                self._humidity[probe] = self._random.uniform(70, 85)
+
+    def _report_probe(self, entity_id: str, value: float) -> None:
+        """Report a probe reading in its own loop step, like a real sensor."""
+        self.hass.loop.call_soon(self._set_probe, entity_id, value)
+
+    def _set_probe(self, entity_id: str, value: float) -> None:
+        """Report a probe reading."""
+        self.hass.states.async_set(
+            entity_id,
+            round(value, 1),
+            {"device_class": "humidity", "unit_of_measurement": "%"},
+        )
+        self.counts["samples"] += 1
+
+    def _track_writes(self, engine: PlantyEngine, rollup) -> None:
+        """Count the state writes the plant entities would make."""
+        hass = self.hass
+        options = self.entry.options
+
+        def count(name: str) -> Callable[..., None]:
+            def increment(*_args: Any) -> None:
+                self.counts[name] += 1
+            return increment
+
+        # One water status entity per plant writes on every transition
+        engine.async_add_listener(count("transitions"))
+        engine.async_add_listener(count("status_writes"))
+
+        # Humidity entities write through the same throttle as in sensor.py
+        for plant_id, plant_data in engine.plants.items():
+            if plant_data.get("watering_mode") != WATERING_MODE_SENSOR:
+                continue
+            throttle = StateWriteThrottle(
+                hass,
+                options.get(CONF_WRITE_MIN_INTERVAL, DEFAULT_WRITE_MIN_INTERVAL),
+                options.get(CONF_WRITE_MIN_DELTA, DEFAULT_WRITE_MIN_DELTA),
+                lambda plant_id=plant_id: engine.humidity(plant_id),
+                count("humidity_writes"),
+            )
+            async_dispatcher_connect(
+                hass, SIGNAL_HUMIDITY_UPDATED.format(plant_id), throttle.request
+            )
+            engine.async_add_plant_listener(plant_id, throttle.flush)
+
+        for group in rollup.groups:
+            rollup.async_add_listener(group, count("rollup_writes"))
+
+    def _count_calls(self, target: Any, names: tuple[str, ...], counter: str) -> None:
+        """Count calls of the given coroutine methods of an object."""
+        for name in names:
+            method = getattr(target, name, None)
+            if method is None:
+                continue
+
+            async def counted(*args: Any, _method=method, **kwargs: Any) -> Any:
+                self.counts[counter] += 1
+                return await _method(*args, **kwargs)
+
+            setattr(target, name, counted)
+
+
+def read_trace(path: str) -> list[tuple[datetime, str, float]]:
+    """Read a recorded humidity trace ordered by time."""
+    samples = []
+    with open(path, newline="", encoding="utf-8") as trace_file:
+        for row in csv.DictReader(trace_file):
+            try:
+                when = dt_util.parse_datetime(row["time"])
+                value = float(row["value"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if when is None:
+                continue
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+            samples.append((dt_util.as_utc(when), row["entity_id"], value))
+    if not samples:
+        raise ValueError(f"No readings in {path}")
+    samples.sort(key=lambda sample: sample[0])
+    return samples
+
+
+async def async_main(args: argparse.Namespace) -> dict[str, Any]:
+    """Run a simulation in a temporary Home Assistant instance."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        try:
+            hass = HomeAssistant(config_dir)
+        except TypeError:
+            # Before 2024.2 the config dir was set after creating the instance
+            hass = HomeAssistant()
+            hass.config.config_dir = config_dir
+        await hass.async_start()
+        try:
+            return await PlantySimulation(hass, args).async_run()
+        finally:
+            await hass.async_stop(force=True)
+
+
+def main() -> None:
+    """Parse the command line and print the simulation report."""
+    parser = argparse.ArgumentParser(description="Simulate Planty at accelerated speed")
+    parser.add_argument("--plants", type=int, default=1000, help="number of plants")
+    parser.add_argument("--days", type=float, default=30, help="simulated days")
+    parser.add_argument("--sensor-share", type=float, default=0.5,
+                        help="share of plants in sensor mode")
+    parser.add_argument("--probes", type=int, default=1, help="probes per sensor plant")
+    parser.add_argument("--sample-minutes", type=float, default=10,
+                        help="minutes between synthetic probe readings")
+    parser.add_argument("--noise", type=float, default=0.3,
+                        help="standard deviation of synthetic reading noise")
+    parser.add_argument("--round-hour", type=int, default=8,
+                        help="local hour of the daily watering round")
+    parser.add_argument("--trace", help="CSV file of recorded readings to replay")
+    parser.add_argument("--storage", default=DEFAULT_STORAGE_BACKEND,
+                        choices=["store", "journal"], help="storage backend")
+    parser.add_argument("--write-interval", type=float, default=DEFAULT_WRITE_MIN_INTERVAL,
+                        help="minimum seconds between humidity writes")
+    parser.add_argument("--write-delta", type=float, default=DEFAULT_WRITE_MIN_DELTA,
+                        help="minimum humidity change to write")
+    parser.add_argument("--no-detection", action="store_true",
+                        help="turn off watering detection")
+    parser.add_argument("--max-block-ms", type=float,
+                        help="fail if Planty code blocks the event loop longer than this")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    report = asyncio.run(async_main(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        longest_blocks = report.pop("longest_blocks", [])
+        width = max(len(key) for key in report)
+        for key, value in report.items():
+            print(f"{key.replace('_', ' '):<{width}}  {value}")
+        for block in longest_blocks:
+            print(f"blocked {block['ms']} ms in {block['step']}")
+    if report.get("loop_blocks"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
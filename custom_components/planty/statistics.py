@@ -0,0 +1,282 @@
+"""Long-term statistics for Planty integration."""
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, PERCENTAGE, UnitOfTime
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
+
+from .clock import get_clock
+from .const import (
+    CONF_LONG_TERM_STATISTICS,
+    DEFAULT_LONG_TERM_STATISTICS,
+    DOMAIN,
+)
+from .engine import PlantyEngine
+from .entries import entry_storage_prefix
+
+_LOGGER = logging.getLogger(__name__)
+
+STATISTICS_SAVE_DELAY = 60  # seconds
+HOUR = timedelta(hours=1)
+FLUSH_DELAY = timedelta(seconds=30)
+
+
+def _hour_start(when: datetime) -> datetime:
+    """Return the start of the hour containing a time."""
+    return dt_util.as_utc(when).replace(minute=0, second=0, microsecond=0)
+
+
+class PlantStatistics:
+    """Hourly plant statistics accumulated in memory.
+
+    Humidity samples, waterings and status time only update counters for the
+    open hour. When the hour closes its rows are queued and all queued rows
+    are written to the recorder in one pass, once per hour. Cumulative sums
+    and the open hour are kept in a store so restarts neither reset the sums
+    nor lose the hour in progress.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, engine: PlantyEngine, prefix: str = DOMAIN
+    ) -> None:
+        """Initialize empty statistics."""
+        self.hass = hass
+        self._engine = engine
+        self._clock = get_clock(hass)
+        self._store = Store(hass, 1, f"{prefix}.statistics")
+        self._hour = _hour_start(self._clock.utcnow())
+        self._totals: dict[str, float] = {}
+        self._humidity: dict[str, list[float]] = {}
+        self._waterings: Counter[str] = Counter()
+        self._status_seconds: dict[str, Counter[str]] = {}
+        self._since: dict[str, tuple[str, datetime]] = {}
+        self._pending: dict[str, list[dict[str, Any]]] = {}
+        self._metadata: dict[str, dict[str, Any]] = {}
+        self._unsub_flush: Callable[[], None] | None = None
+
+    async def async_load(self) -> None:
+        """Restore sums and the open hour, and start timing every plant."""
+        stored = await self._store.async_load() or {}
+        self._totals = stored.get("totals", {})
+        open_hour = stored.get("open")
+        if open_hour:
+            self._hour = datetime.fromisoformat(open_hour["hour"])
+            self._humidity = open_hour["humidity"]
+            self._waterings = Counter(open_hour["waterings"])
+            self._status_seconds = {
+                plant_id: Counter(seconds)
+                for plant_id, seconds in open_hour["status_seconds"].items()
+            }
+
+        now = self._clock.utcnow()
+        for plant_id in self._engine.plants:
+            self._since[plant_id] = (self._engine.status(plant_id), now)
+        # Close an open hour restored from before a longer downtime
+        self._advance(now)
+
+    @callback
+    def handle_sample(self, plant_id: str, humidity: float, when: datetime) -> None:
+        """Add a humidity sample to the open hour."""
+        if not 0 <= humidity <= 100:
+            return
+        self._advance(self._clock.utcnow())
+        values = self._humidity.get(plant_id)
+        if values is None:
+            self._humidity[plant_id] = [1, humidity, humidity, humidity]
+        else:
+            values[0] += 1
+            values[1] += humidity
+            values[2] = min(values[2], humidity)
+            values[3] = max(values[3], humidity)
+
+    @callback
+    def handle_transition(self, plant_id: str, old_status: str | None, new_status: str) -> None:
+        """Close the running status interval of a plant."""
+        now = self._clock.utcnow()
+        self._advance(now)
+        self._close_interval(plant_id, now)
+        self._since[plant_id] = (new_status, now)
+
+    @callback
+    def handle_watered(self, event: Event) -> None:
+        """Count a watering in the open hour."""
+        plant_id = event.data.get("plant_id")
+        # Waterings of other entries' plants are counted by their statistics
+        if plant_id in self._engine.plants:
+            self._advance(self._clock.utcnow())
+            self._waterings[plant_id] += 1
+
+    @callback
+    def async_schedule_flush(self) -> None:
+        """Arm the flush for a little after the next full hour."""
+        # Rows are written a little after the hour so the hour is complete
+        self._unsub_flush = self._clock.call_at(
+            self.hass, self._hour + HOUR + FLUSH_DELAY, self._scheduled_flush
+        )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop the hourly flush."""
+        if self._unsub_flush:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+    @callback
+    def _scheduled_flush(self, _now: datetime) -> None:
+        """Flush and arm the next hourly flush."""
+        self._unsub_flush = None
+        self.async_flush()
+        self.async_schedule_flush()
+
+    @callback
+    def async_flush(self) -> None:
+        """Close finished hours and write all queued rows."""
+        self._advance(self._clock.utcnow())
+        if self._pending:
+            for statistic_id, rows in self._pending.items():
+                async_add_external_statistics(
+                    self.hass, self._metadata[statistic_id], rows
+                )
+            _LOGGER.debug(
+                "Wrote %d rows for %d statistics",
+                sum(len(rows) for rows in self._pending.values()),
+                len(self._pending),
+            )
+            self._pending.clear()
+            self._metadata.clear()
+        self._store.async_delay_save(self._data_to_save, STATISTICS_SAVE_DELAY)
+
+    async def async_save(self, _event: Event | None = None) -> None:
+        """Flush queued rows and store sums and the open hour now."""
+        self.async_flush()
+        await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the sums and open hour counters to store."""
+        # Time in the running intervals is stored with the open hour
+        now = self._clock.utcnow()
+        status_seconds = {
+            plant_id: dict(seconds) for plant_id, seconds in self._status_seconds.items()
+        }
+        for plant_id, (status, since) in self._since.items():
+            seconds = status_seconds.setdefault(plant_id, {})
+            seconds[status] = seconds.get(status, 0) + (now - since).total_seconds()
+        return {
+            "totals": self._totals,
+            "open": {
+                "hour": self._hour.isoformat(),
+                "humidity": self._humidity,
+                "waterings": dict(self._waterings),
+                "status_seconds": status_seconds,
+            },
+        }
+
+    def _close_interval(self, plant_id: str, until: datetime) -> None:
+        """Add the time since the last transition to the open hour."""
+        running = self._since.get(plant_id)
+        if running is None:
+            return
+        status, since = running
+        if until <= since:
+            return
+        seconds = (until - max(since, self._hour)).total_seconds()
+        if seconds > 0:
+            self._status_seconds.setdefault(plant_id, Counter())[status] += seconds
+        self._since[plant_id] = (status, until)
+
+    def _advance(self, now: datetime) -> None:
+        """Close every hour that ended before now."""
+        while now >= self._hour + HOUR:
+            end = self._hour + HOUR
+            for plant_id in list(self._since):
+                self._close_interval(plant_id, end)
+            self._queue_hour()
+            self._hour = end
+
+    def _queue_hour(self) -> None:
+        """Turn the counters of the open hour into rows and reset them."""
+        plants = self._engine.plants
+        for plant_id, (count, total, minimum, maximum) in self._humidity.items():
+            self._queue(
+                plant_id,
+                "humidity",
+                plants,
+                {"mean": total / count, "min": minimum, "max": maximum},
+            )
+        for plant_id, count in self._waterings.items():
+            self._queue_sum(plant_id, "waterings", plants, count)
+        for plant_id, seconds in self._status_seconds.items():
+            for status, status_seconds in seconds.items():
+                self._queue_sum(
+                    plant_id, f"time_{status}", plants, status_seconds / 3600
+                )
+
+        self._humidity = {}
+        self._waterings = Counter()
+        self._status_seconds = {}
+
+    def _queue_sum(
+        self, plant_id: str, kind: str, plants: dict[str, Any], state: float
+    ) -> None:
+        """Queue a row of a cumulative statistic."""
+        statistic_id = f"{DOMAIN}:{slugify(plant_id)}_{kind}"
+        total = self._totals.get(statistic_id, 0) + state
+        self._totals[statistic_id] = total
+        self._queue(plant_id, kind, plants, {"state": state, "sum": total})
+
+    def _queue(
+        self, plant_id: str, kind: str, plants: dict[str, Any], row: dict[str, Any]
+    ) -> None:
+        """Queue a row of a plant statistic for the open hour."""
+        statistic_id = f"{DOMAIN}:{slugify(plant_id)}_{kind}"
+        if statistic_id not in self._metadata:
+            name = plants.get(plant_id, {}).get("name", plant_id)
+            if kind == "humidity":
+                unit, label = PERCENTAGE, "humidity"
+            elif kind == "waterings":
+                unit, label = None, "waterings"
+            else:
+                unit, label = UnitOfTime.HOURS, kind.replace("_", " ")
+            self._metadata[statistic_id] = {
+                "has_mean": "mean" in row,
+                "has_sum": "sum" in row,
+                "name": f"{name} {label}",
+                "source": DOMAIN,
+                "statistic_id": statistic_id,
+                "unit_of_measurement": unit,
+            }
+        self._pending.setdefault(statistic_id, []).append({"start": self._hour, **row})
+
+
+async def async_setup_statistics(
+    hass: HomeAssistant, entry: ConfigEntry, engine: PlantyEngine
+) -> PlantStatistics | None:
+    """Set up long-term statistics for an entry."""
+    if not entry.options.get(CONF_LONG_TERM_STATISTICS, DEFAULT_LONG_TERM_STATISTICS):
+        return None
+    if "recorder" not in hass.config.components:
+        _LOGGER.debug("Recorder not loaded, not writing long-term statistics")
+        return None
+
+    statistics = PlantStatistics(hass, engine, entry_storage_prefix(entry))
+    await statistics.async_load()
+
+    entry.async_on_unload(engine.async_add_listener(statistics.handle_transition))
+    entry.async_on_unload(engine.async_add_sample_listener(statistics.handle_sample))
+    entry.async_on_unload(
+        hass.bus.async_listen(f"{DOMAIN}_plant_watered", statistics.handle_watered)
+    )
+    statistics.async_schedule_flush()
+    entry.async_on_unload(statistics.async_cancel)
+    entry.async_on_unload(
+        hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, statistics.async_save)
+    )
+    return statistics
@@ -0,0 +1,87 @@
+"""State write throttling for Planty integration."""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Callable
+
+from homeassistant.core import HomeAssistant, callback
+
+from .clock import get_clock
+
+
+class StateWriteThrottle:
+    """Coalesce the state writes of an entity with a noisy source.
+
+    A change is written at once when the last write is at least
+    min_interval ago and the value moved by at least min_delta since then.
+    Otherwise one write of the latest value is scheduled for the end of the
+    interval, and changes below min_delta are held until they add up.
+    Becoming available or unavailable is always written at once, and
+    flush() writes at once for changes the caller knows are important.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        min_interval: float,
+        min_delta: float,
+        value: Callable[[], float | None],
+        write: Callable[[], None],
+    ) -> None:
+        """Initialize the throttle."""
+        self.hass = hass
+        self._clock = get_clock(hass)
+        self._min_interval = min_interval
+        self._min_delta = min_delta
+        self._value = value
+        self._write = write
+        self._written: float | None = None
+        self._written_at: float | None = None
+        self._unsub_write: Callable[[], None] | None = None
+
+    @callback
+    def request(self) -> None:
+        """Write the current value now or later, or drop it."""
+        value = self._value()
+        if not self._changed(value):
+            return
+        if value is None or self._written is None:
+            self.flush()
+            return
+
+        elapsed = self._clock.monotonic() - (self._written_at or 0)
+        if elapsed >= self._min_interval:
+            self.flush()
+        elif self._unsub_write is None:
+            self._unsub_write = self._clock.call_later(
+                self.hass, self._min_interval - elapsed, self._write_later
+            )
+
+    @callback
+    def flush(self) -> None:
+        """Write the current value at once."""
+        self.cancel()
+        self._written = self._value()
+        self._written_at = self._clock.monotonic()
+        self._write()
+
+    @callback
+    def cancel(self) -> None:
+        """Drop a scheduled write."""
+        if self._unsub_write:
+            self._unsub_write()
+            self._unsub_write = None
+
+    @callback
+    def _write_later(self, _now: datetime) -> None:
+        """Write the latest value at the end of the interval."""
+        self._unsub_write = None
+        if self._changed(self._value()):
+            self.flush()
+
+    def _changed(self, value: float | None) -> bool:
+        """Return True if a value differs enough from the written one."""
+        if value is None or self._written is None:
+            return value != self._written or self._written_at is None
+        delta = abs(value - self._written)
+        return delta > 0 and delta >= self._min_delta
@@ -0,0 +1,126 @@
+"""Watering to-do list for Planty integration."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.components.todo import (
+    TodoItem,
+    TodoItemStatus,
+    TodoListEntity,
+    TodoListEntityFeature,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from . import async_record_watering
+from .const import (
+    DOMAIN,
+    PLANT_STATUS_NEEDS_WATER,
+    PLANT_STATUS_OVERDUE,
+    WATERING_MODE_SENSOR,
+)
+from .engine import PlantyEngine
+from .entries import entry_name
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Planty watering list from a config entry."""
+    engine = hass.data[DOMAIN][config_entry.entry_id]["engine"]
+    async_add_entities([PlantyWaterTodoList(hass, config_entry, engine)])
+
+
+class PlantyWaterTodoList(TodoListEntity):
+    """To-do list of the plants that need water.
+
+    Items are added and removed from status transitions reported by the
+    engine, so the list never scans the plant collection after startup.
+    """
+
+    _attr_icon = "mdi:watering-can"
+    _attr_supported_features = TodoListEntityFeature.UPDATE_TODO_ITEM
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        engine: PlantyEngine,
+    ) -> None:
+        """Initialize the to-do list."""
+        self.hass = hass
+        self._config_entry = config_entry
+        self._engine = engine
+        self._items: dict[str, TodoItem] = {}
+
+        self._attr_name = f"{entry_name(config_entry)} To Water"
+        self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_to_water"
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        for plant_id, status in self._engine.statuses.items():
+            if self._needs_water(plant_id, status):
+                self._items[plant_id] = self._make_item(plant_id, status)
+
+        self.async_on_remove(self._engine.async_add_listener(self._handle_transition))
+
+    @callback
+    def _handle_transition(self, plant_id: str, old_status: str | None, new_status: str) -> None:
+        """Add or remove a plant when its status changes."""
+        if self._needs_water(plant_id, new_status):
+            self._items[plant_id] = self._make_item(plant_id, new_status)
+        elif self._items.pop(plant_id, None) is None:
+            return
+        self.async_write_ha_state()
+
+    @property
+    def todo_items(self) -> list[TodoItem]:
+        """Return the plants to water."""
+        return list(self._items.values())
+
+    async def async_update_todo_item(self, item: TodoItem) -> None:
+        """Record a watering when an item is ticked off."""
+        current = self._items.get(item.uid)
+        if current is None:
+            return
+
+        if item.status == TodoItemStatus.COMPLETED and current.status != TodoItemStatus.COMPLETED:
+            # Sensor mode plants stay on the list until their humidity recovers
+            self._items[item.uid] = TodoItem(
+                summary=current.summary,
+                uid=current.uid,
+                status=TodoItemStatus.COMPLETED,
+                description=current.description,
+            )
+            await async_record_watering(self.hass, self._config_entry.entry_id, item.uid)
+            _LOGGER.info("Plant %s was watered from the to-do list", item.uid)
+        elif item.status == TodoItemStatus.NEEDS_ACTION:
+            self._items[item.uid] = self._make_item(item.uid, self._engine.status(item.uid))
+
+        self.async_write_ha_state()
+
+    def _needs_water(self, plant_id: str, status: str) -> bool:
+        """Return True if a plant with this status belongs on the list."""
+        if status == PLANT_STATUS_NEEDS_WATER:
+            return True
+        # In sensor mode overdue means the soil is too wet
+        plant_data = self._engine.plants.get(plant_id, {})
+        return (
+            status == PLANT_STATUS_OVERDUE
+            and plant_data.get("watering_mode") != WATERING_MODE_SENSOR
+        )
+
+    def _make_item(self, plant_id: str, status: str) -> TodoItem:
+        """Build the list item for a plant."""
+        plant_name = self._engine.plants.get(plant_id, {}).get("name", plant_id)
+        return TodoItem(
+            summary=f"Water {plant_name}",
+            uid=plant_id,
+            status=TodoItemStatus.NEEDS_ACTION,
+            description="Overdue" if status == PLANT_STATUS_OVERDUE else "Needs water",
+        )
@@ -0,0 +1,213 @@
+"""Plant import and export for Planty integration."""
+from __future__ import annotations
+
+import csv
+import json
+import os
+from typing import Any, Iterator
+
+import voluptuous as vol
+
+CONFLICT_SKIP = "skip"
+CONFLICT_RENAME = "rename"
+CONFLICT_REPLACE = "replace"
+
+EXPORT_FIELDS = (
+    "plant_id",
+    "plant_name",
+    "plant_type",
+    "watering_mode",
+    "humidity_sensor",
+    "humidity_fusion",
+    "humidity_weights",
+    "watering_interval",
+    "valve",
+    "valve_duration",
+    "valve_flow",
+    "last_watered",
+    "created",
+)
+
+# Stored plant keys by import column
+STORED_FIELDS = {
+    "plant_name": "name",
+    "plant_type": "type",
+    "watering_mode": "watering_mode",
+    "humidity_sensor": "humidity_sensor",
+    "humidity_fusion": "humidity_fusion",
+    "humidity_weights": "humidity_weights",
+    "watering_interval": "watering_interval",
+    "valve": "valve",
+    "valve_duration": "valve_duration",
+    "valve_flow": "valve_flow",
+    "last_watered": "last_watered",
+    "created": "created",
+}
+
+
+def plant_slug(plant_name: str) -> str:
+    """Return the plant id derived from a plant name."""
+    return plant_name.lower().replace(" ", "_")
+
+
+def file_format(path: str) -> str:
+    """Return the transfer format of a file from its extension."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in (".csv", ".json"):
+        raise ValueError(f"Unsupported file type '{extension}', use .csv or .json")
+    return extension[1:]
+
+
+def read_rows(path: str) -> Iterator[dict[str, Any]]:
+    """Yield the plant rows of a CSV or JSON file."""
+    if file_format(path) == "csv":
+        with open(path, newline="", encoding="utf-8") as csv_file:
+            for row in csv.DictReader(csv_file):
+                if row.get("humidity_weights"):
+                    row["humidity_weights"] = _parse_csv_weights(row["humidity_weights"])
+                yield row
+        return
+
+    with open(path, encoding="utf-8") as json_file:
+        data = json.load(json_file)
+    if isinstance(data, dict):
+        data = data.get("plants", [])
+    if not isinstance(data, list):
+        raise ValueError("Expected a list of plants")
+    yield from data
+
+
+def plan_import(
+    rows: Iterator[dict[str, Any]],
+    plants: dict[str, dict[str, Any]],
+    schema: vol.Schema,
+    on_conflict: str,
+    now: str,
+    reserved: set[str] | frozenset[str] = frozenset(),
+) -> dict[str, Any]:
+    """Validate rows and work out the plants an import would write.
+
+    Returns the new plant records by id together with a report of added,
+    replaced, renamed and skipped plants and rows that failed validation.
+    Reserved ids belong to plants of other entries; they can be renamed
+    around but never replaced.
+    """
+    records: dict[str, dict[str, Any]] = {}
+    report: dict[str, list[Any]] = {
+        "added": [],
+        "replaced": [],
+        "renamed": [],
+        "conflicts": [],
+        "errors": [],
+    }
+
+    for row_number, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            report["errors"].append({"row": row_number, "error": "Expected an object"})
+            continue
+        # Empty cells and nulls mean the field is not set
+        row = {
+            key: value
+            for key, value in row.items()
+            if key and key != "plant_id" and value not in ("", None)
+        }
+        try:
+            data = schema(row)
+        except vol.Invalid as err:
+            report["errors"].append({"row": row_number, "error": str(err)})
+            continue
+
+        plant_id = plant_slug(data["plant_name"])
+        if plant_id in plants or plant_id in records or plant_id in reserved:
+            if plant_id in records:
+                existing = "import"
+            elif plant_id in reserved:
+                existing = "other_entry"
+            else:
+                existing = "stored"
+            conflict = {"row": row_number, "plant_id": plant_id, "existing": existing}
+            if on_conflict == CONFLICT_SKIP or (
+                on_conflict == CONFLICT_REPLACE and existing == "other_entry"
+            ):
+                report["conflicts"].append(conflict)
+                continue
+            if on_conflict == CONFLICT_RENAME:
+                suffix = 2
+                while any(
+                    f"{plant_id}_{suffix}" in taken for taken in (plants, records, reserved)
+                ):
+                    suffix += 1
+                report["renamed"].append({**conflict, "new_plant_id": f"{plant_id}_{suffix}"})
+                plant_id = f"{plant_id}_{suffix}"
+            else:
+                report["replaced"].append(conflict)
+
+        # Replaced plants keep what the file does not set, like their photo
+        record = dict(plants.get(plant_id, {})) if plant_id not in records else {}
+        record.update(
+            (stored, data[field])
+            for field, stored in STORED_FIELDS.items()
+            if data.get(field) is not None
+        )
+        # New plants get the defaults of add_plant
+        record.setdefault("created", now)
+        record.setdefault("type", None)
+        record.setdefault("watering_mode", "manual")
+        record.setdefault("watering_interval", 7)
+        record.setdefault("humidity_sensor", None)
+        records[plant_id] = record
+        if plant_id not in plants:
+            report["added"].append(plant_id)
+
+    return {"records": records, "report": report}
+
+
+def _csv_value(value: Any) -> Any:
+    """Return a field value as written to a CSV cell."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        # Several humidity probes, read back as a comma separated list
+        return ",".join(value)
+    if isinstance(value, dict):
+        # Probe weights, written as comma separated probe=weight pairs
+        return ",".join(f"{key}={weight}" for key, weight in value.items())
+    return value
+
+
+def _parse_csv_weights(value: str) -> dict[str, str] | str:
+    """Return the probe weights of a CSV cell, or the cell if it is malformed."""
+    pairs = [pair.partition("=") for pair in value.split(",") if pair.strip()]
+    if not all(separator for _, separator, _ in pairs):
+        # Left for the row schema to reject
+        return value
+    return {probe.strip(): weight.strip() for probe, _, weight in pairs}
+
+
+def write_plants(path: str, plants: dict[str, dict[str, Any]]) -> int:
+    """Write plants to a CSV or JSON file and return how many were written."""
+    rows = (
+        {
+            "plant_id": plant_id,
+            **{
+                field: plant_data.get(stored)
+                for field, stored in STORED_FIELDS.items()
+            },
+        }
+        for plant_id, plant_data in plants.items()
+    )
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.tmp"
+    if file_format(path) == "csv":
+        with open(temp_path, "w", newline="", encoding="utf-8") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=EXPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(
+                {key: _csv_value(value) for key, value in row.items()} for row in rows
+            )
+    else:
+        with open(temp_path, "w", encoding="utf-8") as json_file:
+            json.dump({"plants": list(rows)}, json_file, indent=2)
+    os.replace(temp_path, path)
+    return len(plants)
@@ -0,0 +1,135 @@
+"""HTTP views for Planty integration."""
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import time
+from functools import partial
+from http import HTTPStatus
+from typing import IO
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_SHARED
+from .image import ImageHandler
+
+_LOGGER = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+UPLOAD_MAX_BYTES = 25 * 1024 * 1024
+
+
+def _get_image_handler(hass: HomeAssistant) -> ImageHandler | None:
+    """Return the image handler all entries share."""
+    shared = hass.data.get(DATA_SHARED)
+    return shared["image_handler"] if shared else None
+
+
+def _is_unsafe_plant_id(plant_id: str) -> bool:
+    """Return True if a plant id could escape the image directory."""
+    return not plant_id or plant_id.startswith(".") or "/" in plant_id or "\\" in plant_id
+
+
+class PlantyImageView(HomeAssistantView):
+    """Serve processed plant images from memory.
+
+    Images carry a strong ETag and must be revalidated, so a dashboard that
+    already has a photo gets a 304 without the file being read again.
+    """
+
+    url = "/api/planty/images/{plant_id}"
+    name = "api:planty:image"
+    requires_auth = True
+
+    async def get(self, request: web.Request, plant_id: str) -> web.Response:
+        """Return the image of a plant."""
+        hass: HomeAssistant = request.app["hass"]
+        image_handler = _get_image_handler(hass)
+        if image_handler is None or _is_unsafe_plant_id(plant_id):
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        image = await image_handler.async_get_image(plant_id)
+        if image is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        data, etag = image
+
+        headers = {hdrs.ETAG: etag, hdrs.CACHE_CONTROL: "private, no-cache"}
+        if_none_match = request.headers.get(hdrs.IF_NONE_MATCH, "")
+        if if_none_match.strip() == "*" or etag in (
+            tag.strip() for tag in if_none_match.split(",")
+        ):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        return web.Response(body=data, content_type="image/jpeg", headers=headers)
+
+    async def post(self, request: web.Request, plant_id: str) -> web.Response:
+        """Replace the photo of a plant with an uploaded image.
+
+        The multipart body is streamed to a temporary file in chunks, so
+        large phone photos never sit in memory as a whole.
+        """
+        hass: HomeAssistant = request.app["hass"]
+        # Imported here to avoid a cycle with the integration module
+        from . import async_update_plant_image, get_plant_entry_id
+
+        entry_id = get_plant_entry_id(hass, plant_id)
+        if entry_id is None:
+            return self.json_message("Unknown plant", HTTPStatus.NOT_FOUND)
+
+        try:
+            reader = await request.multipart()
+        except (AssertionError, ValueError):
+            return self.json_message("Expected multipart data", HTTPStatus.BAD_REQUEST)
+        field = await reader.next()
+        while field is not None and field.name != "file":
+            field = await reader.next()
+        if field is None:
+            return self.json_message("Missing file field", HTTPStatus.BAD_REQUEST)
+
+        started = time.monotonic()
+        temp_file = await hass.async_add_executor_job(
+            partial(tempfile.NamedTemporaryFile, prefix="planty_", suffix=".upload", delete=False)
+        )
+        try:
+            size = 0
+            while chunk := await field.read_chunk(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > UPLOAD_MAX_BYTES:
+                    return self.json_message(
+                        f"Image is larger than {UPLOAD_MAX_BYTES // (1024 * 1024)} MB",
+                        HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                    )
+                await hass.async_add_executor_job(temp_file.write, chunk)
+            await hass.async_add_executor_job(temp_file.close)
+            uploaded = time.monotonic()
+
+            image_url = await async_update_plant_image(hass, entry_id, plant_id, temp_file.name)
+            processed = time.monotonic()
+        finally:
+            await hass.async_add_executor_job(_remove_temp_file, temp_file)
+
+        if image_url is None:
+            return self.json_message("Could not process image", HTTPStatus.BAD_REQUEST)
+
+        upload_time = max(uploaded - started, 1e-6)
+        _LOGGER.debug(
+            "Uploaded %.1f kB image for %s at %.1f MB/s, processed in %.1f ms",
+            size / 1024,
+            plant_id,
+            size / upload_time / (1024 * 1024),
+            (processed - uploaded) * 1000,
+        )
+        return self.json({"url": image_url})
+
+
+def _remove_temp_file(temp_file: IO[bytes]) -> None:
+    """Close and delete an upload's temporary file."""
+    temp_file.close()
+    try:
+        os.unlink(temp_file.name)
+    except FileNotFoundError:
+        pass
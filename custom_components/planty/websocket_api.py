@@ -0,0 +1,97 @@
+"""Websocket API for Planty integration."""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_SHARED, DOMAIN
+from .fusion import ProbeFusion
+from .history import Point, async_get_humidity_series
+from .search import SEARCH_DEFAULT_LIMIT, SpeciesSearchIndex
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the Planty websocket commands."""
+    websocket_api.async_register_command(hass, ws_search_species)
+    websocket_api.async_register_command(hass, ws_humidity_history)
+
+
+def _get_search_index(hass: HomeAssistant) -> SpeciesSearchIndex | None:
+    """Return the species search index all entries share."""
+    shared = hass.data.get(DATA_SHARED)
+    return shared["search_index"] if shared else None
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): "planty/species/search",
+    vol.Required("query"): str,
+    vol.Optional("limit", default=SEARCH_DEFAULT_LIMIT): vol.All(
+        int, vol.Range(min=1, max=50)
+    ),
+})
+@callback
+def ws_search_species(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return ranked species matches for a search query."""
+    index = _get_search_index(hass)
+    if index is None:
+        connection.send_error(msg["id"], "not_loaded", "Planty is not loaded")
+        return
+
+    connection.send_result(
+        msg["id"], {"results": index.search(msg["query"], msg["limit"])}
+    )
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): "planty/history/humidity",
+    vol.Required("plant_ids"): [str],
+    vol.Optional("hours", default=720): vol.All(int, vol.Range(min=1, max=2160)),
+    vol.Optional("points", default=60): vol.All(int, vol.Range(min=3, max=500)),
+})
+@websocket_api.async_response
+async def ws_humidity_history(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return downsampled humidity history for many plants at once."""
+    entries = hass.data.get(DOMAIN, {})
+    if not entries:
+        connection.send_error(msg["id"], "not_loaded", "Planty is not loaded")
+        return
+
+    # Plants can come from several entries, each with its own cache
+    series: dict[str, list[Point]] = {}
+    for entry_data in entries.values():
+        engine = entry_data["engine"]
+        # Plants with several probes show the history of their fused humidity
+        fusions: dict[str, ProbeFusion] = {}
+        for plant_id in msg["plant_ids"]:
+            if plant_id in engine.plants:
+                fusion = engine.history_fusion(plant_id)
+                if fusion is not None:
+                    fusions[plant_id] = fusion
+        if fusions:
+            series.update(
+                await async_get_humidity_series(
+                    hass, entry_data["history_cache"], fusions, msg["hours"], msg["points"]
+                )
+            )
+    connection.send_result(
+        msg["id"],
+        {
+            "series": {
+                plant_id: [[int(when), round(value, 1)] for when, value in points]
+                for plant_id, points in series.items()
+            }
+        },
+    )
@@ -0,0 +1,147 @@
+// Shared base for all Planty cards.
+//
+// Styles are parsed once per card type into a constructable stylesheet that
+// every instance adopts, markup is cloned from a prebuilt <template>, and
+// updates from all cards are batched into one animation frame.
+
+const styleSheets = new WeakMap();
+const templates = new WeakMap();
+
+const pendingUpdates = new Set();
+let updateFrame = null;
+
+function flushUpdates() {
+  updateFrame = null;
+  const elements = [...pendingUpdates];
+  pendingUpdates.clear();
+  for (const element of elements) {
+    try {
+      element.update();
+    } catch (err) {
+      console.error(`Planty: ${element.localName} update failed`, err);
+    }
+  }
+}
+
+export function scheduleUpdate(element) {
+  pendingUpdates.add(element);
+  if (updateFrame === null) {
+    updateFrame = requestAnimationFrame(flushUpdates);
+  }
+}
+
+function styleSheetFor(cardClass) {
+  let sheet = styleSheets.get(cardClass);
+  if (!sheet) {
+    sheet = new CSSStyleSheet();
+    sheet.replaceSync(cardClass.styles);
+    styleSheets.set(cardClass, sheet);
+  }
+  return sheet;
+}
+
+function templateFor(cardClass) {
+  let template = templates.get(cardClass);
+  if (!template) {
+    template = document.createElement('template');
+    template.innerHTML = cardClass.template;
+    templates.set(cardClass, template);
+  }
+  return template;
+}
+
+export class PlantyElement extends HTMLElement {
+  static styles = '';
+  static template = '';
+
+  constructor() {
+    super();
+    this.attachShadow({ mode: 'open' });
+    this.shadowRoot.adoptedStyleSheets = [styleSheetFor(this.constructor)];
+  }
+
+  set hass(hass) {
+    const previous = this._hass;
+    this._hass = hass;
+    if (this.config && this.shouldUpdate(previous, hass)) {
+      this.requestUpdate();
+    }
+  }
+
+  get hass() {
+    return this._hass;
+  }
+
+  // Replace the shadow DOM with a fresh copy of the card's template
+  stamp() {
+    this.shadowRoot.replaceChildren(templateFor(this.constructor).content.cloneNode(true));
+  }
+
+  $(id) {
+    return this.shadowRoot.getElementById(id);
+  }
+
+  // Whether a new hass object affects this card, checked on every state change
+  shouldUpdate(previous, hass) {
+    return false;
+  }
+
+  requestUpdate() {
+    scheduleUpdate(this);
+  }
+
+  update() {}
+}
+
+// Water actions from all cards within this window are sent as one bulk call
+const WATER_BATCH_MS = 400;
+const waterBatches = new Map();
+
+function sendWaterBatch(key) {
+  const batch = waterBatches.get(key);
+  waterBatches.delete(key);
+
+  const plantIds = [...batch.plantIds];
+  const request = batch.wateredDate
+    ? batch.hass.callService('planty', 'water_plant_custom_date', {
+      plant_id: plantIds,
+      watered_date: batch.wateredDate
+    })
+    : batch.hass.callService('planty', 'water_plant', { plant_id: plantIds });
+
+  request.then(
+    () => batch.waiters.forEach(waiter => waiter.resolve()),
+    err => batch.waiters.forEach(waiter => waiter.reject(err))
+  );
+}
+
+// Queue a plant to be watered, resolving once the bulk call succeeded
+export function queueWatering(hass, plantId, wateredDate = null) {
+  const key = wateredDate || '';
+  let batch = waterBatches.get(key);
+  if (!batch) {
+    batch = { hass, wateredDate, plantIds: new Set(), waiters: [] };
+    waterBatches.set(key, batch);
+    setTimeout(() => sendWaterBatch(key), WATER_BATCH_MS);
+  }
+  batch.hass = hass;
+  batch.plantIds.add(plantId);
+  return new Promise((resolve, reject) => batch.waiters.push({ resolve, reject }));
+}
+
+// Show a toast through the Home Assistant frontend
+export function showError(element, message) {
+  element.dispatchEvent(new CustomEvent('hass-notification', {
+    detail: { message },
+    bubbles: true,
+    composed: true
+  }));
+}
+
+export function escapeHtml(value) {
+  return String(value).replace(/[&<>"']/g, char => `&#${char.charCodeAt(0)};`);
+}
+
+export function formatName(value) {
+  return value.split('_').map(word => word.charAt(0).toUpperCase() + word.slice(1)).join(' ');
+}
@@ -1,397 +1,475 @@
-class PlantyCard extends HTMLElement {
-  constructor() {
-    super();
-    this.attachShadow({ mode: 'open' });
+import { PlantyElement, formatName, queueWatering, showError } from './planty-base.js';
+
+// Humidity history requests made by cards in the same tick are sent as one
+// planty/history/humidity call, so a dashboard of many cards costs one round trip
+const plantyHistory = {
+  _pending: null,
+
+  request(hass, plantId) {
+    if (!this._pending) {
+      const pending = { plantIds: new Set(), promise: null };
+      pending.promise = Promise.resolve().then(() => {
+        this._pending = null;
+        return hass.callWS({
+          type: 'planty/history/humidity',
+          plant_ids: [...pending.plantIds]
+        });
+      });
+      this._pending = pending;
+    }
+    this._pending.plantIds.add(plantId);
+    return this._pending.promise.then(result => result.series[plantId] || []);
   }
+};
+
+const HISTORY_REFRESH_MS = 5 * 60 * 1000;
+
+class PlantyCard extends PlantyElement {
+  static styles = `
+    .plant-card {
+      background: var(--card-background-color);
+      border-radius: 12px;
+      padding: 16px;
+      box-shadow: var(--shadow-elevation-2dp);
+      cursor: pointer;
+      transition: all 0.3s ease;
+      position: relative;
+      overflow: hidden;
+    }
 
-  setConfig(config) {
-    if (!config.entity) {
-      throw new Error('You need to define an entity');
+    .plant-card:hover {
+      box-shadow: var(--shadow-elevation-4dp);
+      transform: translateY(-2px);
     }
-    this.config = config;
-    this.render();
-  }
 
-  set hass(hass) {
-    this._hass = hass;
-    if (this.config) {
-      this.updateCard();
+    .plant-header {
+      display: flex;
+      align-items: center;
+      justify-content: space-between;
+      margin-bottom: 12px;
     }
-  }
 
-  render() {
-    const style = `
-      <style>
-        .plant-card {
-          background: var(--card-background-color);
-          border-radius: 12px;
-          padding: 16px;
-          box-shadow: var(--shadow-elevation-2dp);
-          cursor: pointer;
-          transition: all 0.3s ease;
-          position: relative;
-          overflow: hidden;
-        }
-        
-        .plant-card:hover {
-          box-shadow: var(--shadow-elevation-4dp);
-          transform: translateY(-2px);
-        }
-        
-        .plant-header {
-          display: flex;
-          align-items: center;
-          justify-content: space-between;
-          margin-bottom: 12px;
-        }
-        
-        .plant-info {
-          display: flex;
-          align-items: center;
-          gap: 12px;
-        }
-        
-        .plant-icon {
-          width: 40px;
-          height: 40px;
-          border-radius: 50%;
-          background: linear-gradient(135deg, #81C784, #4CAF50);
-          display: flex;
-          align-items: center;
-          justify-content: center;
-          color: white;
-          font-size: 20px;
-        }
-        
-        .plant-details h3 {
-          margin: 0;
-          font-size: 16px;
-          font-weight: 500;
-          color: var(--primary-text-color);
-        }
-        
-        .plant-type {
-          font-size: 12px;
-          color: var(--secondary-text-color);
-          margin: 2px 0 0 0;
-        }
-        
-        .settings-button {
-          background: none;
-          border: none;
-          cursor: pointer;
-          padding: 4px;
-          border-radius: 50%;
-          color: var(--secondary-text-color);
-          transition: background-color 0.2s;
-        }
-        
-        .settings-button:hover {
-          background-color: var(--divider-color);
-        }
-        
-        .progress-container {
-          margin: 16px 0;
-        }
-        
-        .progress-bar {
-          width: 100%;
-          height: 8px;
-          background-color: var(--divider-color);
-          border-radius: 4px;
-          overflow: hidden;
-          position: relative;
-        }
-        
-        .progress-fill {
-          height: 100%;
-          transition: width 0.3s ease, background-color 0.3s ease;
-          border-radius: 4px;
-        }
-        
-        .progress-fill.green {
-          background: linear-gradient(90deg, #4CAF50, #81C784);
-        }
-        
-        .progress-fill.orange {
-          background: linear-gradient(90deg, #FF9800, #FFB74D);
-        }
-        
-        .progress-fill.red {
-          background: linear-gradient(90deg, #F44336, #EF5350);
-        }
-        
-        .card-bottom {
-          display: flex;
-          align-items: center;
-          justify-content: space-between;
-        }
-        
-        .status-info {
-          display: flex;
-          flex-direction: column;
-          gap: 2px;
-        }
-        
-        .status-text {
-          font-size: 14px;
-          font-weight: 500;
-        }
-        
-        .status-text.green {
-          color: #4CAF50;
-        }
-        
-        .status-text.orange {
-          color: #FF9800;
-        }
-        
-        .status-text.red {
-          color: #F44336;
-        }
-        
-        .status-detail {
-          font-size: 12px;
-          color: var(--secondary-text-color);
-        }
-        
-        .water-button {
-          background: #2196F3;
-          color: white;
-          border: none;
-          border-radius: 20px;
-          padding: 8px 16px;
-          cursor: pointer;
-          font-size: 12px;
-          font-weight: 500;
-          transition: background-color 0.2s;
-          display: flex;
-          align-items: center;
-          gap: 4px;
-        }
-        
-        .water-button:hover {
-          background: #1976D2;
-        }
-        
-        .water-button:disabled {
-          background: var(--disabled-color);
-          cursor: not-allowed;
-        }
-        
-        .modal {
-          position: fixed;
-          top: 0;
-          left: 0;
-          width: 100%;
-          height: 100%;
-          background: rgba(0, 0, 0, 0.5);
-          display: none;
-          align-items: center;
-          justify-content: center;
-          z-index: 1000;
-        }
-        
-        .modal-content {
-          background: var(--card-background-color);
-          border-radius: 8px;
-          padding: 24px;
-          max-width: 400px;
-          width: 90%;
-          max-height: 80vh;
-          overflow-y: auto;
-        }
-        
-        .modal-header {
-          display: flex;
-          justify-content: space-between;
-          align-items: center;
-          margin-bottom: 16px;
-        }
-        
-        .modal-title {
-          font-size: 18px;
-          font-weight: 500;
-          margin: 0;
-        }
-        
-        .close-button {
-          background: none;
-          border: none;
-          font-size: 24px;
-          cursor: pointer;
-          color: var(--secondary-text-color);
-        }
-        
-        .form-group {
-          margin-bottom: 16px;
-        }
-        
-        .form-label {
-          display: block;
-          margin-bottom: 4px;
-          font-size: 14px;
-          font-weight: 500;
-        }
-        
-        .form-input, .form-select {
-          width: 100%;
-          padding: 8px 12px;
-          border: 1px solid var(--divider-color);
-          border-radius: 4px;
-          background: var(--card-background-color);
-          color: var(--primary-text-color);
-          box-sizing: border-box;
-        }
-        
-        .button-group {
-          display: flex;
-          gap: 8px;
-          justify-content: flex-end;
-        }
-        
-        .btn {
-          padding: 8px 16px;
-          border: none;
-          border-radius: 4px;
-          cursor: pointer;
-          font-size: 14px;
-          font-weight: 500;
-        }
-        
-        .btn-primary {
-          background: #2196F3;
-          color: white;
-        }
-        
-        .btn-secondary {
-          background: var(--divider-color);
-          color: var(--primary-text-color);
-        }
-      </style>
-    `;
-
-    this.shadowRoot.innerHTML = style + `
-      <div class="plant-card" onclick="this.openSettings()">
-        <div class="plant-header">
-          <div class="plant-info">
-            <div class="plant-icon">
-              <ha-icon icon="mdi:leaf"></ha-icon>
-            </div>
-            <div class="plant-details">
-              <h3 class="plant-name">${this.config.name || 'Unknown Plant'}</h3>
-              <div class="plant-type">${this.getPlantTypeName()}</div>
-            </div>
+    .plant-info {
+      display: flex;
+      align-items: center;
+      gap: 12px;
+    }
+
+    .plant-icon {
+      width: 40px;
+      height: 40px;
+      border-radius: 50%;
+      background: linear-gradient(135deg, #81C784, #4CAF50);
+      display: flex;
+      align-items: center;
+      justify-content: center;
+      color: white;
+      font-size: 20px;
+      overflow: hidden;
+    }
+
+    .plant-photo {
+      width: 100%;
+      height: 100%;
+      object-fit: cover;
+    }
+
+    .plant-details h3 {
+      margin: 0;
+      font-size: 16px;
+      font-weight: 500;
+      color: var(--primary-text-color);
+    }
+
+    .plant-type {
+      font-size: 12px;
+      color: var(--secondary-text-color);
+      margin: 2px 0 0 0;
+    }
+
+    .settings-button {
+      background: none;
+      border: none;
+      cursor: pointer;
+      padding: 4px;
+      border-radius: 50%;
+      color: var(--secondary-text-color);
+      transition: background-color 0.2s;
+    }
+
+    .settings-button:hover {
+      background-color: var(--divider-color);
+    }
+
+    .progress-container {
+      margin: 16px 0;
+    }
+
+    .sparkline {
+      display: none;
+      width: 100%;
+      height: 32px;
+      margin-top: -8px;
+    }
+
+    .sparkline polyline {
+      fill: none;
+      stroke: var(--primary-color);
+      stroke-width: 1.5;
+      vector-effect: non-scaling-stroke;
+    }
+
+    .progress-bar {
+      width: 100%;
+      height: 8px;
+      background-color: var(--divider-color);
+      border-radius: 4px;
+      overflow: hidden;
+      position: relative;
+    }
+
+    .progress-fill {
+      height: 100%;
+      transition: width 0.3s ease, background-color 0.3s ease;
+      border-radius: 4px;
+    }
+
+    .progress-fill.green {
+      background: linear-gradient(90deg, #4CAF50, #81C784);
+    }
+
+    .progress-fill.orange {
+      background: linear-gradient(90deg, #FF9800, #FFB74D);
+    }
+
+    .progress-fill.red {
+      background: linear-gradient(90deg, #F44336, #EF5350);
+    }
+
+    .card-bottom {
+      display: flex;
+      align-items: center;
+      justify-content: space-between;
+    }
+
+    .status-info {
+      display: flex;
+      flex-direction: column;
+      gap: 2px;
+    }
+
+    .status-text {
+      font-size: 14px;
+      font-weight: 500;
+    }
+
+    .status-text.green {
+      color: #4CAF50;
+    }
+
+    .status-text.orange {
+      color: #FF9800;
+    }
+
+    .status-text.red {
+      color: #F44336;
+    }
+
+    .status-detail {
+      font-size: 12px;
+      color: var(--secondary-text-color);
+    }
+
+    .water-button {
+      background: #2196F3;
+      color: white;
+      border: none;
+      border-radius: 20px;
+      padding: 8px 16px;
+      cursor: pointer;
+      font-size: 12px;
+      font-weight: 500;
+      transition: background-color 0.2s;
+      display: flex;
+      align-items: center;
+      gap: 4px;
+    }
+
+    .water-button:hover {
+      background: #1976D2;
+    }
+
+    .water-button:disabled {
+      background: var(--disabled-color);
+      cursor: not-allowed;
+    }
+
+    .modal {
+      position: fixed;
+      top: 0;
+      left: 0;
+      width: 100%;
+      height: 100%;
+      background: rgba(0, 0, 0, 0.5);
+      display: none;
+      align-items: center;
+      justify-content: center;
+      z-index: 1000;
+    }
+
+    .modal-content {
+      background: var(--card-background-color);
+      border-radius: 8px;
+      padding: 24px;
+      max-width: 400px;
+      width: 90%;
+      max-height: 80vh;
+      overflow-y: auto;
+    }
+
+    .modal-header {
+      display: flex;
+      justify-content: space-between;
+      align-items: center;
+      margin-bottom: 16px;
+    }
+
+    .modal-title {
+      font-size: 18px;
+      font-weight: 500;
+      margin: 0;
+    }
+
+    .close-button {
+      background: none;
+      border: none;
+      font-size: 24px;
+      cursor: pointer;
+      color: var(--secondary-text-color);
+    }
+
+    .form-group {
+      margin-bottom: 16px;
+    }
+
+    .form-label {
+      display: block;
+      margin-bottom: 4px;
+      font-size: 14px;
+      font-weight: 500;
+    }
+
+    .form-input, .form-select {
+      width: 100%;
+      padding: 8px 12px;
+      border: 1px solid var(--divider-color);
+      border-radius: 4px;
+      background: var(--card-background-color);
+      color: var(--primary-text-color);
+      box-sizing: border-box;
+    }
+
+    .button-group {
+      display: flex;
+      gap: 8px;
+      justify-content: flex-end;
+    }
+
+    .btn {
+      padding: 8px 16px;
+      border: none;
+      border-radius: 4px;
+      cursor: pointer;
+      font-size: 14px;
+      font-weight: 500;
+    }
+
+    .btn-primary {
+      background: #2196F3;
+      color: white;
+    }
+
+    .btn-secondary {
+      background: var(--divider-color);
+      color: var(--primary-text-color);
+    }
+  `;
+
+  static template = `
+    <div class="plant-card" id="plant-card">
+      <div class="plant-header">
+        <div class="plant-info">
+          <div class="plant-icon">
+            <ha-icon icon="mdi:leaf" id="plant-icon"></ha-icon>
+            <img class="plant-photo" id="plant-photo" alt="" hidden />
           </div>
-          <button class="settings-button" onclick="event.stopPropagation(); this.openSettings()">
-            <ha-icon icon="mdi:cog"></ha-icon>
-          </button>
-        </div>
-        
-        <div class="progress-container">
-          <div class="progress-bar">
-            <div class="progress-fill" id="progress-fill"></div>
+          <div class="plant-details">
+            <h3 class="plant-name" id="plant-name"></h3>
+            <div class="plant-type" id="plant-type"></div>
           </div>
         </div>
-        
-        <div class="card-bottom">
-          <div class="status-info">
-            <div class="status-text" id="status-text">Optimal</div>
-            <div class="status-detail" id="status-detail">58.0%</div>
-          </div>
-          <button class="water-button" onclick="event.stopPropagation(); this.handleWaterClick()" id="water-button">
-            <ha-icon icon="mdi:water"></ha-icon>
-            Water
-          </button>
+        <button class="settings-button" id="settings-button">
+          <ha-icon icon="mdi:cog"></ha-icon>
+        </button>
+      </div>
+
+      <div class="progress-container">
+        <div class="progress-bar">
+          <div class="progress-fill" id="progress-fill"></div>
         </div>
       </div>
-      
-      <!-- Settings Modal -->
-      <div class="modal" id="settings-modal">
-        <div class="modal-content">
-          <div class="modal-header">
-            <h3 class="modal-title">Plant Settings</h3>
-            <button class="close-button" onclick="this.closeSettings()">&times;</button>
-          </div>
-          
-          <div class="form-group">
-            <label class="form-label">Plant Name</label>
-            <input type="text" class="form-input" id="plant-name-input" />
-          </div>
-          
-          <div class="form-group">
-            <label class="form-label">Plant Type</label>
-            <select class="form-select" id="plant-type-select">
-              <option value="">Select plant type...</option>
-            </select>
-          </div>
-          
-          <div class="form-group">
-            <label class="form-label">Watering Mode</label>
-            <select class="form-select" id="watering-mode-select">
-              <option value="manual">Manual (Timer-based)</option>
-              <option value="sensor">Sensor (Humidity-based)</option>
-            </select>
-          </div>
-          
-          <div class="form-group" id="sensor-group" style="display: none;">
-            <label class="form-label">Humidity Sensor</label>
-            <select class="form-select" id="humidity-sensor-select">
-              <option value="">Select humidity sensor...</option>
-            </select>
-          </div>
-          
-          <div class="form-group" id="interval-group">
-            <label class="form-label">Watering Interval (days)</label>
-            <input type="number" class="form-input" id="watering-interval-input" min="1" max="30" />
-          </div>
-          
-          <div class="button-group">
-            <button class="btn btn-secondary" onclick="this.closeSettings()">Cancel</button>
-            <button class="btn btn-primary" onclick="this.saveSettings()">Save</button>
-          </div>
+
+      <svg class="sparkline" id="sparkline" viewBox="0 0 100 32" preserveAspectRatio="none">
+        <polyline id="sparkline-line" points=""></polyline>
+      </svg>
+
+      <div class="card-bottom">
+        <div class="status-info">
+          <div class="status-text" id="status-text">Optimal</div>
+          <div class="status-detail" id="status-detail">58.0%</div>
         </div>
+        <button class="water-button" id="water-button">
+          <ha-icon icon="mdi:water"></ha-icon>
+          Water
+        </button>
       </div>
-      
-      <!-- Water Date Modal -->
-      <div class="modal" id="water-modal">
-        <div class="modal-content">
-          <div class="modal-header">
-            <h3 class="modal-title">Water Plant</h3>
-            <button class="close-button" onclick="this.closeWaterModal()">&times;</button>
-          </div>
-          
-          <div class="form-group">
-            <label class="form-label">Watering Date</label>
-            <input type="date" class="form-input" id="water-date-input" />
-          </div>
-          
-          <div class="button-group">
-            <button class="btn btn-secondary" onclick="this.closeWaterModal()">Cancel</button>
-            <button class="btn btn-primary" onclick="this.waterPlant()">Water Plant</button>
-          </div>
+    </div>
+
+    <!-- Settings Modal -->
+    <div class="modal" id="settings-modal">
+      <div class="modal-content">
+        <div class="modal-header">
+          <h3 class="modal-title">Plant Settings</h3>
+          <button class="close-button" id="settings-close-button">&times;</button>
+        </div>
+
+        <div class="form-group">
+          <label class="form-label">Plant Name</label>
+          <input type="text" class="form-input" id="plant-name-input" />
+        </div>
+
+        <div class="form-group">
+          <label class="form-label">Photo</label>
+          <input type="file" class="form-input" id="plant-image-input" accept="image/*" />
+        </div>
+
+        <div class="form-group">
+          <label class="form-label">Plant Type</label>
+          <select class="form-select" id="plant-type-select">
+            <option value="">Select plant type...</option>
+          </select>
+        </div>
+
+        <div class="form-group">
+          <label class="form-label">Watering Mode</label>
+          <select class="form-select" id="watering-mode-select">
+            <option value="manual">Manual (Timer-based)</option>
+            <option value="sensor">Sensor (Humidity-based)</option>
+          </select>
+        </div>
+
+        <div class="form-group" id="sensor-group" style="display: none;">
+          <label class="form-label">Humidity Sensor</label>
+          <select class="form-select" id="humidity-sensor-select">
+            <option value="">Select humidity sensor...</option>
+          </select>
+        </div>
+
+        <div class="form-group" id="interval-group">
+          <label class="form-label">Watering Interval (days)</label>
+          <input type="number" class="form-input" id="watering-interval-input" min="1" max="30" />
+        </div>
+
+        <div class="button-group">
+          <button class="btn btn-secondary" id="settings-cancel-button">Cancel</button>
+          <button class="btn btn-primary" id="settings-save-button">Save</button>
         </div>
       </div>
-    `;
-
-    // Bind methods to this context
-    this.openSettings = this.openSettings.bind(this);
-    this.closeSettings = this.closeSettings.bind(this);
-    this.saveSettings = this.saveSettings.bind(this);
-    this.handleWaterClick = this.handleWaterClick.bind(this);
-    this.closeWaterModal = this.closeWaterModal.bind(this);
-    this.waterPlant = this.waterPlant.bind(this);
+    </div>
+
+    <!-- Water Date Modal -->
+    <div class="modal" id="water-modal">
+      <div class="modal-content">
+        <div class="modal-header">
+          <h3 class="modal-title">Water Plant</h3>
+          <button class="close-button" id="water-close-button">&times;</button>
+        </div>
+
+        <div class="form-group">
+          <label class="form-label">Watering Date</label>
+          <input type="date" class="form-input" id="water-date-input" />
+        </div>
+
+        <div class="button-group">
+          <button class="btn btn-secondary" id="water-cancel-button">Cancel</button>
+          <button class="btn btn-primary" id="water-confirm-button">Water Plant</button>
+        </div>
+      </div>
+    </div>
+  `;
+
+  setConfig(config) {
+    if (!config.entity) {
+      throw new Error('You need to define an entity');
+    }
+    this.config = config;
+    this.render();
+  }
+
+  shouldUpdate(previous, hass) {
+    return !previous || previous.states[this.config.entity] !== hass.states[this.config.entity];
   }
 
-  updateCard() {
+  render() {
+    this.stamp();
+    this.releasePhoto();
+
+    this.$('plant-name').textContent = this.config.name || 'Unknown Plant';
+    this.$('plant-type').textContent = this.getPlantTypeName();
+
+    const stopThen = handler => event => {
+      event.stopPropagation();
+      handler();
+    };
+    this.$('plant-card').addEventListener('click', () => this.openSettings());
+    this.$('settings-button').addEventListener('click', stopThen(() => this.openSettings()));
+    this.$('water-button').addEventListener('click', stopThen(() => this.handleWaterClick()));
+    this.$('settings-close-button').addEventListener('click', () => this.closeSettings());
+    this.$('settings-cancel-button').addEventListener('click', () => this.closeSettings());
+    this.$('settings-save-button').addEventListener('click', () => this.saveSettings());
+    this.$('water-close-button').addEventListener('click', () => this.closeWaterModal());
+    this.$('water-cancel-button').addEventListener('click', () => this.closeWaterModal());
+    this.$('water-confirm-button').addEventListener('click', () => this.waterPlant());
+    this.$('watering-mode-select').addEventListener('change', event => this.toggleWateringMode(event.target.value));
+
+    if (this._hass) {
+      this.update();
+    }
+  }
+
+  disconnectedCallback() {
+    this.releasePhoto();
+  }
+
+  update() {
     if (!this._hass || !this.config.entity) return;
 
+    if (this.config.image && this._photoSource !== this.config.image) {
+      this.loadPhoto();
+    }
+
     const entity = this._hass.states[this.config.entity];
     if (!entity) return;
 
+    // A pending watering is shown until the entity reports a new state
+    if (this._wateredState && this._wateredState !== entity) {
+      this._wateredState = null;
+    }
+    const watered = this._wateredState === entity;
+
     const attributes = entity.attributes || {};
-    const progressPercentage = attributes.progress_percentage || 0;
-    const colorState = attributes.color_state || 'green';
+    const progressPercentage = watered ? 0 : attributes.progress_percentage || 0;
+    const colorState = watered ? 'green' : attributes.color_state || 'green';
     const wateringMode = attributes.watering_mode || 'manual';
 
     // Update progress bar
@@ -406,7 +484,9 @@ class PlantyCard extends HTMLElement {
     const statusDetail = this.shadowRoot.getElementById('status-detail');
     
     if (statusText && statusDetail) {
-      const { text, detail } = this.getStatusInfo(entity, attributes, wateringMode);
+      const { text, detail } = watered
+        ? { text: this.getStatusText(colorState), detail: 'Watered' }
+        : this.getStatusInfo(entity, attributes, wateringMode);
       statusText.textContent = text;
       statusText.className = `status-text ${colorState}`;
       statusDetail.textContent = detail;
@@ -419,6 +499,68 @@ class PlantyCard extends HTMLElement {
     } else if (waterButton) {
       waterButton.style.display = 'none';
     }
+
+    if (wateringMode === 'sensor') {
+      this.updateSparkline();
+    }
+  }
+
+  // The image view requires auth, which <img> cannot send, so the photo is
+  // fetched with the session token and shown from a blob URL
+  async loadPhoto(url = this.config.image) {
+    // Tried once per source, so a missing photo is not fetched on every update
+    this._photoSource = url;
+    try {
+      const response = await this._hass.fetchWithAuth(url);
+      if (!response.ok) throw new Error(response.statusText);
+      const blob = await response.blob();
+      if (this._photoUrl) URL.revokeObjectURL(this._photoUrl);
+      this._photoUrl = URL.createObjectURL(blob);
+    } catch (err) {
+      console.warn('Planty: could not load plant photo', err);
+      return;
+    }
+
+    const photo = this.$('plant-photo');
+    if (photo) {
+      photo.src = this._photoUrl;
+      photo.hidden = false;
+      this.$('plant-icon').hidden = true;
+    }
+  }
+
+  releasePhoto() {
+    if (this._photoUrl) {
+      URL.revokeObjectURL(this._photoUrl);
+      this._photoUrl = null;
+    }
+    this._photoSource = null;
+  }
+
+  updateSparkline() {
+    const now = Date.now();
+    if (!this.config.plant_id || this._historyFetchedAt > now - HISTORY_REFRESH_MS) return;
+    this._historyFetchedAt = now;
+
+    plantyHistory.request(this._hass, this.config.plant_id).then(points => {
+      const sparkline = this.shadowRoot.getElementById('sparkline');
+      const line = this.shadowRoot.getElementById('sparkline-line');
+      if (!sparkline || !line || points.length < 2) return;
+
+      const times = points.map(point => point[0]);
+      const values = points.map(point => point[1]);
+      const minTime = times[0];
+      const timeSpan = times[times.length - 1] - minTime || 1;
+      const minValue = Math.min(...values);
+      const valueSpan = Math.max(...values) - minValue || 1;
+
+      line.setAttribute('points', points.map(([time, value]) =>
+        `${((time - minTime) / timeSpan * 100).toFixed(1)},${(30 - (value - minValue) / valueSpan * 28).toFixed(1)}`
+      ).join(' '));
+      sparkline.style.display = 'block';
+    }).catch(err => {
+      console.warn('Planty: could not load humidity history', err);
+    });
   }
 
   getStatusInfo(entity, attributes, wateringMode) {
@@ -458,9 +600,7 @@ class PlantyCard extends HTMLElement {
     
     // This would ideally fetch from the plant database
     // For now, just format the plant type nicely
-    return plantType.split('_').map(word => 
-      word.charAt(0).toUpperCase() + word.slice(1)
-    ).join(' ');
+    return formatName(plantType);
   }
 
   openSettings() {
@@ -513,9 +653,36 @@ class PlantyCard extends HTMLElement {
     };
 
     this._hass.callService('planty', 'update_plant_settings', data);
+
+    const imageInput = this.shadowRoot.getElementById('plant-image-input');
+    if (imageInput?.files?.length) {
+      this.uploadImage(imageInput.files[0]);
+      imageInput.value = '';
+    }
+
     this.closeSettings();
   }
 
+  async uploadImage(file) {
+    const body = new FormData();
+    body.append('file', file);
+
+    try {
+      const response = await this._hass.fetchWithAuth(
+        `/api/planty/images/${encodeURIComponent(this.config.plant_id)}`,
+        { method: 'POST', body }
+      );
+      if (!response.ok) {
+        const { message } = await response.json();
+        throw new Error(message || response.statusText);
+      }
+      const { url } = await response.json();
+      await this.loadPhoto(url);
+    } catch (err) {
+      console.error('Planty: could not upload photo', err);
+    }
+  }
+
   handleWaterClick() {
     const modal = this.shadowRoot.getElementById('water-modal');
     if (modal) {
@@ -539,14 +706,21 @@ class PlantyCard extends HTMLElement {
     const dateInput = this.shadowRoot.getElementById('water-date-input');
     if (!this._hass || !dateInput) return;
 
-    const wateredDate = new Date(dateInput.value).toISOString();
-    
-    this._hass.callService('planty', 'water_plant_custom_date', {
-      plant_id: this.config.plant_id,
-      watered_date: wateredDate
-    });
+    // Watering today records the current time
+    const today = new Date().toISOString().split('T')[0];
+    const wateredDate = dateInput.value && dateInput.value !== today
+      ? new Date(dateInput.value).toISOString()
+      : null;
 
+    this._wateredState = this._hass.states[this.config.entity];
+    this.update();
     this.closeWaterModal();
+
+    queueWatering(this._hass, this.config.plant_id, wateredDate).catch(err => {
+      this._wateredState = null;
+      this.update();
+      showError(this, `Could not water ${this.config.name || this.config.plant_id}: ${err.message || err}`);
+    });
   }
 
   toggleWateringMode(mode) {
@@ -0,0 +1,371 @@
+import { PlantyElement, escapeHtml, formatName, queueWatering, showError } from './planty-base.js';
+
+// Order used when sorting by status: the plants that need attention first
+const STATUS_ORDER = ['overdue', 'needs_water', 'unknown', 'healthy'];
+
+const STATUS_LABELS = {
+  healthy: 'Healthy',
+  needs_water: 'Needs Water',
+  overdue: 'Overdue',
+  unknown: 'Unknown'
+};
+
+const TILE_MIN_WIDTH = 200;
+const ROW_HEIGHT = 112;
+const OVERSCAN_ROWS = 2;
+
+class PlantyGridCard extends PlantyElement {
+  static styles = `
+    .grid-card {
+      background: var(--card-background-color);
+      border-radius: 12px;
+      padding: 16px;
+      box-shadow: var(--shadow-elevation-2dp);
+    }
+
+    .toolbar {
+      display: flex;
+      flex-wrap: wrap;
+      gap: 8px;
+      margin-bottom: 12px;
+    }
+
+    .toolbar select {
+      flex: 1 1 120px;
+      padding: 6px 8px;
+      border: 1px solid var(--divider-color);
+      border-radius: 6px;
+      background: var(--card-background-color);
+      color: var(--primary-text-color);
+      font-size: 13px;
+    }
+
+    .summary {
+      font-size: 12px;
+      color: var(--secondary-text-color);
+      margin-bottom: 8px;
+    }
+
+    .viewport {
+      position: relative;
+      overflow-y: auto;
+      contain: strict;
+    }
+
+    .spacer {
+      position: relative;
+      width: 100%;
+    }
+
+    .tile {
+      position: absolute;
+      box-sizing: border-box;
+      height: ${ROW_HEIGHT - 8}px;
+      padding: 12px;
+      border-radius: 10px;
+      background: var(--secondary-background-color);
+      display: flex;
+      flex-direction: column;
+      justify-content: space-between;
+      overflow: hidden;
+    }
+
+    .tile-name {
+      font-size: 14px;
+      font-weight: 500;
+      color: var(--primary-text-color);
+      white-space: nowrap;
+      overflow: hidden;
+      text-overflow: ellipsis;
+    }
+
+    .tile-meta {
+      font-size: 12px;
+      color: var(--secondary-text-color);
+      white-space: nowrap;
+      overflow: hidden;
+      text-overflow: ellipsis;
+    }
+
+    .tile-bottom {
+      display: flex;
+      align-items: center;
+      justify-content: space-between;
+    }
+
+    .status {
+      font-size: 12px;
+      font-weight: 500;
+      padding: 2px 8px;
+      border-radius: 10px;
+      color: white;
+      background: #9E9E9E;
+    }
+
+    .status.healthy { background: #4CAF50; }
+    .status.needs_water { background: #FF9800; }
+    .status.overdue { background: #F44336; }
+
+    .water-button {
+      background: #2196F3;
+      color: white;
+      border: none;
+      border-radius: 50%;
+      width: 28px;
+      height: 28px;
+      cursor: pointer;
+      display: flex;
+      align-items: center;
+      justify-content: center;
+      --mdc-icon-size: 16px;
+    }
+  `;
+
+  static template = `
+    <div class="grid-card">
+      <div class="toolbar">
+        <select id="sort">
+          <option value="status">Sort by status</option>
+          <option value="name">Sort by name</option>
+          <option value="type">Sort by type</option>
+          <option value="area">Sort by area</option>
+        </select>
+        <select id="filter-status"></select>
+        <select id="filter-type"></select>
+        <select id="filter-area"></select>
+      </div>
+      <div class="summary" id="summary"></div>
+      <div class="viewport" id="viewport">
+        <div class="spacer" id="spacer"></div>
+      </div>
+    </div>
+  `;
+
+  constructor() {
+    super();
+    this._plants = [];
+    this._visible = [];
+    this._columns = 1;
+    this._sort = 'status';
+    this._filters = { status: '', type: '', area: '' };
+    this._watered = new Map();
+    this._onScroll = this._onScroll.bind(this);
+  }
+
+  setConfig(config) {
+    if (!Array.isArray(config.plants)) {
+      throw new Error('You need to define plants');
+    }
+    this.config = config;
+    this._sort = config.sort || 'status';
+    this.render();
+  }
+
+  shouldUpdate(previous, hass) {
+    // Only rebuild when one of our plants or the registries changed
+    return !previous
+      || previous.entities !== hass.entities
+      || previous.devices !== hass.devices
+      || previous.areas !== hass.areas
+      || this.config.plants.some(plant => previous.states[plant.entity] !== hass.states[plant.entity]);
+  }
+
+  connectedCallback() {
+    if (!this._resizeObserver) {
+      this._resizeObserver = new ResizeObserver(() => this.layout());
+    }
+    const viewport = this.$('viewport');
+    if (viewport) this._resizeObserver.observe(viewport);
+  }
+
+  disconnectedCallback() {
+    if (this._resizeObserver) this._resizeObserver.disconnect();
+  }
+
+  render() {
+    this.stamp();
+    this.$('viewport').style.height = `${this.config.height || 600}px`;
+
+    const sort = this.$('sort');
+    sort.value = this._sort;
+    sort.addEventListener('change', () => {
+      this._sort = sort.value;
+      this.applyView();
+    });
+
+    for (const key of ['status', 'type', 'area']) {
+      const select = this.$(`filter-${key}`);
+      select.addEventListener('change', () => {
+        this._filters[key] = select.value;
+        this.applyView();
+      });
+    }
+
+    const viewport = this.$('viewport');
+    viewport.addEventListener('scroll', this._onScroll, { passive: true });
+    viewport.addEventListener('click', event => {
+      const button = event.target.closest('.water-button');
+      if (button && this._hass) {
+        this.waterPlant(button.dataset.plantId);
+      }
+    });
+    if (this._resizeObserver) this._resizeObserver.observe(viewport);
+
+    if (this._hass) {
+      this.update();
+    }
+  }
+
+  update() {
+    const hass = this._hass;
+    this._plants = this.config.plants.map(plant => {
+      const state = hass.states[plant.entity];
+      // A pending watering is shown until the entity reports a new state
+      if (this._watered.has(plant.plant_id) && this._watered.get(plant.plant_id) !== state) {
+        this._watered.delete(plant.plant_id);
+      }
+      const entityEntry = hass.entities && hass.entities[plant.entity];
+      const device = entityEntry && hass.devices && hass.devices[entityEntry.device_id];
+      const areaId = (entityEntry && entityEntry.area_id) || (device && device.area_id) || '';
+      const area = areaId && hass.areas && hass.areas[areaId];
+      return {
+        plantId: plant.plant_id,
+        name: plant.name || plant.plant_id,
+        type: plant.plant_type || 'custom',
+        status: this._watered.has(plant.plant_id) ? 'healthy' : state ? state.state : 'unknown',
+        area: area ? area.name : ''
+      };
+    });
+
+    this.updateFilterOptions();
+    this.applyView();
+  }
+
+  waterPlant(plantId) {
+    const plant = this.config.plants.find(item => item.plant_id === plantId);
+    if (!plant) return;
+
+    this._watered.set(plantId, this._hass.states[plant.entity]);
+    this.update();
+
+    queueWatering(this._hass, plantId).catch(err => {
+      this._watered.delete(plantId);
+      this.update();
+      showError(this, `Could not water ${plant.name || plantId}: ${err.message || err}`);
+    });
+  }
+
+  updateFilterOptions() {
+    const options = {
+      status: STATUS_ORDER.filter(status => this._plants.some(plant => plant.status === status)),
+      type: [...new Set(this._plants.map(plant => plant.type))].sort(),
+      area: [...new Set(this._plants.map(plant => plant.area).filter(Boolean))].sort()
+    };
+    const labels = { status: 'All statuses', type: 'All types', area: 'All areas' };
+
+    for (const key of Object.keys(options)) {
+      const select = this.$(`filter-${key}`);
+      const signature = options[key].join('|');
+      if (select.dataset.signature === signature) continue;
+      select.dataset.signature = signature;
+
+      select.innerHTML = `<option value="">${labels[key]}</option>` + options[key].map(value =>
+        `<option value="${escapeHtml(value)}">${escapeHtml(key === 'status' ? STATUS_LABELS[value] || value : formatName(value))}</option>`
+      ).join('');
+      if (!options[key].includes(this._filters[key])) this._filters[key] = '';
+      select.value = this._filters[key];
+    }
+  }
+
+  applyView() {
+    const { status, type, area } = this._filters;
+    const visible = this._plants.filter(plant =>
+      (!status || plant.status === status)
+      && (!type || plant.type === type)
+      && (!area || plant.area === area)
+    );
+
+    const compareNames = (a, b) => a.name.localeCompare(b.name);
+    const comparators = {
+      name: compareNames,
+      status: (a, b) => STATUS_ORDER.indexOf(a.status) - STATUS_ORDER.indexOf(b.status) || compareNames(a, b),
+      type: (a, b) => a.type.localeCompare(b.type) || compareNames(a, b),
+      area: (a, b) => (a.area || '￿').localeCompare(b.area || '￿') || compareNames(a, b)
+    };
+    visible.sort(comparators[this._sort] || compareNames);
+
+    this._visible = visible;
+    this.$('summary').textContent =
+      `${visible.length} of ${this._plants.length} plants`;
+    this.layout();
+  }
+
+  layout() {
+    const viewport = this.$('viewport');
+    if (!viewport) return;
+    this._columns = Math.max(1, Math.floor(viewport.clientWidth / TILE_MIN_WIDTH));
+    const rows = Math.ceil(this._visible.length / this._columns);
+    this.$('spacer').style.height = `${rows * ROW_HEIGHT}px`;
+    this._renderedRange = null;
+    this.renderWindow();
+  }
+
+  _onScroll() {
+    if (this._scrollFrame) return;
+    this._scrollFrame = requestAnimationFrame(() => {
+      this._scrollFrame = null;
+      this.renderWindow();
+    });
+  }
+
+  renderWindow() {
+    const viewport = this.$('viewport');
+    const spacer = this.$('spacer');
+    if (!viewport || !spacer) return;
+
+    // Only the rows in view, plus a small margin, are in the DOM
+    const firstRow = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN_ROWS);
+    const lastRow = Math.ceil((viewport.scrollTop + viewport.clientHeight) / ROW_HEIGHT) + OVERSCAN_ROWS;
+    const start = firstRow * this._columns;
+    const end = Math.min(this._visible.length, lastRow * this._columns);
+    const range = `${start}:${end}`;
+    if (this._renderedRange === range) return;
+    this._renderedRange = range;
+
+    const width = 100 / this._columns;
+    spacer.innerHTML = this._visible.slice(start, end).map((plant, offset) => {
+      const index = start + offset;
+      const row = Math.floor(index / this._columns);
+      const column = index % this._columns;
+      const meta = [formatName(plant.type), plant.area].filter(Boolean).join(' · ');
+      return `
+        <div class="tile" style="top: ${row * ROW_HEIGHT}px; left: calc(${column * width}% + 4px); width: calc(${width}% - 8px)">
+          <div>
+            <div class="tile-name">${escapeHtml(plant.name)}</div>
+            <div class="tile-meta">${escapeHtml(meta)}</div>
+          </div>
+          <div class="tile-bottom">
+            <span class="status ${plant.status}">${STATUS_LABELS[plant.status] || plant.status}</span>
+            <button class="water-button" data-plant-id="${escapeHtml(plant.plantId)}" title="Water">
+              <ha-icon icon="mdi:watering-can"></ha-icon>
+            </button>
+          </div>
+        </div>
+      `;
+    }).join('');
+  }
+
+  getCardSize() {
+    return Math.ceil((this.config?.height || 600) / 50) + 2;
+  }
+
+  static getStubConfig() {
+    return {
+      plants: []
+    };
+  }
+}
+
+customElements.define('planty-grid-card', PlantyGridCard);
+
+console.info('Planty Grid Card loaded');
@@ -1,158 +1,138 @@
-class PlantyHeaderCard extends HTMLElement {
-  constructor() {
-    super();
-    this.attachShadow({ mode: 'open' });
-  }
+import { PlantyElement } from './planty-base.js';
 
-  setConfig(config) {
-    this.config = config;
-    this.render();
-  }
+class PlantyHeaderCard extends PlantyElement {
+  static styles = `
+    .header-card {
+      background: linear-gradient(135deg, #4CAF50, #81C784);
+      color: white;
+      border-radius: 12px;
+      padding: 24px;
+      margin-bottom: 16px;
+      text-align: center;
+      box-shadow: var(--shadow-elevation-2dp);
+    }
 
-  set hass(hass) {
-    this._hass = hass;
-  }
+    .header-icon {
+      font-size: 48px;
+      margin-bottom: 12px;
+      display: block;
+    }
 
-  render() {
-    const style = `
-      <style>
-        .header-card {
-          background: linear-gradient(135deg, #4CAF50, #81C784);
-          color: white;
-          border-radius: 12px;
-          padding: 24px;
-          margin-bottom: 16px;
-          text-align: center;
-          box-shadow: var(--shadow-elevation-2dp);
-        }
-        
-        .header-icon {
-          font-size: 48px;
-          margin-bottom: 12px;
-          display: block;
-        }
-        
-        .header-title {
-          font-size: 28px;
-          font-weight: 600;
-          margin: 0 0 8px 0;
-          text-shadow: 0 1px 2px rgba(0,0,0,0.1);
-        }
-        
-        .header-subtitle {
-          font-size: 16px;
-          opacity: 0.9;
-          margin: 0;
-          font-weight: 400;
-        }
-        
-        .stats-container {
-          display: flex;
-          justify-content: center;
-          gap: 24px;
-          margin-top: 16px;
-        }
-        
-        .stat-item {
-          text-align: center;
-        }
-        
-        .stat-number {
-          font-size: 24px;
-          font-weight: 600;
-          display: block;
-        }
-        
-        .stat-label {
-          font-size: 12px;
-          opacity: 0.8;
-          text-transform: uppercase;
-          letter-spacing: 0.5px;
-        }
-        
-        @media (max-width: 600px) {
-          .header-card {
-            padding: 20px;
-          }
-          
-          .header-title {
-            font-size: 24px;
-          }
-          
-          .stats-container {
-            gap: 16px;
-          }
-          
-          .stat-number {
-            font-size: 20px;
-          }
-        }
-      </style>
-    `;
-
-    this.shadowRoot.innerHTML = style + `
-      <div class="header-card">
-        <ha-icon icon="mdi:leaf" class="header-icon"></ha-icon>
-        <h1 class="header-title">${this.config.title || 'My Plants'}</h1>
-        <p class="header-subtitle">${this.config.subtitle || 'Plant care made simple'}</p>
-        <div class="stats-container" id="stats-container">
-          <!-- Stats will be populated by updateStats() -->
-        </div>
-      </div>
-    `;
+    .header-title {
+      font-size: 28px;
+      font-weight: 600;
+      margin: 0 0 8px 0;
+      text-shadow: 0 1px 2px rgba(0,0,0,0.1);
+    }
 
-    if (this._hass) {
-      this.updateStats();
+    .header-subtitle {
+      font-size: 16px;
+      opacity: 0.9;
+      margin: 0;
+      font-weight: 400;
     }
-  }
 
-  updateStats() {
-    if (!this._hass) return;
+    .stats-container {
+      display: flex;
+      justify-content: center;
+      gap: 24px;
+      margin-top: 16px;
+    }
+
+    .stat-item {
+      text-align: center;
+    }
+
+    .stat-number {
+      font-size: 24px;
+      font-weight: 600;
+      display: block;
+    }
+
+    .stat-label {
+      font-size: 12px;
+      opacity: 0.8;
+      text-transform: uppercase;
+      letter-spacing: 0.5px;
+    }
+
+    @media (max-width: 600px) {
+      .header-card {
+        padding: 20px;
+      }
 
-    // Count plant statuses
-    let healthyCount = 0;
-    let needsWaterCount = 0;
-    let overdueCount = 0;
-
-    // Find all planty water status sensors
-    Object.keys(this._hass.states).forEach(entityId => {
-      if (entityId.startsWith('sensor.planty_') && entityId.endsWith('_water_status')) {
-        const entity = this._hass.states[entityId];
-        const colorState = entity.attributes?.color_state;
-        
-        switch (colorState) {
-          case 'green':
-            healthyCount++;
-            break;
-          case 'orange':
-            needsWaterCount++;
-            break;
-          case 'red':
-            overdueCount++;
-            break;
-        }
+      .header-title {
+        font-size: 24px;
       }
-    });
 
-    const statsContainer = this.shadowRoot.getElementById('stats-container');
-    if (statsContainer) {
-      statsContainer.innerHTML = `
+      .stats-container {
+        gap: 16px;
+      }
+
+      .stat-number {
+        font-size: 20px;
+      }
+    }
+  `;
+
+  static template = `
+    <div class="header-card">
+      <ha-icon icon="mdi:leaf" class="header-icon"></ha-icon>
+      <h1 class="header-title" id="title"></h1>
+      <p class="header-subtitle" id="subtitle"></p>
+      <div class="stats-container">
         <div class="stat-item">
-          <span class="stat-number">${healthyCount}</span>
+          <span class="stat-number" id="healthy-count">0</span>
           <span class="stat-label">Healthy</span>
         </div>
         <div class="stat-item">
-          <span class="stat-number">${needsWaterCount}</span>
-          <span class="stat-label">Watering Soon</span>
+          <span class="stat-number" id="needs-water-count">0</span>
+          <span class="stat-label">Needs Water</span>
         </div>
         <div class="stat-item">
-          <span class="stat-number">${overdueCount}</span>
-          <span class="stat-label">Need Water</span>
+          <span class="stat-number" id="overdue-count">0</span>
+          <span class="stat-label">Overdue</span>
         </div>
-      `;
+      </div>
+    </div>
+  `;
+
+  setConfig(config) {
+    this.config = config;
+    this.render();
+  }
+
+  shouldUpdate(previous, hass) {
+    // Only refresh when the rollup sensor itself changed
+    const entityId = this.getRollupEntityId();
+    return !previous || previous.states[entityId] !== hass.states[entityId];
+  }
+
+  getRollupEntityId() {
+    return (this.config && this.config.entity) || 'sensor.planty_all_plants';
+  }
+
+  render() {
+    this.stamp();
+    this.$('title').textContent = this.config.title || 'My Plants';
+    this.$('subtitle').textContent = this.config.subtitle || 'Plant care made simple';
+
+    if (this._hass) {
+      this.update();
     }
   }
 
+  update() {
+    if (!this._hass) return;
+
+    // Counts are maintained by the integration's rollup sensor
+    const rollup = this._hass.states[this.getRollupEntityId()];
+    const counts = (rollup && rollup.attributes) || {};
+    this.$('healthy-count').textContent = counts.healthy || 0;
+    this.$('needs-water-count').textContent = counts.needs_water || 0;
+    this.$('overdue-count').textContent = counts.overdue || 0;
+  }
+
   getCardSize() {
     return 2;
   }
@@ -160,7 +140,8 @@ class PlantyHeaderCard extends HTMLElement {
   static getStubConfig() {
     return {
       title: 'My Plants',
-      subtitle: 'Plant care made simple'
+      subtitle: 'Plant care made simple',
+      entity: 'sensor.planty_all_plants'
     };
   }
 }
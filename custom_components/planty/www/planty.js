@@ -6,6 +6,7 @@ console.info('Loading Planty cards...');
 // Register card types with Home Assistant
 const cardTypes = [
   'planty-card',
+  'planty-grid-card',
   'planty-header-card', 
   'planty-settings-card',
   'planty-welcome-card'